@@ -7,88 +7,164 @@ from flask import (
     url_for,
     flash,
     session,
-    send_file
+    send_file,
+    abort,
+    current_app,
+    g,
+    Response,
+    make_response
 )
 from flask_sqlalchemy import SQLAlchemy
 from flask_migrate import Migrate
+from sqlalchemy.orm import load_only
+from werkzeug.http import is_resource_modified
 from werkzeug.security import generate_password_hash, check_password_hash
-from pytesseract import image_to_string
-from pdf2image import convert_from_path
+from datetime import datetime, timedelta
+from functools import partial
+import click
+import hashlib
+import json
 import os
-import unicodedata
-import re
+import time
+import uuid
+
+from database import configure_sqlite, create_schema, database_url, engine_options
+from catalog import get_position_catalog, bump_catalog_version, invalidate_position_catalog
+from backfill import start_backfill, resume_backfills, backfill_status
+from jobs import submit_job, map_in_pool, QueueFullError
+from metrics import record, stage, run_collecting, replay, server_timing_header, render_metrics
+from ocr import extract_cv_text, load_ocr_profiles
+from position_io import (
+    parse_keywords,
+    parse_positions,
+    parse_positions_csv,
+    export_positions,
+    positions_csv,
+    import_positions,
+    apply_keyword_changes
+)
+from thumbnails import render_thumbnails, thumbnail_path
+from rescoring import rescore_position, delete_keyword_hits
+from scoring import get_matcher, invalidate_matcher
+from search import ensure_search_index, search_candidates
+from whatif import get_position_matrix, invalidate_position_matrix
+from seed import seed_default_positions
+from storage import store_upload, serve_blob, blob_hash, iter_bulk_entries, UploadTooLargeError
+from text_cache import get_cached_text, store_cached_text, text_cache_key
+from textnorm import (
+    remove_diacritics,
+    normalize_text,
+    extract_email_from_cv_text,
+    extract_name_from_cv_text,
+    extract_phone_from_cv_text
+)
 
 db = SQLAlchemy()
 migrate = Migrate()
 
 
-def remove_diacritics(text):
-    return ''.join(
-        c for c in unicodedata.normalize('NFD', text)
-        if unicodedata.category(c) != 'Mn'
-    )
-
-def extract_email_from_cv_text(text):
-    email_pattern = r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
-    match = re.search(email_pattern, text)
-    return match.group(0) if match else None
-
-
-def extract_name_from_cv_text(text, max_lines=60):
-
-    normalized_text = remove_diacritics(text)
-    lines = [line.strip() for line in normalized_text.strip().split("\n") if line.strip()]
-
-    
-    ignore_keywords = {
-        "LANGUAGES", "SKILLS", "EDUCATION", "REFERENCES", "CONTACT", "PROFILE",
-        "O MNIE", "ABOUT ME", "KONTAKT", "ADRES", "CERTYFIKATY", "CERTIFICATES",
-        "JĘZYKI", "JEZYKI", "EDUKACJA", "DOŚWIADCZENIE", "EXPERIENCE",
-        "UMIEJĘTNOŚCI", "UMIEJETNOSCI", "UNIVERSITY", "COLLEGE", "INSTITUTE", "SZKOLA", "UNIWERSYTET", "LICEUM", "TECHNIKUM"
-    }
-
-    for i, line in enumerate(lines[:max_lines]):
-        if any(keyword in line for keyword in ignore_keywords):
-            continue
-
-        cleaned_line = re.sub(r"\d+|[^A-Z\s]", "", line).strip()
-
-        match = re.match(r"^([A-Z]{2,})\s+([A-Z]{2,})$", cleaned_line)
-        if match:
-            return f"{match.group(1)} {match.group(2)}"
-
-        if i + 1 < len(lines):
-            cleaned_next_line = re.sub(r"\d+|[^A-Z\s]", "", lines[i + 1]).strip()
-            if line.isupper() and cleaned_next_line.isupper():
-                return f"{line} {lines[i + 1]}"
-            
-    return "Nierozpoznane"
-
-
-def extract_phone_from_cv_text(text):
-    phone_pattern = r'(?:\+?\d{1,3}[ -]?)?(?:\(?\d{1,4}\)?[ -]?)?\d{3,4}[ -]?\d{3,4}[ -]?\d{3,4}'
-    match = re.search(phone_pattern, text)
-    return match.group(0) if match else None
-
+def normalize_keyword(word):
+    return remove_diacritics(word).lower()
 
 
 def create_app():
     app = Flask(__name__)
-    app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite:///database.db"
+    app.config["SQLALCHEMY_DATABASE_URI"] = database_url(os.getenv("DATABASE_URL"))
     app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
+    app.config["SQLALCHEMY_ENGINE_OPTIONS"] = engine_options(
+        app.config["SQLALCHEMY_DATABASE_URI"],
+        pool_size=int(os.getenv("DB_POOL_SIZE", 5)),
+        max_overflow=int(os.getenv("DB_MAX_OVERFLOW", 10)),
+        pool_timeout=int(os.getenv("DB_POOL_TIMEOUT", 30)),
+        pool_recycle=int(os.getenv("DB_POOL_RECYCLE", 1800))
+    )
+    app.config["SQLITE_WAL"] = os.getenv("SQLITE_WAL", "1") == "1"
+    app.config["SQLITE_BUSY_TIMEOUT_MS"] = int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", 15000))
+    app.config["SQLITE_MMAP_SIZE"] = int(os.getenv("SQLITE_MMAP_SIZE", 256 * 1024 * 1024))
     app.config["UPLOAD_FOLDER"] = os.path.join(
         os.path.abspath(os.path.dirname(__file__)), "uploads"
     )
+    app.config["ANALYSIS_ASYNC"] = os.getenv("ANALYSIS_ASYNC", "0") == "1"
+    app.config["ANALYSIS_WORKERS"] = int(os.getenv("ANALYSIS_WORKERS", 2))
+    app.config["ANALYSIS_QUEUE_LIMIT"] = int(os.getenv("ANALYSIS_QUEUE_LIMIT", 20))
+    app.config["ANALYSIS_JOB_TIMEOUT"] = int(os.getenv("ANALYSIS_JOB_TIMEOUT", 900))
+    app.config["OCR_PAGE_WORKERS"] = int(os.getenv("OCR_PAGE_WORKERS", os.cpu_count() or 1))
+    app.config["OCR_MIN_TEXT_CHARS"] = int(os.getenv("OCR_MIN_TEXT_CHARS", 20))
+    app.config["OCR_PROFILES"] = load_ocr_profiles(os.getenv("OCR_PROFILES"))
+    app.config["OCR_MAX_PAGES"] = int(os.getenv("OCR_MAX_PAGES", 30))
+    app.config["OCR_ENGINE"] = os.getenv("OCR_ENGINE", "auto")
+    app.config["OCR_RASTERIZER"] = os.getenv("OCR_RASTERIZER", "auto")
+    app.config["TEXT_CACHE_MAX_BYTES"] = int(os.getenv("TEXT_CACHE_MAX_BYTES", 64 * 1024 * 1024))
+    app.config["BULK_MAX_FILES"] = int(os.getenv("BULK_MAX_FILES", 500))
+    app.config["BULK_BATCH_SIZE"] = int(os.getenv("BULK_BATCH_SIZE", 50))
+    app.config["SEED_ON_STARTUP"] = os.getenv("SEED_ON_STARTUP", "0") == "1"
+    app.config["UPLOAD_MAX_BYTES"] = int(os.getenv("UPLOAD_MAX_BYTES", 20 * 1024 * 1024))
+    app.config["MAX_CONTENT_LENGTH"] = int(os.getenv("MAX_CONTENT_LENGTH", 512 * 1024 * 1024))
+    app.config["UPLOAD_CACHE_MAX_AGE"] = int(os.getenv("UPLOAD_CACHE_MAX_AGE", 86400))
+    app.config["USE_X_SENDFILE"] = os.getenv("USE_X_SENDFILE", "0") == "1"
+    app.config["X_ACCEL_REDIRECT_PREFIX"] = os.getenv("X_ACCEL_REDIRECT_PREFIX")
+    app.config["THUMBNAIL_WIDTH"] = int(os.getenv("THUMBNAIL_WIDTH", 240))
+    app.config["THUMBNAIL_FORMAT"] = os.getenv("THUMBNAIL_FORMAT", "WEBP")
+    app.config["THUMBNAIL_DPI"] = int(os.getenv("THUMBNAIL_DPI", 40))
+    app.config["THUMBNAIL_MAX_PAGES"] = int(os.getenv("THUMBNAIL_MAX_PAGES", 10))
+    app.config["THUMBNAIL_CACHE_MAX_AGE"] = int(os.getenv("THUMBNAIL_CACHE_MAX_AGE", 365 * 24 * 3600))
+    app.config["CATALOG_REFRESH_SECONDS"] = float(os.getenv("CATALOG_REFRESH_SECONDS", 0))
+    app.config["WHATIF_REFRESH_SECONDS"] = int(os.getenv("WHATIF_REFRESH_SECONDS", 5))
+    app.config["BACKFILL_BATCH_SIZE"] = int(os.getenv("BACKFILL_BATCH_SIZE", 200))
+    app.config["BACKFILL_STALE_SECONDS"] = int(os.getenv("BACKFILL_STALE_SECONDS", 120))
     app.secret_key = os.urandom(24)
     app.secret_key = os.getenv("SECRET_KEY", "domyslny_klucz")
 
     db.init_app(app)
-    migrate.init_app(app, db)
+    migrate.init_app(app, db, directory=os.path.join(os.path.dirname(os.path.abspath(__file__)), "migrations"))
         
     with app.app_context():
-        from models import Position, Keyword, Candidate, User
-        db.create_all() 
-        create_default_positions()
+        from models import Position, Keyword, Candidate, User, AnalysisJob, CandidateScore, BackfillJob
+        configure_sqlite(
+            db.engine, app.config["SQLITE_WAL"], app.config["SQLITE_BUSY_TIMEOUT_MS"], app.config["SQLITE_MMAP_SIZE"]
+        )
+        create_schema(db)
+        ensure_search_index(db.engine)
+        if app.config["SEED_ON_STARTUP"]:
+            seed_default_positions()
+
+    @app.cli.command("seed-positions")
+    @click.option("--force", is_flag=True, help="Zastosuj dane startowe nawet bez zmian.")
+    def seed_positions_command(force):
+        if seed_default_positions(force=force):
+            print("Domyślne stanowiska zostały zaktualizowane.")
+        else:
+            print("Domyślne stanowiska są aktualne.")
+
+    # Wersja pliku w adresach miniatur (/thumbnail/...?v=<skrót>)
+    app.add_template_global(blob_hash)
+
+    @app.before_request
+    def start_request_timer():
+        g.request_started = time.perf_counter()
+
+    @app.after_request
+    def add_server_timing(response):
+        if "request_started" in g:
+            record("stage", "request", time.perf_counter() - g.request_started)
+        header = server_timing_header()
+        if header:
+            response.headers["Server-Timing"] = header
+        return response
+
+    @app.route("/metrics")
+    def metrics():
+        body, content_type = render_metrics()
+        return app.response_class(body, content_type=content_type)
+
+    backfills_resumed = []
+
+    @app.before_request
+    def resume_interrupted_backfills():
+        # Raz na proces, przy pierwszym żądaniu - polecenia CLI nie uruchamiają wątków
+        if not backfills_resumed:
+            backfills_resumed.append(True)
+            resume_backfills(app)
 
     @app.route("/")
     def home():
@@ -110,30 +186,169 @@ def create_app():
             selected_position_id = request.form.get("position_id")
             session["last_position_id"] = selected_position_id
 
-        global_positions = Position.query.filter_by(is_default=True).all()
-        user_positions = Position.query.filter_by(user_id=user_id).all()
+        catalog = get_position_catalog(app.config["CATALOG_REFRESH_SECONDS"])
+        global_positions = catalog.default_positions()
+        user_positions = catalog.user_positions(user_id)
         last_position_id = session.get("last_position_id", global_positions[0].id if global_positions else None)
 
-        return render_template(
-            "upload.html",
-            global_positions=global_positions,
-            user_positions=user_positions,
-            last_position_id=last_position_id 
+        return conditional_page(
+            lambda: render_template(
+                "upload.html",
+                global_positions=global_positions,
+                user_positions=user_positions,
+                last_position_id=last_position_id
+            ),
+            (catalog.version, user_id, last_position_id),
+            catalog.updated_at
         )
 
+    def conditional_page(render, key, last_modified=None):
+        # Strona zależna tylko od key: przy zgodnym If-None-Match/If-Modified-Since odpowiedź 304
+        # bez renderowania szablonu. Strony są per użytkownik, więc tylko pamięć przeglądarki.
+        if session.get("_flashes"):
+            # Komunikat czeka na wyświetlenie - strona renderowana zawsze i bez walidatorów,
+            # żeby następne żądanie nie dostało 304 z kopią zawierającą ten komunikat
+            response = make_response(render())
+            response.cache_control.private = True
+            response.cache_control.no_cache = True
+            return response
+
+        etag = hashlib.sha1(repr(key).encode("utf-8")).hexdigest()
+        if request.method == "GET" and not is_resource_modified(
+            request.environ, etag=etag, last_modified=last_modified
+        ):
+            response = Response(status=304)
+        else:
+            response = make_response(render())
+        response.set_etag(etag)
+        if last_modified is not None:
+            response.last_modified = last_modified
+        response.cache_control.private = True
+        response.cache_control.no_cache = True
+        return response
+
+    @app.route("/bulk_upload", methods=["GET", "POST"])
+    def bulk_upload():
+        if "user_id" not in session:
+            flash("Musisz się zalogować!")
+            return redirect(url_for("login"))
+
+        user_id = session["user_id"]
+
+        if request.method == "GET":
+            return render_template(
+                "bulk_upload.html",
+                global_positions=Position.query.filter_by(is_default=True).all(),
+                user_positions=Position.query.filter_by(user_id=user_id).all(),
+                last_position_id=session.get("last_position_id")
+            )
+
+        position_id = int(request.form["position_id"])
+        session["last_position_id"] = position_id
+
+        summary = []
+        entries = []
+        for original_name, stream, error in iter_bulk_entries(request.files.getlist("files")):
+            if len(entries) >= app.config["BULK_MAX_FILES"]:
+                error = "Przekroczono limit plików w jednym przesłaniu"
+            row = {"file": original_name, "status": "error", "error": error}
+            summary.append(row)
+            if error:
+                continue
+            try:
+                with stage("upload"):
+                    row["file_hash"], row["path"] = store_upload(
+                        stream, original_name, app.config["UPLOAD_FOLDER"], app.config["UPLOAD_MAX_BYTES"]
+                    )
+            except UploadTooLargeError as e:
+                row["error"] = str(e)
+                continue
+            record("upload", os.path.getsize(row["path"]))
+            entries.append(row)
+
+        texts = {}
+        missing = []
+        for row in entries:
+            file_hash = row["file_hash"]
+            if file_hash in texts or file_hash in missing:
+                continue
+            cached = get_cached_text(text_cache_key(file_hash, app.config))
+            if cached is not None:
+                texts[file_hash] = cached[0]
+                record("cache_hit")
+            else:
+                missing.append(file_hash)
+
+        # OCR tylko dla unikalnych plików spoza pamięci podręcznej, w puli procesów
+        paths = {row["file_hash"]: row["path"] for row in entries}
+        args_list = [(extract_cv_text, *extraction_args(paths[file_hash])) for file_hash in missing]
+        for file_hash, future in zip(missing, map_in_pool(app, run_collecting, args_list)):
+            try:
+                (text, page_methods), observations = future.result()
+            except Exception as e:
+                texts[file_hash] = e
+                continue
+            replay(observations)
+            texts[file_hash] = text
+            store_cached_text(
+                text_cache_key(file_hash, app.config), text, page_methods, app.config["TEXT_CACHE_MAX_BYTES"]
+            )
+
+        position_ids = visible_position_ids(user_id, position_id)
+        pending = []
+        for row in entries:
+            text = texts[row.pop("file_hash")]
+            file_path = row.pop("path")
+            if isinstance(text, Exception):
+                row["error"] = f"Błąd podczas wyodrębniania tekstu z PDF: {str(text)}"
+                continue
+
+            scores = score_cv_text_for_positions(position_ids, text)
+            name = os.path.splitext(row["file"])[0]
+            pending.append((row, build_candidate(name, position_id, user_id, file_path, text, scores)))
+
+            if len(pending) >= app.config["BULK_BATCH_SIZE"]:
+                commit_bulk_batch(pending)
+        commit_bulk_batch(pending)
+
+        if request.accept_mimetypes.best == "application/json":
+            return jsonify({"position_id": position_id, "files": summary})
+        return render_template("bulk_results.html", summary=summary, position_id=position_id)
+
+    def commit_bulk_batch(pending):
+        with stage("db_write"):
+            db.session.commit()
+        for row, candidate in pending:
+            row["status"] = "ok"
+            row["candidate_id"] = candidate.id
+            row["points"] = candidate.points
+        pending.clear()
+
     @app.route("/positions", methods=["POST"])
     def add_position():
         data = request.json
-        position = Position(title=data["title"])
+        try:
+            # Słowa jako napisy albo {"word": ..., "weight": ...}
+            words = parse_keywords(data["keywords"])
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+        position = Position(title=data["title"], user_id=session.get("user_id"))
         db.session.add(position)
+        db.session.flush()
+        apply_keyword_changes(
+            [{"word": word, "weight": weight, "position_id": position.id} for word, weight in words.items()], [], []
+        )
+        bump_catalog_version()
         db.session.commit()
-
-        for word in data["keywords"]:
-            keyword = Keyword(word=word, position_id=position.id)
-            db.session.add(keyword)
-
-        db.session.commit()
-        return jsonify({"message": "Stanowisko zostało pomyślnie dodane!"}), 201
+        invalidate_position_catalog()
+        invalidate_matcher(position.id)
+        job = start_backfill(app, position.id)
+        return jsonify({
+            "message": "Stanowisko zostało pomyślnie dodane!",
+            "position_id": position.id,
+            "backfill": backfill_status(job),
+            "backfill_url": url_for("position_backfill", position_id=position.id)
+        }), 201
 
     @app.route("/analyze_cv", methods=["POST"])
     def analyze_cv():
@@ -145,54 +360,132 @@ def create_app():
             session["last_position_id"] = position_id
 
             filename = f"{user_input_name}_{file.filename}"
-            file_path = os.path.join(app.config["UPLOAD_FOLDER"], filename)
-            file.save(file_path)
-
-            keywords = Keyword.query.filter_by(position_id=position_id).all()
-
             try:
-                pages = convert_from_path(file_path)
-                extracted_text = " ".join(image_to_string(page) for page in pages)
-            except Exception as e:
-                flash(f"Błąd podczas wyodrębniania tekstu z PDF: {str(e)}")
+                with stage("upload"):
+                    file_hash, file_path = store_upload(
+                        file.stream, file.filename, app.config["UPLOAD_FOLDER"], app.config["UPLOAD_MAX_BYTES"]
+                    )
+            except UploadTooLargeError as e:
+                flash(str(e))
                 return redirect(url_for("upload"))
+            record("upload", os.path.getsize(file_path))
+            cache_key = text_cache_key(file_hash, app.config)
+            cached = get_cached_text(cache_key)
+
+            if request.form.get("async") == "1" or app.config["ANALYSIS_ASYNC"]:
+                return start_analysis_job(user_input_name, position_id, file_path, cache_key, cached)
 
-            first_words = extract_name_from_cv_text(extracted_text)
-            email_cv = extract_email_from_cv_text(extracted_text)
-            phone_number = extract_phone_from_cv_text(extracted_text)
-
-            normalized_text = remove_diacritics(extracted_text).lower()
-
-            results = {}
-            total_score = 0
-            for keyword in keywords:
-                keyword_normalized = remove_diacritics(keyword.word).lower()
-                count = normalized_text.count(keyword_normalized)
-                points = count * keyword.weight  # Uwzględnienie wagi
-                results[keyword.word] = {"count": count, "weight": keyword.weight, "points": points}
-                total_score += points
-
- 
-            candidate = Candidate(
-                name=user_input_name,  
-                first_words=first_words,  
-                cv_text=extracted_text,
-                email_cv=email_cv,
-                phone_number=phone_number,
-                position_id=position_id,
-                points=total_score,
-                user_id=session.get("user_id"),
-                path=file_path
+            if cached is not None:
+                extracted_text, page_methods = cached
+                record("cache_hit")
+                app.logger.info("Tekst %s z pamięci podręcznej (%s)", filename, file_hash)
+            else:
+                try:
+                    extracted_text, page_methods = extract_cv_text(*extraction_args(file_path))
+                except Exception as e:
+                    app.logger.exception("Ekstrakcja tekstu %s nie powiodła się", filename)
+                    flash(f"Błąd podczas wyodrębniania tekstu z PDF: {str(e)}")
+                    return redirect(url_for("upload"))
+                app.logger.info("Ekstrakcja tekstu %s: %s", filename, page_methods)
+                store_cached_text(
+                    cache_key, extracted_text, page_methods, app.config["TEXT_CACHE_MAX_BYTES"]
+                )
+
+            scores = analyze_cv_text(position_id, session.get("user_id"), extracted_text)
+            results, total_score, _ = scores[position_id]
+            save_candidate(
+                user_input_name, position_id, session.get("user_id"),
+                file_path, extracted_text, scores
             )
-            db.session.add(candidate)
-            db.session.commit()
 
             return render_template("results.html", name=user_input_name, results=results, total_score=total_score)
 
         except Exception as e:
+            app.logger.exception("Analiza CV nie powiodła się")
             flash(f"Wystąpił błąd: {str(e)}")
             return redirect(url_for("upload"))
 
+    def extraction_args(file_path):
+        return (
+            file_path,
+            app.config["OCR_PAGE_WORKERS"],
+            app.config["OCR_MIN_TEXT_CHARS"],
+            thumbnail_options(),
+            app.config["OCR_PROFILES"],
+            app.config["OCR_MAX_PAGES"],
+            app.config["OCR_ENGINE"],
+            app.config["OCR_RASTERIZER"]
+        )
+
+    def thumbnail_options():
+        return {
+            "width": app.config["THUMBNAIL_WIDTH"],
+            "format": app.config["THUMBNAIL_FORMAT"],
+            "dpi": app.config["THUMBNAIL_DPI"],
+            "max_pages": app.config["THUMBNAIL_MAX_PAGES"],
+            "rasterizer": app.config["OCR_RASTERIZER"]
+        }
+
+    def start_analysis_job(name, position_id, file_path, cache_key, cached):
+        job = AnalysisJob(
+            id=uuid.uuid4().hex,
+            name=name,
+            position_id=position_id,
+            user_id=session.get("user_id"),
+            path=file_path
+        )
+        db.session.add(job)
+        db.session.commit()
+
+        try:
+            if cached is not None:
+                record("cache_hit")
+                complete_analysis_job(job.id, *cached)
+            else:
+                submit_job(
+                    app, run_collecting, (extract_cv_text, *extraction_args(file_path)),
+                    partial(finish_analysis_job, job.id, cache_key)
+                )
+        except QueueFullError:
+            job.status = "error"
+            job.error = "Zbyt wiele analiz w kolejce, spróbuj ponownie za chwilę."
+            db.session.commit()
+            if request.accept_mimetypes.best == "application/json":
+                return jsonify({"job_id": job.id, "status": job.status, "error": job.error}), 503
+            flash(job.error)
+            return redirect(url_for("upload"))
+
+        if request.accept_mimetypes.best == "application/json":
+            return jsonify({
+                "job_id": job.id,
+                "status": job.status,
+                "status_url": url_for("job_status", job_id=job.id)
+            }), 202
+        return redirect(url_for("job_status", job_id=job.id))
+
+    @app.route("/jobs/<job_id>")
+    def job_status(job_id):
+        expire_analysis_jobs(app.config["ANALYSIS_JOB_TIMEOUT"], job_id)
+        job = AnalysisJob.query.get_or_404(job_id)
+
+        if request.accept_mimetypes.best == "application/json" or request.args.get("format") == "json":
+            return jsonify({
+                "job_id": job.id,
+                "status": job.status,
+                "candidate_id": job.candidate_id,
+                "error": job.error
+            })
+
+        if job.status == "pending":
+            return render_template("job.html", job=job)
+
+        if job.status == "error":
+            flash(f"Wystąpił błąd: {job.error}")
+            return redirect(url_for("upload"))
+
+        candidate = Candidate.query.get_or_404(job.candidate_id)
+        results, total_score, _ = score_cv_text(job.position_id, candidate.cv_text)
+        return render_template("results.html", name=job.name, results=results, total_score=total_score)
 
     @app.route("/add_position", methods=["GET", "POST"])
     def add_position_form():
@@ -202,19 +495,26 @@ def create_app():
 
         if request.method == "POST":
             title = request.form["title"]
-            keywords = request.form["keywords"].split(",")
+            try:
+                # "Python:5, SQL:3, Git" - waga 1-5 po dwukropku, domyślnie 1
+                words = parse_keywords(request.form["keywords"].split(","), weight_suffix=True)
+            except ValueError as e:
+                flash(str(e))
+                return redirect(url_for("add_position_form"))
 
             position = Position(title=title, user_id=session["user_id"])
             db.session.add(position)
+            db.session.flush()
+            apply_keyword_changes(
+                [{"word": word, "weight": weight, "position_id": position.id} for word, weight in words.items()], [], []
+            )
+            bump_catalog_version()
             db.session.commit()
+            invalidate_position_catalog()
+            invalidate_matcher(position.id)
+            start_backfill(app, position.id)
 
-            for keyword in keywords:
-                kw = Keyword(word=keyword.strip(), position_id=position.id)
-                db.session.add(kw)
-
-            db.session.commit()
-
-            flash("Stanowisko zostało dodane pomyślnie!")
+            flash("Stanowisko zostało dodane pomyślnie! Trwa przeliczanie istniejących kandydatów.")
             return redirect(url_for("home"))
 
         return render_template("add_position.html")
@@ -271,42 +571,161 @@ def create_app():
             return redirect(url_for("login"))
 
         user_id = session["user_id"]
-        positions = Position.query.filter_by(user_id=user_id).all()
-        return render_template("view_positions.html", positions=positions)
+        catalog = get_position_catalog(app.config["CATALOG_REFRESH_SECONDS"])
+        positions = catalog.user_positions(user_id)
+        backfills = latest_backfills([position.id for position in positions])
+        # Postęp przeliczania zmienia stronę bez zmiany katalogu
+        last_modified = max(
+            [catalog.updated_at] + [job.updated_at for job in backfills.values()],
+            key=lambda value: value or datetime.min
+        )
+        return conditional_page(
+            lambda: render_template("view_positions.html", positions=positions, backfills=backfills),
+            (catalog.version, user_id, [
+                (job.id, job.status, job.processed, job.total, job.error) for job in backfills.values()
+            ]),
+            last_modified
+        )
+
+    @app.route("/positions/export")
+    def export_positions_view():
+        if "user_id" not in session:
+            return jsonify({"error": "Musisz się zalogować!"}), 401
+
+        positions = export_positions(session["user_id"], request.args.get("include_default") == "1")
+        if request.args.get("format") == "csv":
+            return Response(
+                positions_csv(positions),
+                mimetype="text/csv",
+                headers={"Content-Disposition": "attachment; filename=positions.csv"}
+            )
+        return jsonify({"positions": positions})
+
+    @app.route("/positions/import", methods=["POST"])
+    def import_positions_view():
+        # JSON w treści żądania (API) albo plik .json/.csv z formularza na stronie stanowisk
+        from_form = not request.is_json
+        if "user_id" not in session:
+            if from_form:
+                flash("Musisz się zalogować!")
+                return redirect(url_for("login"))
+            return jsonify({"error": "Musisz się zalogować!"}), 401
+
+        mode = request.args.get("mode") or request.form.get("mode") or "replace"
+        try:
+            if from_form:
+                file = request.files.get("file")
+                if file is None or not file.filename:
+                    raise ValueError("Wybierz plik JSON lub CSV.")
+                content = file.read().decode("utf-8-sig")
+                if file.filename.lower().endswith(".csv"):
+                    positions = parse_positions_csv(content)
+                else:
+                    positions = parse_positions(json.loads(content))
+            else:
+                positions = parse_positions(request.get_json())
+        except (ValueError, UnicodeDecodeError) as e:
+            if from_form:
+                flash(f"Nie udało się wczytać stanowisk: {e}")
+                return redirect(url_for("view_positions"))
+            return jsonify({"error": str(e)}), 400
+
+        summary, touched = import_positions(session["user_id"], positions, replace_keywords=mode != "merge")
+        invalidate_position_catalog()
+        for position_id, added_ids in touched.items():
+            invalidate_matcher(position_id)
+            invalidate_position_matrix(position_id)
+            rescore_position(position_id)
+            if added_ids is None or added_ids:
+                start_backfill(app, position_id, added_ids)
+
+        if from_form:
+            flash(
+                f"Zaimportowano stanowiska: nowe {summary['created']}, zmienione {summary['updated']}, "
+                f"bez zmian {summary['unchanged']}."
+            )
+            return redirect(url_for("view_positions"))
+        return jsonify(summary)
+
+    def latest_backfills(position_ids):
+        jobs = (
+            BackfillJob.query.filter(BackfillJob.position_id.in_(position_ids))
+            .order_by(BackfillJob.created_at)
+            .all()
+        )
+        return {job.position_id: job for job in jobs}
+
+    @app.route("/positions/<int:position_id>/backfill")
+    def position_backfill(position_id):
+        Position.query.get_or_404(position_id)
+        job = latest_backfills([position_id]).get(position_id)
+        if job is None:
+            return jsonify({"position_id": position_id, "status": None}), 404
+        return jsonify(backfill_status(job))
     
 
     @app.route("/ranking", methods=["GET", "POST"])
     def ranking():
         try:
-            positions = Position.query.all()
+            user_id = session.get("user_id")
+            catalog = get_position_catalog(app.config["CATALOG_REFRESH_SECONDS"])
+            positions = catalog.visible_positions(user_id)
             position_id = request.args.get("position_id", type=int) or positions[0].id
             limit = request.args.get("limit", default=20, type=int)
             limit = max(1, min(limit, 50))
 
-            position = Position.query.get_or_404(position_id)
-            candidates = (
-                Candidate.query.filter_by(position_id=position_id)
-                .filter((Candidate.user_id == session.get("user_id")) | (Candidate.user_id.is_(None)))  
-                .filter(Candidate.points.isnot(None))
-                .order_by(Candidate.points.desc())
-                .limit(limit)
-                .all()
-                )
+            position = catalog.get(position_id)
+            if position is None:
+                abort(404)
+            candidates = ranking_candidates(position_id, user_id, limit)
 
             candidates_with_index = list(enumerate(candidates, start=1))
 
-            return render_template(
-                "ranking.html",
-                positions=positions,
-                position=position,
-                candidates_with_index=candidates_with_index,
-                limit=limit,
+            # Lista zmienia się z punktami kandydatów, więc są częścią ETag; Last-Modified nie ma sensu
+            return conditional_page(
+                lambda: render_template(
+                    "ranking.html",
+                    positions=positions,
+                    position=position,
+                    candidates_with_index=candidates_with_index,
+                    limit=limit,
+                ),
+                (catalog.version, user_id, position_id, limit,
+                 [(candidate.id, points) for candidate, points in candidates])
             )
         except Exception as e:
             flash(f"Wystąpił błąd: {str(e)}")
             return redirect(url_for("home"))
         
         
+    @app.route("/what_if/<int:position_id>", methods=["POST"])
+    def what_if(position_id):
+        if "user_id" not in session:
+            return jsonify({"error": "Musisz się zalogować!"}), 401
+
+        data = request.get_json(silent=True) or {}
+        weights = data.get("weights") or {}
+        try:
+            limit = max(1, min(int(data.get("limit", 20)), 50))
+        except (TypeError, ValueError):
+            return jsonify({"error": "Pole limit musi być liczbą całkowitą."}), 400
+        if not isinstance(weights, dict):
+            return jsonify({"error": "Pole weights musi być obiektem {słowo lub id: waga}."}), 400
+
+        started = time.perf_counter()
+        matrix = get_position_matrix(position_id, app.config["WHATIF_REFRESH_SECONDS"])
+        try:
+            results = matrix.top_k(weights, session["user_id"], limit)
+        except (TypeError, ValueError):
+            return jsonify({"error": "Wagi muszą być liczbami."}), 400
+
+        return jsonify({
+            "position_id": position_id,
+            "candidates": len(matrix.candidate_ids),
+            "results": results,
+            "elapsed_ms": round((time.perf_counter() - started) * 1000, 3)
+        })
+
     @app.route("/edit_position/<int:position_id>", methods=["GET", "POST"])
     def edit_position(position_id):
         position = Position.query.get_or_404(position_id)
@@ -320,25 +739,48 @@ def create_app():
             weights = request.form.getlist("weights")
             deleted_keywords = request.form.getlist("deleted_keywords")
 
-            for keyword_id in deleted_keywords:
-                keyword = Keyword.query.get(int(keyword_id))
-                if keyword:
-                    db.session.delete(keyword)
+            # Jedno zapytanie o słowa stanowiska, zmiany zapisywane zbiorczo
+            current = {
+                keyword.id: keyword for keyword in
+                Keyword.query.filter_by(position_id=position_id).options(load_only(Keyword.word, Keyword.weight))
+            }
+            deleted_ids = [int(keyword_id) for keyword_id in deleted_keywords if int(keyword_id) in current]
 
+            updates, changed_ids = [], []
             for keyword_id, word, weight in zip(keyword_ids, keyword_words, weights):
-                keyword = Keyword.query.get(int(keyword_id))
-                if keyword:
-                    keyword.word = word
-                    keyword.weight = int(weight)
+                keyword = current.get(int(keyword_id))
+                if keyword is None or keyword.id in deleted_ids:
+                    continue
+                if keyword.word != word:
+                    changed_ids.append(keyword.id)
+                if keyword.word != word or keyword.weight != int(weight):
+                    updates.append({"id": keyword.id, "word": word, "weight": int(weight)})
 
             new_keywords = request.form.getlist("new_keywords[]")
             new_weights = request.form.getlist("new_weights[]")
-            for word, weight in zip(new_keywords, new_weights):
-                new_keyword = Keyword(word=word, weight=int(weight), position_id=position_id)
-                db.session.add(new_keyword)
-
+            new_rows = [
+                {"word": word, "weight": int(weight), "position_id": position_id}
+                for word, weight in zip(new_keywords, new_weights)
+            ]
+
+            apply_keyword_changes(new_rows, updates, deleted_ids)
+            if new_rows:
+                changed_ids.extend(
+                    keyword_id for keyword_id, in db.session.query(Keyword.id).filter(Keyword.position_id == position_id)
+                    if keyword_id not in current
+                )
+            bump_catalog_version()
             db.session.commit()
-            flash("Stanowisko zostało zaktualizowane!")
+            invalidate_position_catalog()
+            invalidate_matcher(position_id)
+            invalidate_position_matrix(position_id)
+            # Zmiana wag od razu w SQL; teksty w tle skanowane tylko pod kątem nowych i zmienionych słów
+            rescore_position(position_id)
+            if changed_ids:
+                start_backfill(app, position_id, changed_ids)
+                flash("Stanowisko zostało zaktualizowane! Trwa przeliczanie kandydatów.")
+            else:
+                flash("Stanowisko zostało zaktualizowane!")
             return redirect(url_for("view_positions"))
 
         keywords = Keyword.query.filter_by(position_id=position.id).all()
@@ -353,8 +795,15 @@ def create_app():
             flash("Nie można usunąć globalnych stanowisk!")
             return redirect(url_for("view_positions"))
         
+        delete_keyword_hits(keyword_ids=[keyword.id for keyword in position.keywords])
+        CandidateScore.query.filter_by(position_id=position_id).delete()
+        BackfillJob.query.filter_by(position_id=position_id).delete()
         db.session.delete(position)
+        bump_catalog_version()
         db.session.commit()
+        invalidate_position_catalog()
+        invalidate_matcher(position_id)
+        invalidate_position_matrix(position_id)
         flash("Stanowisko zostało pomyślnie usunięte!")
         return redirect(url_for("view_positions"))
     
@@ -365,7 +814,8 @@ def create_app():
         if not candidate.path:
             flash("Ten kandydat nie ma przesłanego CV.")
             return redirect(url_for("ranking"))
-        return send_file(candidate.path, as_attachment=True)
+        extension = os.path.splitext(candidate.path)[1]
+        return serve_blob(candidate.path, as_attachment=True, download_name=f"{candidate.name}{extension}")
 
     @app.route("/preview_cv/<int:candidate_id>")
     def preview_cv(candidate_id):
@@ -373,8 +823,102 @@ def create_app():
         if not candidate.path:
             flash("Ten kandydat nie ma przesłanego CV.")
             return redirect(url_for("ranking"))
-        return send_file(candidate.path)
+        return serve_blob(candidate.path)
     
+    @app.route("/candidate_positions/<int:candidate_id>")
+    def candidate_positions(candidate_id):
+        if "user_id" not in session:
+            flash("Musisz się zalogować!")
+            return redirect(url_for("login"))
+
+        user_id = session["user_id"]
+        candidate = Candidate.query.get_or_404(candidate_id)
+        # Ta sama reguła widoczności co w rankingu: kandydaci użytkownika i kandydaci bez właściciela
+        if candidate.user_id not in (user_id, None):
+            abort(404)
+
+        # Tylko stanowiska domyślne i własne - bez nazw prywatnych stanowisk innych użytkowników
+        visible = Position.is_default.is_(True) | (Position.user_id == user_id)
+        scores = (
+            CandidateScore.query.filter_by(candidate_id=candidate_id)
+            .join(Position)
+            .filter(visible)
+            .order_by(CandidateScore.points.desc(), Position.title)
+            .all()
+        )
+        position_scores = [(score.position, score.points) for score in scores]
+
+        # Kandydaci sprzed macierzy wyników mają tylko punkty dla swojego stanowiska
+        if not position_scores:
+            position = Position.query.filter(Position.id == candidate.position_id, visible).first()
+            if position is not None:
+                position_scores = [(position, candidate.points)]
+
+        return render_template(
+            "candidate_positions.html",
+            candidate=candidate,
+            position_scores=position_scores
+        )
+
+    @app.route("/thumbnail/<int:candidate_id>/<int:page>")
+    def thumbnail(candidate_id, page):
+        candidate = Candidate.query.options(load_only(Candidate.id, Candidate.path)).get_or_404(candidate_id)
+        options = thumbnail_options()
+        if not candidate.path or not 1 <= page <= options["max_pages"]:
+            abort(404)
+
+        path = thumbnail_path(candidate.path, page, options["format"])
+        if not os.path.exists(path):
+            # Pliki przesłane przed wprowadzeniem miniatur - generowanie przy pierwszym podglądzie
+            try:
+                render_thumbnails(candidate.path, [page], options)
+            except Exception:
+                abort(404)
+            if not os.path.exists(path):
+                abort(404)
+
+        # Identyfikatory kandydatów bywają używane ponownie (SQLite bez AUTOINCREMENT), więc długo
+        # i bez sprawdzania cache'owany jest tylko adres ze skrótem zawartości pliku (?v=...)
+        version = blob_hash(candidate.path)
+        if version is not None and request.args.get("v") == version:
+            response = send_file(path, conditional=True, max_age=app.config["THUMBNAIL_CACHE_MAX_AGE"])
+            response.cache_control.immutable = True
+        else:
+            response = send_file(path, conditional=True)
+            response.cache_control.no_cache = True
+        response.cache_control.public = False
+        response.cache_control.private = True
+        return response
+
+    @app.route("/search")
+    def search():
+        if "user_id" not in session:
+            flash("Musisz się zalogować!")
+            return redirect(url_for("login"))
+
+        query = request.args.get("q", "").strip()
+        limit = request.args.get("limit", default=20, type=int)
+        limit = max(1, min(limit, 50))
+        results = search_candidates(query, session["user_id"], limit) if query else []
+
+        if request.accept_mimetypes.best == "application/json":
+            return jsonify({
+                "query": query,
+                "results": [
+                    {
+                        "candidate_id": candidate.id,
+                        "name": candidate.name,
+                        "first_words": candidate.first_words,
+                        "position_id": candidate.position_id,
+                        "rank": rank,
+                        "snippet": str(snippet) if snippet is not None else None
+                    }
+                    for candidate, rank, snippet in results
+                ]
+            })
+
+        return render_template("search.html", query=query, results=results, limit=limit)
+
     @app.route("/delete_candidate/<int:candidate_id>", methods=["POST"])
     def delete_candidate(candidate_id):
         candidate = Candidate.query.get_or_404(candidate_id)
@@ -383,6 +927,8 @@ def create_app():
             flash("Nie możesz usunąć tego kandydata.")
             return redirect(url_for("ranking"))
 
+        delete_keyword_hits(candidate_ids=[candidate.id])
+        CandidateScore.query.filter_by(candidate_id=candidate.id).delete()
         db.session.delete(candidate)
         db.session.commit()
 
@@ -393,415 +939,184 @@ def create_app():
 
     return app
 
-def create_default_positions():
-    from models import Position, Keyword
 
-    Position.query.filter_by(is_default=True).delete()
+def ranking_candidates(position_id, user_id, limit):
+    from models import Candidate, CandidateScore
+
+    # Ranking stanowiska to kandydaci, którzy na nie aplikowali, i starsi kandydaci dodani przez backfill
+    # nowego stanowiska; punkty z candidate_score. Wyniki dla pozostałych stanowisk pokazuje /candidate_positions/<id>.
+    with stage("ranking_query"):
+        return (
+            db.session.query(Candidate, CandidateScore.points)
+            .join(CandidateScore, CandidateScore.candidate_id == Candidate.id)
+            # Sama kolumna zamiast IS TRUE - PostgreSQL użyje wtedy indeksu ix_candidate_score_ranking
+            .filter(CandidateScore.position_id == position_id, CandidateScore.in_ranking)
+            .filter((Candidate.user_id == user_id) | (Candidate.user_id.is_(None)))
+            .options(load_only(
+                Candidate.id, Candidate.name, Candidate.first_words, Candidate.email_cv,
+                Candidate.phone_number, Candidate.path
+            ))
+            .order_by(CandidateScore.points.desc())
+            .limit(limit)
+            .all()
+        )
+
+
+def score_cv_text(position_id, text):
+    return score_cv_text_for_positions([position_id], text)[position_id]
+
+
+def score_cv_text_for_positions(position_ids, text):
+    from models import Keyword
+
+    with stage("normalize"):
+        _, normalized_text = normalize_text(text)
+
+    with stage("scoring"):
+        keywords = Keyword.query.filter(Keyword.position_id.in_(position_ids)).all()
+        matcher = get_matcher(
+            position_ids, [keyword.word for keyword in keywords], normalize_keyword
+        )
+        counts = matcher.count(normalized_text)
+
+    scores = {position_id: ({}, 0, {}) for position_id in position_ids}
+    for keyword in keywords:
+        results, total_score, hits = scores[keyword.position_id]
+        count = counts[keyword.word]
+        points = count * keyword.weight  # Uwzględnienie wagi
+        results[keyword.word] = {"count": count, "weight": keyword.weight, "points": points}
+        if count:
+            hits[keyword.id] = count
+        scores[keyword.position_id] = (results, total_score + points, hits)
+
+    return scores
+
+
+def visible_position_ids(user_id, position_id):
+    catalog = get_position_catalog(current_app.config["CATALOG_REFRESH_SECONDS"])
+    position_ids = {position.id for position in catalog.visible_positions(user_id)}
+    position_ids.add(position_id)
+    return sorted(position_ids)
+
+
+def analyze_cv_text(position_id, user_id, text):
+    # Jedno skanowanie tekstu dla wszystkich stanowisk widocznych dla użytkownika
+    return score_cv_text_for_positions(visible_position_ids(user_id, position_id), text)
+
+
+def save_candidate(name, position_id, user_id, file_path, text, scores):
+    candidate = build_candidate(name, position_id, user_id, file_path, text, scores)
+    with stage("db_write"):
+        db.session.commit()
+    return candidate
+
+
+def build_candidate(name, position_id, user_id, file_path, text, scores):
+    from models import Candidate, CandidateScore, KeywordHit
+
+    with stage("extract"):
+        first_words = extract_name_from_cv_text(text)
+        email_cv = extract_email_from_cv_text(text)
+        phone_number = extract_phone_from_cv_text(text)
+
+    candidate = Candidate(
+        name=name,
+        first_words=first_words,
+        cv_text=text,
+        email_cv=email_cv,
+        phone_number=phone_number,
+        position_id=position_id,
+        points=scores[position_id][1],
+        user_id=user_id,
+        path=file_path,
+        hits_indexed=True
+    )
+    db.session.add(candidate)
+    with stage("db_write"):
+        db.session.flush()
+    db.session.add_all(
+        CandidateScore(
+            candidate_id=candidate.id, position_id=score_position_id, points=total_score,
+            in_ranking=score_position_id == position_id
+        )
+        for score_position_id, (_, total_score, _) in scores.items()
+    )
+    db.session.add_all(
+        KeywordHit(candidate_id=candidate.id, keyword_id=keyword_id, count=count)
+        for _, _, hits in scores.values()
+        for keyword_id, count in hits.items()
+    )
+    return candidate
+
+
+def finish_analysis_job(job_id, cache_key, future):
+    try:
+        (text, page_methods), observations = future.result()
+    except Exception as e:
+        fail_analysis_job(job_id, str(e))
+        return
+
+    replay(observations)
+    current_app.logger.info("Ekstrakcja tekstu %s: %s", job_id, page_methods)
+    store_cached_text(cache_key, text, page_methods, current_app.config["TEXT_CACHE_MAX_BYTES"])
+    complete_analysis_job(job_id, text, page_methods)
+
+
+def complete_analysis_job(job_id, text, page_methods):
+    from models import AnalysisJob
+
+    job = db.session.get(AnalysisJob, job_id)
+    if job.status != "pending":
+        # Zadanie uznane w międzyczasie za porzucone (expire_analysis_jobs)
+        return
+    try:
+        scores = analyze_cv_text(job.position_id, job.user_id, text)
+        candidate = save_candidate(
+            job.name, job.position_id, job.user_id, job.path, text, scores
+        )
+    except Exception as e:
+        db.session.rollback()
+        fail_analysis_job(job_id, str(e))
+        return
+
+    job.candidate_id = candidate.id
+    job.status = "done"
+    job.finished_at = datetime.utcnow()
     db.session.commit()
 
-    # Struktura z wagami dla słów kluczowych
-    default_positions = [
-        {
-        "title": "Programista",
-        "keywords": [
-            {"word": "programowanie", "weight": 5}, {"word": "Python", "weight": 5},
-            {"word": "Java", "weight": 5}, {"word": "JavaScript", "weight": 5},
-            {"word": "C#", "weight": 4}, {"word": "SQL", "weight": 3},
-            {"word": "bazy danych", "weight": 2}, {"word": "API", "weight": 3},
-            {"word": "framework", "weight": 3}, {"word": "debugowanie", "weight": 3},
-            {"word": "kodowanie", "weight": 2}, {"word": "systemy operacyjne", "weight": 2},
-            {"word": "integracja", "weight": 1}, {"word": "automatyzacja", "weight": 2},
-            {"word": "scrum", "weight": 3}, {"word": "agile", "weight": 2},
-            {"word": "testing", "weight": 2}, {"word": "backend", "weight": 4},
-            {"word": "frontend", "weight": 4}, {"word": "narzędzia CI/CD", "weight": 4},
-            {"word": "Git", "weight": 4}, {"word": "Docker", "weight": 3},
-            {"word": "Linux", "weight": 3}, {"word": "Windows", "weight": 3},
-            {"word": "architektura systemów", "weight": 3}, {"word": "analityka", "weight": 2},
-            {"word": "optymalizacja", "weight": 3}, {"word": "REST", "weight": 4},
-            {"word": "SOAP", "weight": 3}, {"word": "mikroserwisy", "weight": 4},
-            {"word": "bezpieczeństwo IT", "weight": 5}, {"word": "refaktoryzacja", "weight": 2},
-            {"word": "chmura", "weight": 4}, {"word": "Azure", "weight": 4},
-            {"word": "AWS", "weight": 4}, {"word": "GCP", "weight": 4}, {"word": "DevOps", "weight": 4}, 
-            {"word": "B1", "weight": 1}, {"word": "B2", "weight": 2},
-            {"word": "C1", "weight": 3}, {"word": "C2", "weight": 4}, {"word": "English", "weight": 1}, 
-            {"word": "Angielski", "weight": 1}, {"word": "FastAPI", "weight": 3}, {"word": "Flask", "weight": 4}, {"word": "Django", "weight": 5}, {"word": "TypeScript", "weight": 4}, {"word": "React", "weight": 5}, {"word": "Node.js", "weight": 4}, {"word": "Jenkins", "weight": 4}, {"word": "GitHub Actions", "weight": 3}, {"word": "Kubernetes", "weight": 3},{"word": "Ansible", "weight": 2},{"word": "Terraform", "weight": 2},{"word": "AWS Lambda", "weight": 2}, {"word": "AWS S3", "weight": 2}, {"word": "Azure DevOps", "weight": 2}, {"word": "Redis", "weight": 3},{"word": "PostgreSQL", "weight": 2},{"word": "MongoDB", "weight": 2}, {"word": "pytest", "weight": 2}
-        ]
-    },
-    {
-    "title": "Analityk Danych",
-    "keywords": [
-        {"word": "dane", "weight": 5}, {"word": "Excel", "weight": 3},
-        {"word": "SQL", "weight": 5}, {"word": "analizy", "weight": 4},
-        {"word": "wizualizacja danych", "weight": 4}, {"word": "Tableau", "weight": 3},
-        {"word": "Power BI", "weight": 4}, {"word": "statystyka", "weight": 5},
-        {"word": "Python", "weight": 5}, {"word": "R", "weight": 4},
-        {"word": "modele predykcyjne", "weight": 5}, {"word": "algorytmy", "weight": 5},
-        {"word": "analiza danych", "weight": 5}, {"word": "przetwarzanie danych", "weight": 4},
-        {"word": "ETL", "weight": 4}, {"word": "dashboard", "weight": 3},
-        {"word": "raporty", "weight": 4}, {"word": "Big Data", "weight": 5},
-        {"word": "Hadoop", "weight": 5}, {"word": "Spark", "weight": 5},
-        {"word": "analityka biznesowa", "weight": 4}, {"word": "insighty", "weight": 3},
-        {"word": "dane sprzedażowe", "weight": 3}, {"word": "prognozowanie", "weight": 5},
-        {"word": "optymalizacja", "weight": 2}, {"word": "bazy danych", "weight": 4},
-        {"word": "machine learning", "weight": 5}, {"word": "analiza rynku", "weight": 3},
-        {"word": "czyszczenie danych", "weight": 2}, {"word": "Google Analytics", "weight": 2},
-        {"word": "KPIs", "weight": 3}, {"word": "modelowanie danych", "weight": 5},
-        {"word": "B1", "weight": 1}, {"word": "B2", "weight": 2},
-        {"word": "C1", "weight": 3}, {"word": "C2", "weight": 4}, {"word": "English", "weight": 1},
-        {"word": "Angielski", "weight": 1}, {"word": "matplotlib", "weight": 4}, {"word": "seaborn", "weight": 4},
-        {"word": "pandas", "weight": 5}, {"word": "numpy", "weight": 5}, {"word": "scikit-learn", "weight": 5},
-        {"word": "Jupyter Notebook", "weight": 3}, {"word": "Apache Spark", "weight": 5},
-        {"word": "Apache Hadoop", "weight": 4}, {"word": "ETL pipelines", "weight": 4},
-        {"word": "TensorFlow", "weight": 5}, {"word": "Keras", "weight": 4},
-        {"word": "PyTorch", "weight": 5}, {"word": "modele regresyjne", "weight": 5},
-        {"word": "klasyfikacja danych", "weight": 4}, {"word": "modelowanie predykcyjne", "weight": 5},
-        {"word": "SQLAlchemy", "weight": 4}, {"word": "DBeaver", "weight": 3}, {"word": "Snowflake", "weight": 4},
-        {"word": "Apache Airflow", "weight": 5}, {"word": "CRM", "weight": 4},
-        {"word": "pipeline danych", "weight": 4}, {"word": "churn prediction", "weight": 4},
-        {"word": "klasyfikacja klientów", "weight": 5}, {"word": "integracja danych", "weight": 4},
-        {"word": "algorytmy AI", "weight": 5}, {"word": "rozmowy z klientami", "weight": 3},
-        {"word": "analiza ruchu internetowego", "weight": 4}, {"word": "modele statystyczne", "weight": 5},
-        {"word": "segmentacja użytkowników", "weight": 4}, {"word": "narzędzia analityczne", "weight": 3},
-        {"word": "raportowanie", "weight": 4}, {"word": "środowiska Big Data", "weight": 5},
-        {"word": "Linux", "weight": 4}, {"word": "IBM SPSS Modeler", "weight": 3},
-        {"word": "Scrum", "weight": 3}, {"word": "Agile", "weight": 3}, {"word": "Jira", "weight": 3},
-        {"word": "Confluence", "weight": 3}, {"word": "statystyka e-commerce", "weight": 5},
-        {"word": "umiejętność analitycznego myślenia", "weight": 4}, {"word": "komunikatywność", "weight": 2},
-        {"word": "praca zespołowa", "weight": 3}
-    ]
-    },
-    {
-    "title": "Kierownik Projektu",
-    "keywords": [
-        {"word": "zarządzanie projektami", "weight": 5}, {"word": "harmonogramy", "weight": 3}, {"word": "budżet", "weight": 5}, {"word": "agile", "weight": 5}, {"word": "scrum", "weight": 5}, {"word": "waterfall", "weight": 2}, {"word": "zarządzanie ryzykiem", "weight": 5}, {"word": "priorytetyzacja", "weight": 3}, {"word": "planowanie", "weight": 4}, {"word": "komunikacja", "weight": 5}, {"word": "zarządzanie zespołem", "weight": 5}, {"word": "stakeholderzy", "weight": 4}, {"word": "analiza wymagań", "weight": 4}, {"word": "cele projektu", "weight": 5}, {"word": "raportowanie", "weight": 3},
-        {"word": "monitoring", "weight": 3}, {"word": "zarządzanie czasem", "weight": 3}, {"word": "zarządzanie zmianą", "weight": 5}, {"word": "leadership", "weight": 5}, {"word": "efektywność", "weight": 4}, {"word": "metodologia", "weight": 4}, {"word": "stand-up", "weight": 2}, {"word": "roadmap", "weight": 2}, {"word": "narzędzia PM", "weight": 4}, {"word": "Jira", "weight": 5}, {"word": "Asana", "weight": 4}, {"word": "MS Project", "weight": 4}, {"word": "change management", "weight": 5}, {"word": "project governance", "weight": 4}, {"word": "stakeholder engagement", "weight": 5}, {"word": "risk assessment", "weight": 5}, {"word": "budget control", "weight": 5},
-        {"word": "time management", "weight": 4}, {"word": "negotiation skills", "weight": 4}, {"word": "project lifecycle", "weight": 4}, {"word": "team collaboration", "weight": 4}, {"word": "resource allocation", "weight": 3}, {"word": "communication plan", "weight": 4}, {"word": "process optimization", "weight": 4}, {"word": "conflict resolution", "weight": 3}, {"word": "KPI tracking", "weight": 4}, {"word": "milestone management", "weight": 3}, {"word": "Lean methodology", "weight": 3}, {"word": "Six Sigma", "weight": 3}, {"word": "critical path method (CPM)", "weight": 2}, {"word": "project documentation", "weight": 4}, {"word": "SCRUM Master", "weight": 4},
-        {"word": "user stories", "weight": 3}, {"word": "issue tracking", "weight": 3}, {"word": "performance metrics", "weight": 4}, {"word": "cross-functional teams", "weight": 4}, {"word": "PRINCE2", "weight": 4}, {"word": "Kanban", "weight": 3}, {"word": "Gantt charts", "weight": 2}, {"word": "OKRs (Objectives and Key Results)", "weight": 4}, {"word": "B1", "weight": 1}, {"word": "B2", "weight": 2}, {"word": "C1", "weight": 3}, {"word": "C2", "weight": 4}, {"word": "English", "weight": 1}, {"word": "Angielski", "weight": 1}
-    ]
-    },
-
-    {
-    "title": "Copywriter",
-    "keywords": [
-        {"word": "SEO", "weight": 5}, {"word": "optymalizacja tresci", "weight": 5},
-        {"word": "copywriting", "weight": 5}, {"word": "marketing tresci", "weight": 4},
-        {"word": "artykuly", "weight": 4}, {"word": "blogi", "weight": 4},
-        {"word": "storytelling", "weight": 5}, {"word": "kreatywne pisanie", "weight": 4},
-        {"word": "redagowanie", "weight": 4}, {"word": "social media", "weight": 4},
-        {"word": "CTA", "weight": 3}, {"word": "reklama", "weight": 4},
-        {"word": "edytowanie", "weight": 4}, {"word": "jezyk", "weight": 4},
-        {"word": "tresc", "weight": 4}, {"word": "analiza konkurencji", "weight": 4},
-        {"word": "Google Analytics", "weight": 4}, {"word": "Ahrefs", "weight": 4},
-        {"word": "Google Search Console", "weight": 4}, {"word": "targetowanie", "weight": 3},
-        {"word": "UX writing", "weight": 4}, {"word": "optymalizacja slow kluczowych", "weight": 5},
-        {"word": "analiza odbiorcow", "weight": 3}, {"word": "lekkie pioro", "weight": 4},
-        {"word": "korekta tekstow", "weight": 4}, {"word": "MS Office", "weight": 3},
-        {"word": "JIRA", "weight": 3}, {"word": "Confluence", "weight": 3},
-        {"word": "HTML", "weight": 3}, {"word": "research", "weight": 4},
-        {"word": "ortografia", "weight": 3}, {"word": "interpunkcja", "weight": 3},
-        {"word": "kreatywnosc", "weight": 3}, {"word": "terminowosc", "weight": 3},
-        {"word": "organizacja pracy", "weight": 3}, {"word": "perswazja", "weight": 3},
-        {"word": "uwaznosc na detale", "weight": 3}, {"word": "psychologia", "weight": 2},
-        {"word": "socjologia", "weight": 2}, {"word": "empatia", "weight": 2},
-        {"word": "tresci reklamowe", "weight": 4}, {"word": "call to action", "weight": 3},
-        {"word": "kampanie reklamowe", "weight": 4}, {"word": "opisy produktow", "weight": 4},
-        {"word": "hasla reklamowe", "weight": 3}, {"word": "newslettery", "weight": 3},
-        {"word": "e-booki", "weight": 3}, {"word": "projektowanie bannerow", "weight": 3},
-        {"word": "jezyk angielski", "weight": 3}, {"word": "jezyk polski", "weight": 3}
-    ]
-    },
-    {
-    "title": "Specjalista ds. marketingu",
-    "keywords": [
-        {"word": "marketing cyfrowy", "weight": 5}, {"word": "SEO", "weight": 5},
-        {"word": "SEM", "weight": 5}, {"word": "Google Ads", "weight": 4},
-        {"word": "Facebook Ads", "weight": 4}, {"word": "social media", "weight": 4},
-        {"word": "kampanie reklamowe", "weight": 4}, {"word": "content marketing", "weight": 4},
-        {"word": "Google Analytics", "weight": 5}, {"word": "email marketing", "weight": 4},
-        {"word": "automatyzacja marketingu", "weight": 4}, {"word": "analiza rynku", "weight": 4},
-        {"word": "remarketing", "weight": 4}, {"word": "lead generation", "weight": 5},
-        {"word": "strategia SEO", "weight": 5}, {"word": "zarzadzanie budzetem", "weight": 4},
-        {"word": "A/B testing", "weight": 5}, {"word": "UX", "weight": 3},
-        {"word": "tworzenie tresci", "weight": 4}, {"word": "copywriting", "weight": 4},
-        {"word": "Salesforce", "weight": 4}, {"word": "Salesmanago", "weight": 4},
-        {"word": "kampanie PPC", "weight": 5}, {"word": "branding", "weight": 4},
-        {"word": "projektowanie landing pages", "weight": 4}, {"word": "HTML", "weight": 3},
-        {"word": "CMS", "weight": 4}, {"word": "Corel Draw", "weight": 3},
-        {"word": "Adobe Photoshop", "weight": 3}, {"word": "Google Tag Manager", "weight": 4},
-        {"word": "analiza odbiorcow", "weight": 4}, {"word": "media planowanie", "weight": 4},
-        {"word": "strategia marketingowa", "weight": 5}, {"word": "optymalizacja", "weight": 5},
-        {"word": "perswazja", "weight": 3}, {"word": "kreatywnosc", "weight": 3},
-        {"word": "zarzadzanie zespolem", "weight": 3}, {"word": "Wordpress", "weight": 4},
-        {"word": "B2", "weight": 2}, {"word": "C1", "weight": 3},
-        {"word": "angielski", "weight": 1}, {"word": "english", "weight": 1}
-    ],
-    },
-    {
-    "title": "Administrator Sieci",
-    "keywords": [
-        {"word": "sieci komputerowe", "weight": 5}, {"word": "protokoły", "weight": 5},
-        {"word": "TCP/IP", "weight": 5}, {"word": "DNS", "weight": 4},
-        {"word": "DHCP", "weight": 4}, {"word": "routing", "weight": 4},
-        {"word": "VPN", "weight": 5}, {"word": "bezpieczenstwo", "weight": 5},
-        {"word": "firewalle", "weight": 5}, {"word": "zarzadzanie siecia", "weight": 5},
-        {"word": "konfiguracja", "weight": 4}, {"word": "LAN", "weight": 4},
-        {"word": "WAN", "weight": 4}, {"word": "zarzadzanie serwerami", "weight": 5},
-        {"word": "backup", "weight": 4}, {"word": "monitoring sieci", "weight": 4},
-        {"word": "roziazywanie problemow", "weight": 4}, {"word": "load balancing", "weight": 4},
-        {"word": "NAT", "weight": 3}, {"word": "VLAN", "weight": 3},
-        {"word": "QoS", "weight": 3}, {"word": "SNMP", "weight": 3},
-        {"word": "Wi-Fi", "weight": 4}, {"word": "urzadzenia sieciowe", "weight": 4},
-        {"word": "Cisco", "weight": 5}, {"word": "Juniper", "weight": 4},
-        {"word": "Mikrotik", "weight": 4}, {"word": "przelaczniki", "weight": 4},
-        {"word": "routery", "weight": 4}, {"word": "topologia sieci", "weight": 4},
-        {"word": "systemy redundantne", "weight": 5}, {"word": "HA", "weight": 5},
-        {"word": "IPSec", "weight": 4}, {"word": "Ethernet", "weight": 4},
-        {"word": "802.11", "weight": 3}, {"word": "MPLS", "weight": 3},
-        {"word": "IP", "weight": 4}, {"word": "IPv6", "weight": 4},
-        {"word": "zarzadzanie dostepem", "weight": 5}, {"word": "kontrola przeplywu", "weight": 4},
-        {"word": "proxy", "weight": 3}, {"word": "IDS/IPS", "weight": 4},
-        {"word": "SIEM", "weight": 4}, {"word": "zarzadzanie urzadzeniami", "weight": 4},
-        {"word": "PowerShell", "weight": 4}, {"word": "Bash", "weight": 4},
-        {"word": "automatyzacja", "weight": 5}, {"word": "monitorowanie ruchu", "weight": 4},
-        {"word": "Ansible", "weight": 4}, {"word": "Kubernetes", "weight": 4},
-        {"word": "AWS", "weight": 4}, {"word": "Azure", "weight": 4},
-        {"word": "GCP", "weight": 4}, {"word": "Active Directory", "weight": 4},
-        {"word": "SolarWinds", "weight": 4}, {"word": "Nagios", "weight": 4},
-        {"word": "Wireshark", "weight": 4}, {"word": "VoIP", "weight": 3},
-        {"word": "SSL/TLS", "weight": 3}, {"word": "certyfikaty", "weight": 3},
-        {"word": "praca zespolowa", "weight": 2}, {"word": "Python", "weight": 4},
-        {"word": "zarzadzanie infrastruktura", "weight": 5}, {"word": "macierzystosc", "weight": 3},
-        {"word": "zarzadzanie tozsamoscia", "weight": 4}, {"word": "kontrola dostepu", "weight": 5},
-        {"word": "Cybersecurity", "weight": 5}, {"word": "Linux", "weight": 4},
-        {"word": "Windows Server", "weight": 4}, {"word": "Hyper-V", "weight": 3},
-        {"word": "VMware", "weight": 4}, {"word": "Docker", "weight": 4},
-        {"word": "przepustowosc", "weight": 3}, {"word": "DevOps", "weight": 4},
-        {"word": "chmura hybrydowa", "weight": 4}, {"word": "zdalny dostep", "weight": 4},
-        {"word": "English", "weight": 1}, {"word": "angielski", "weight": 2}
-    ]
-},
-    {
-    "title": "Specjalista HR",
-    "keywords": [
-        {"word": "rekrutacja", "weight": 5}, {"word": "onboarding", "weight": 5},
-        {"word": "rozwijanie pracownikow", "weight": 4}, {"word": "rozmowy kwalifikacyjne", "weight": 4},
-        {"word": "ocena pracownikow", "weight": 4}, {"word": "szkolenia", "weight": 4},
-        {"word": "employer branding", "weight": 5}, {"word": "zarzadzanie talentami", "weight": 5},
-        {"word": "benefity", "weight": 4}, {"word": "kultura organizacyjna", "weight": 4},
-        {"word": "HRIS", "weight": 4}, {"word": "umowy", "weight": 3},
-        {"word": "planowanie zatrudnienia", "weight": 5}, {"word": "rotacja pracownikow", "weight": 4},
-        {"word": "analiza kompetencji", "weight": 4}, {"word": "zaangazowanie pracownikow", "weight": 4},
-        {"word": "raporty HR", "weight": 4}, {"word": "KPI", "weight": 4},
-        {"word": "prawo pracy", "weight": 4}, {"word": "wynagrodzenia", "weight": 3},
-        {"word": "programy motywacyjne", "weight": 4}, {"word": "feedback", "weight": 4},
-        {"word": "rozwijanie liderow", "weight": 5}, {"word": "zarzadzanie konfliktem", "weight": 3},
-        {"word": "eventy integracyjne", "weight": 3}, {"word": "systemy kadrowo-placowe", "weight": 4},
-        {"word": "succession planning", "weight": 4}, {"word": "talent acquisition", "weight": 4},
-        {"word": "rozwoj liderow", "weight": 5}, {"word": "komunikacja wewnetrzna", "weight": 3},
-        {"word": "planowanie szkoleń", "weight": 4}, {"word": "raportowanie HR", "weight": 4},
-        {"word": "retencja pracownikow", "weight": 4}, {"word": "zarzadzanie zespolami", "weight": 3},
-        {"word": "analiza danych HR", "weight": 4}, {"word": "prawa zatrudnienia", "weight": 3},
-        {"word": "zarzadzanie benefitami", "weight": 4}, {"word": "work-life balance", "weight": 3},
-        {"word": "strategia employer brandingowa", "weight": 4}, {"word": "zarzadzanie talentami", "weight": 5},
-        {"word": "B1", "weight": 1}, {"word": "B2", "weight": 2},
-        {"word": "C1", "weight": 3}, {"word": "C2", "weight": 4}, {"word": "English", "weight": 1},
-        {"word": "Angielski", "weight": 1}, {"word": "Word", "weight": 3}, {"word": "Excel", "weight": 3}, {"word": "HR", "weight": 2}
-        ]
-        },
-    {
-    "title": "Księgowy",
-    "keywords": [
-        {"word": "rachunkowosc", "weight": 5}, {"word": "ksiegi rachunkowe", "weight": 4},
-        {"word": "podatki", "weight": 5}, {"word": "VAT", "weight": 4},
-        {"word": "PIT", "weight": 4}, {"word": "CIT", "weight": 4},
-        {"word": "bilans", "weight": 4}, {"word": "sprawozdania finansowe", "weight": 4},
-        {"word": "budzetowanie", "weight": 5}, {"word": "kontrola kosztow", "weight": 4},
-        {"word": "SAP", "weight": 4}, {"word": "audyt", "weight": 4},
-        {"word": "Excel", "weight": 4}, {"word": "raportowanie", "weight": 4},
-        {"word": "analiza kosztow", "weight": 4}, {"word": "rozliczenia", "weight": 4},
-        {"word": "fakturowanie", "weight": 4}, {"word": "amortyzacja", "weight": 3},
-        {"word": "prognozowanie finansowe", "weight": 4}, {"word": "zgodnosc podatkowa", "weight": 4},
-        {"word": "kontrole wewnetrzne", "weight": 4}, {"word": "analiza wydatkow", "weight": 4},
-        {"word": "bilansowanie", "weight": 4}, {"word": "systemy ERP", "weight": 4},
-        {"word": "Cash Flow", "weight": 5}, {"word": "zobowiazania", "weight": 3},
-        {"word": "naleznosci", "weight": 3}, {"word": "ksiegowosc zarzadcza", "weight": 4},
-        {"word": "analiza finansowa", "weight": 5}, {"word": "zgodnosc regulacyjna", "weight": 5},
-        {"word": "optymalizacja podatkowa", "weight": 4}, {"word": "VAT-UE", "weight": 4},
-        {"word": "koszt jednostkowy", "weight": 3}, {"word": "QuickBooks", "weight": 4},
-        {"word": "bank reconciliations", "weight": 4}, {"word": "financial reporting", "weight": 5},
-        {"word": "tax compliance", "weight": 5}, {"word": "accounts payable", "weight": 4},
-        {"word": "accounts receivable", "weight": 4}, {"word": "budgeting and forecasting", "weight": 5}, 
-        {"word": "financial analysis", "weight": 5},
-        {"word": "internal audits", "weight": 4}, {"word": "revenue recognition", "weight": 4},
-        {"word": "cost accounting", "weight": 4}, {"word": "data entry", "weight": 3},
-        {"word": "tax returns", "weight": 4}, {"word": "depreciation schedules", "weight": 3},
-        {"word": "compliance monitoring", "weight": 4}, {"word": "auditing", "weight": 4},
-        {"word": "financial planning", "weight": 4}, {"word": "financial statements", "weight": 4},
-        {"word": "SAP FI/CO", "weight": 4}, {"word": "Oracle Financials", "weight": 4},
-        {"word": "Xero", "weight": 4}, {"word": "payroll", "weight": 3},
-        {"word": "regulatory compliance", "weight": 4}, {"word": "C1", "weight": 3},
-        {"word": "C2", "weight": 4}, {"word": "English", "weight": 1}, 
-        {"word": "Angielski", "weight": 1}
-    ]
-    }, 
-    {
-    "title": "Kierownik Sprzedaży",
-    "keywords": [
-        {"word": "sprzedaz", "weight": 5}, {"word": "zarzadzanie klientami", "weight": 5},
-        {"word": "KPI", "weight": 5}, {"word": "negocjacje", "weight": 5},
-        {"word": "CRM", "weight": 5}, {"word": "budowanie relacji", "weight": 5},
-        {"word": "lead generation", "weight": 5}, {"word": "strategia sprzedazy", "weight": 5},
-        {"word": "targety", "weight": 4}, {"word": "raportowanie", "weight": 4},
-        {"word": "prezentacje", "weight": 4}, {"word": "prognozy sprzedazy", "weight": 4},
-        {"word": "analizy", "weight": 4}, {"word": "pipeline sprzedazy", "weight": 5},
-        {"word": "pozyskiwanie klientow", "weight": 5}, {"word": "zarzadzanie zespolem", "weight": 5},
-        {"word": "follow-up", "weight": 4}, {"word": "utrzymanie klienta", "weight": 5},
-        {"word": "marketing sprzedazowy", "weight": 4}, {"word": "wspolpraca z partnerami", "weight": 4},
-        {"word": "networking", "weight": 4}, {"word": "analiza rynku", "weight": 4},
-        {"word": "sprzedaz B2B", "weight": 5}, {"word": "sprzedaz B2C", "weight": 5},
-        {"word": "budzetowanie", "weight": 4}, {"word": "rozwoj zespolu sprzedazowego", "weight": 5},
-        {"word": "motywacja zespolu", "weight": 4}, {"word": "cross-selling", "weight": 4},
-        {"word": "upselling", "weight": 4}, {"word": "analiza konkurencji", "weight": 4},
-        {"word": "customer success", "weight": 4}, {"word": "sales forecasting", "weight": 4},
-        {"word": "churn prevention", "weight": 4}, {"word": "AI-driven sales tools", "weight": 4},
-        {"word": "hybrid sales model", "weight": 4}, {"word": "social selling", "weight": 4},
-        {"word": "value-based pricing", "weight": 4}, {"word": "customer satisfaction", "weight": 4},
-        {"word": "incentive programs", "weight": 4}, {"word": "market share", "weight": 4},
-        {"word": "czas zarzadzania", "weight": 3}, {"word": "praca zespolowa", "weight": 3},
-        {"word": "B1", "weight": 1}, {"word": "B2", "weight": 2},
-        {"word": "C1", "weight": 3}, {"word": "C2", "weight": 4}, {"word": "English", "weight": 1},
-        {"word": "Angielski", "weight": 1}
-    ]
-},
-    {
-    "title": "DevOps Engineer",
-    "keywords": [
-        {"word": "CI/CD", "weight": 5}, {"word": "Docker", "weight": 5},
-        {"word": "Kubernetes", "weight": 5}, {"word": "Jenkins", "weight": 4},
-        {"word": "automation", "weight": 5}, {"word": "monitoring", "weight": 3},
-        {"word": "infrastructure", "weight": 5}, {"word": "AWS", "weight": 5},
-        {"word": "Azure", "weight": 5}, {"word": "GCP", "weight": 5},
-        {"word": "cloud", "weight": 4}, {"word": "scripts", "weight": 5},
-        {"word": "Ansible", "weight": 5}, {"word": "Terraform", "weight": 5},
-        {"word": "OpenShift", "weight": 4}, {"word": "DevSecOps", "weight": 4},
-        {"word": "log management", "weight": 4}, {"word": "containers", "weight": 5},
-        {"word": "version control", "weight": 4}, {"word": "code promotion", "weight": 4},
-        {"word": "load balancing", "weight": 4}, {"word": "TDD", "weight": 5},
-        {"word": "GitOps", "weight": 5}, {"word": "deployment management", "weight": 5},
-        {"word": "pipelines", "weight": 4}, {"word": "observability", "weight": 4},
-        {"word": "Linux", "weight": 5}, {"word": "Python", "weight": 5},
-        {"word": "Bash", "weight": 5}, {"word": "Prometheus", "weight": 4},
-        {"word": "Grafana", "weight": 4}, {"word": "system security", "weight": 4},
-        {"word": "ELK", "weight": 4}, {"word": "microservices", "weight": 5},
-        {"word": "CloudFormation", "weight": 4}, {"word": "CodePipeline", "weight": 4},
-        {"word": "cost optimization", "weight": 4}, {"word": "Agile", "weight": 3},
-        {"word": "team collaboration", "weight": 3}, {"word": "problem solving", "weight": 3},
-        {"word": "time management", "weight": 3}, {"word": "English", "weight": 1},
-        {"word": "angielski", "weight": 1}, {"word": "B1", "weight": 1},
-        {"word": "B2", "weight": 2}, {"word": "C1", "weight": 3},
-        {"word": "C2", "weight": 4}, {"word": "NGINX", "weight": 4},
-        {"word": "Apache", "weight": 4}, {"word": "HTTP/HTTPS", "weight": 4},
-        {"word": "reverse proxy", "weight": 4}, {"word": "CI/CD pipelines", "weight": 4},
-        {"word": "cloud automation", "weight": 4}, {"word": "orchestration", "weight": 4},
-        {"word": "scalability", "weight": 4}, {"word": "fault tolerance", "weight": 2},
-        {"word": "cloud-native", "weight": 5}, {"word": "distributed systems", "weight": 3},
-        {"word": "infrastructure as code", "weight": 5}, {"word": "IaC", "weight": 5},
-        {"word": "serverless", "weight": 4}, {"word": "Lambda", "weight": 4},
-        {"word": "S3", "weight": 4}, {"word": "EC2", "weight": 4},
-        {"word": "CloudTrail", "weight": 4}, {"word": "IAM", "weight": 4},
-        {"word": "debugging", "weight": 4}, {"word": "incident response", "weight": 4},
-        {"word": "service mesh", "weight": 4}, {"word": "Istio", "weight": 3},
-        {"word": "distributed tracing", "weight": 4}, {"word": "Jaeger", "weight": 3},
-        {"word": "service discovery", "weight": 4}, {"word": "Helm", "weight": 3},
-        {"word": "artifacts", "weight": 2}, {"word": "k8s", "weight": 5},
-        {"word": "deployment automation", "weight": 2}, {"word": "logging", "weight": 4},
-        {"word": "Zabbix", "weight": 2}, {"word": "new relic", "weight": 2},
-        {"word": "postmortems", "weight": 3}, {"word": "blameless culture", "weight": 1},
-        {"word": "APIs", "weight": 4}, {"word": "SLA", "weight": 4},
-        {"word": "SLI", "weight": 4}, {"word": "SLO", "weight": 4}
-    ]
-},
-    {
-    "title": "Nauczyciel",
-    "keywords": [
-        {"word": "nauczanie", "weight": 5}, {"word": "pedagogika", "weight": 5},
-        {"word": "lekcje", "weight": 4}, {"word": "programy", "weight": 4},
-        {"word": "testy", "weight": 4}, {"word": "egzaminy", "weight": 4},
-        {"word": "dydaktyka", "weight": 5}, {"word": "e-learning", "weight": 5},
-        {"word": "zarzadzanie", "weight": 4}, {"word": "metody", "weight": 4},
-        {"word": "edukacja", "weight": 5}, {"word": "oceny", "weight": 4},
-        {"word": "technologia", "weight": 4}, {"word": "materialy", "weight": 4},
-        {"word": "interakcja", "weight": 4}, {"word": "planowanie", "weight": 4},
-        {"word": "mentoring", "weight": 4}, {"word": "kreatywnosc", "weight": 3},
-        {"word": "adaptacja", "weight": 4}, {"word": "gry", "weight": 3},
-        {"word": "pomoc", "weight": 3}, {"word": "komunikacja", "weight": 3},
-        {"word": "zarzadzanie czasem", "weight": 3}, {"word": "Excel", "weight": 3},
-        {"word": "Word", "weight": 3}, {"word": "PowerPoint", "weight": 3},
-        {"word": "teaching", "weight": 5}, {"word": "lesson plans", "weight": 4},
-        {"word": "grading", "weight": 4}, {"word": "classroom", "weight": 4},
-        {"word": "learning", "weight": 5}, {"word": "materials", "weight": 4},
-        {"word": "students", "weight": 5}, {"word": "assessments", "weight": 4},
-        {"word": "innovation", "weight": 4}, {"word": "technology", "weight": 4},
-        {"word": "feedback", "weight": 4}, {"word": "collaboration", "weight": 3},
-        {"word": "time management", "weight": 3}, {"word": "planning", "weight": 4},
-        {"word": "mentorship", "weight": 4}, {"word": "online tools", "weight": 4},
-        {"word": "English", "weight": 3}, {"word": "angielski", "weight": 3},
-        {"word": "B1", "weight": 1}, {"word": "B2", "weight": 2},
-        {"word": "C1", "weight": 3}, {"word": "C2", "weight": 4}
-        ]
-    },
-
-    {
-    "title": "Specjalista Wsparcia IT",
-    "keywords": [
-        {"word": "wsparcie", "weight": 5}, {"word": "helpdesk", "weight": 5},
-        {"word": "systemy operacyjne", "weight": 5}, {"word": "rozwiązywanie problemów", "weight": 5},
-        {"word": "hardware", "weight": 5}, {"word": "software", "weight": 4},
-        {"word": "serwis", "weight": 4}, {"word": "konfiguracja", "weight": 5},
-        {"word": "zarządzanie urządzeniami", "weight": 4}, {"word": "dokumentacja", "weight": 4},
-        {"word": "usuwanie awarii", "weight": 5}, {"word": "aktualizacje systemowe", "weight": 4},
-        {"word": "instalacja oprogramowania", "weight": 5}, {"word": "ITIL", "weight": 5},
-        {"word": "zarządzanie użytkownikami", "weight": 4}, {"word": "telekomunikacja", "weight": 4},
-        {"word": "VPN", "weight": 4}, {"word": "sieci komputerowe", "weight": 5},
-        {"word": "zabezpieczenia", "weight": 4}, {"word": "diagnostyka", "weight": 5},
-        {"word": "Active Directory", "weight": 5}, {"word": "zarządzanie hasłami", "weight": 4},
-        {"word": "patch management", "weight": 4}, {"word": "backup", "weight": 4},
-        {"word": "zarządzanie dostępem", "weight": 4}, {"word": "Microsoft Office", "weight": 4},
-        {"word": "sieci LAN/WAN", "weight": 5}, {"word": "zarządzanie incydentami", "weight": 4},
-        {"word": "PowerShell", "weight": 4}, {"word": "Bash", "weight": 4},
-        {"word": "zdalne wsparcie", "weight": 5}, {"word": "zdalny dostęp", "weight": 4},
-        {"word": "komunikatywnosc", "weight": 3}, {"word": "czas reakcji", "weight": 4},
-        {"word": "zarządzanie zadaniami", "weight": 3}, {"word": "czas realizacji", "weight": 4},
-        {"word": "cyberbezpieczenstwo", "weight": 5}, {"word": "obsługa klienta", "weight": 3},
-        {"word": "protokoly sieciowe", "weight": 4}, {"word": "TCP/IP", "weight": 4},
-        {"word": "firewall", "weight": 4}, {"word": "monitoring systemów", "weight": 4},
-        {"word": "wirtualizacja", "weight": 4}, {"word": "VMware", "weight": 4},
-        {"word": "Hyper-V", "weight": 4}, {"word": "zgłoszenia serwisowe", "weight": 5},
-        {"word": "angielski", "weight": 1}, {"word": "English", "weight": 1},
-        {"word": "B1", "weight": 1}, {"word": "B2", "weight": 2},
-        {"word": "C1", "weight": 3}, {"word": "C2", "weight": 4}
-        ]
-    },
-
-    ]
-
-    for pos in default_positions:
-        if not Position.query.filter_by(title=pos["title"], is_default=True).first():
-            position = Position(title=pos["title"], is_default=True)
-            db.session.add(position)
-            db.session.commit()
 
-            for keyword in pos["keywords"]:
-                if not Keyword.query.filter_by(word=keyword["word"], position_id=position.id).first():
-                    kw = Keyword(
-                        word=keyword["word"],
-                        weight=keyword["weight"],
-                        position_id=position.id,
-                    )
-                    db.session.add(kw)
+def fail_analysis_job(job_id, error):
+    from models import AnalysisJob
 
+    job = db.session.get(AnalysisJob, job_id)
+    if job.status != "pending":
+        return
+    job.status = "error"
+    job.error = error
+    job.finished_at = datetime.utcnow()
     db.session.commit()
 
+
+def expire_analysis_jobs(timeout, job_id=None):
+    # Zadanie istnieje tylko jako future w procesie gunicorna, który je przyjął. Po restarcie procesu
+    # (wdrożenie, max_requests, awaria) zostałoby "pending" na zawsze - po timeout sekundach jest błędem.
+    from models import AnalysisJob
+
+    now = datetime.utcnow()
+    query = AnalysisJob.query.filter(
+        AnalysisJob.status == "pending", AnalysisJob.created_at < now - timedelta(seconds=timeout)
+    )
+    if job_id is not None:
+        query = query.filter(AnalysisJob.id == job_id)
+    expired = query.update({
+        "status": "error",
+        "error": "Analiza została przerwana, prześlij plik ponownie.",
+        "finished_at": now
+    }, synchronize_session=False)
+    db.session.commit()
+    return expired
+
+
 if __name__ == "__main__":
     app = create_app()
     app.run(debug=True) 
\ No newline at end of file
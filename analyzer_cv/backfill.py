@@ -0,0 +1,278 @@
+import threading
+import time
+import uuid
+from datetime import datetime, timedelta
+
+from sqlalchemy import func, insert, update
+
+from jobs import map_in_pool
+from rescoring import points_subquery
+from scoring import KeywordMatcher
+from whatif import invalidate_position_matrix
+
+ACTIVE_STATUSES = ("pending", "running")
+
+
+def count_keywords(words, texts):
+    # Uruchamiane w procesie puli - bez dostępu do bazy, tylko tekst na wejściu
+    from app import remove_diacritics, normalize_keyword
+
+    matcher = KeywordMatcher(words, normalize_keyword)
+    return [
+        (candidate_id, matcher.count(remove_diacritics(cv_text or "").lower()))
+        for candidate_id, cv_text in texts
+    ]
+
+
+def candidate_scope(position):
+    from models import Candidate
+
+    # Stanowisko użytkownika widzi jego kandydatów, stanowisko bez właściciela - wszystkich
+    query = Candidate.query
+    if position.user_id is not None:
+        query = query.filter(
+            (Candidate.user_id == position.user_id) | (Candidate.position_id == position.id)
+        )
+    return query
+
+
+def backfill_scope(position, keyword_ids):
+    from app import db
+    from models import Candidate, CandidateScore
+
+    scope = candidate_scope(position)
+    if keyword_ids is not None:
+        # Nowe słowa istniejącego stanowiska - tylko kandydaci, którzy mają już dla niego wynik
+        scored_ids = db.session.query(CandidateScore.candidate_id).filter(CandidateScore.position_id == position.id)
+        scope = scope.filter((Candidate.position_id == position.id) | Candidate.id.in_(scored_ids))
+    return scope
+
+
+def parse_keyword_ids(value):
+    return None if value is None else [int(keyword_id) for keyword_id in value.split(",") if keyword_id]
+
+
+def start_backfill(app, position_id, keyword_ids=None):
+    # keyword_ids=None: nowe stanowisko, wszystkie słowa; lista: tylko te słowa są szukane w tekstach
+    from app import db
+    from models import BackfillJob, Candidate, Position
+
+    position = db.session.get(Position, position_id)
+
+    # Nowe zadanie zastępuje trwające i przejmuje ich słowa - przerwane zadanie nie może zgubić
+    # słów, których jeszcze nie przeliczyło
+    active = BackfillJob.query.filter(
+        BackfillJob.position_id == position_id, BackfillJob.status.in_(ACTIVE_STATUSES)
+    )
+    for previous in active:
+        if keyword_ids is None or previous.keyword_ids is None:
+            keyword_ids = None
+        else:
+            keyword_ids = set(keyword_ids) | set(parse_keyword_ids(previous.keyword_ids))
+    active.update({"status": "cancelled", "finished_at": datetime.utcnow()}, synchronize_session=False)
+
+    total, max_candidate_id = backfill_scope(position, keyword_ids).with_entities(
+        func.count(Candidate.id), func.max(Candidate.id)
+    ).one()
+    job = BackfillJob(
+        id=uuid.uuid4().hex,
+        position_id=position_id,
+        total=total,
+        max_candidate_id=max_candidate_id or 0,
+        keyword_ids=None if keyword_ids is None else ",".join(str(keyword_id) for keyword_id in sorted(keyword_ids))
+    )
+    db.session.add(job)
+    db.session.commit()
+
+    launch_backfill(app, job.id)
+    return job
+
+
+def launch_backfill(app, job_id):
+    thread = threading.Thread(target=run_backfill, args=(app, job_id), daemon=True)
+    thread.start()
+    return thread
+
+
+def resume_backfills(app):
+    from models import BackfillJob
+
+    # Zadania przerwane restartem - przejmuje je proces, który pierwszy uzna je za porzucone
+    job_ids = [
+        job_id for job_id, in BackfillJob.query.with_entities(BackfillJob.id)
+        .filter(BackfillJob.status.in_(ACTIVE_STATUSES))
+    ]
+    for job_id in job_ids:
+        launch_backfill(app, job_id)
+    return job_ids
+
+
+def claim_backfill(job_id, stale_seconds):
+    from app import db
+    from models import BackfillJob
+
+    now = datetime.utcnow()
+    claimed = BackfillJob.query.filter(
+        BackfillJob.id == job_id,
+        (BackfillJob.status == "pending")
+        | ((BackfillJob.status == "running") & (BackfillJob.updated_at < now - timedelta(seconds=stale_seconds)))
+    ).update({"status": "running", "updated_at": now}, synchronize_session=False)
+    db.session.commit()
+    return claimed == 1
+
+
+def run_backfill(app, job_id):
+    from app import db
+    from models import BackfillJob
+
+    with app.app_context():
+        stale_seconds = app.config["BACKFILL_STALE_SECONDS"]
+        while not claim_backfill(job_id, stale_seconds):
+            status = db.session.query(BackfillJob.status).filter_by(id=job_id).scalar()
+            if status not in ACTIVE_STATUSES:
+                return
+            time.sleep(stale_seconds / 4)
+
+        try:
+            backfill_position(app, job_id)
+        except Exception as e:
+            db.session.rollback()
+            BackfillJob.query.filter_by(id=job_id, status="running").update(
+                {"status": "error", "error": str(e), "finished_at": datetime.utcnow()},
+                synchronize_session=False
+            )
+            db.session.commit()
+            app.logger.exception("Backfill %s przerwany", job_id)
+
+
+def backfill_position(app, job_id):
+    from app import db
+    from models import BackfillJob, Candidate, Keyword, Position
+
+    job = db.session.get(BackfillJob, job_id)
+    position = db.session.get(Position, job.position_id)
+    keyword_ids = parse_keyword_ids(job.keyword_ids)
+    # Migawka (id, słowo) - obiekty ORM wygasają po commit i mogłyby wczytać słowo zmienione w trakcie
+    query = db.session.query(Keyword.id, Keyword.word).filter(Keyword.position_id == job.position_id)
+    if keyword_ids is not None:
+        query = query.filter(Keyword.id.in_(keyword_ids))
+    keywords = query.order_by(Keyword.id).all()
+    words = [keyword.word for keyword in keywords]
+    batch_size = app.config["BACKFILL_BATCH_SIZE"]
+    scope = backfill_scope(position, keyword_ids).filter(Candidate.id <= job.max_candidate_id)
+    cursor = job.last_candidate_id
+
+    # Wszystkie słowa częściowego zadania usunięto w międzyczasie - nie ma czego szukać
+    while keywords or keyword_ids is None:
+        # Po jednej paczce na proces puli; postęp zapisywany po każdej paczce
+        chunks = []
+        for _ in range(app.config["ANALYSIS_WORKERS"]):
+            rows = (
+                scope.filter(Candidate.id > cursor)
+                .with_entities(Candidate.id, Candidate.position_id, Candidate.cv_text)
+                .order_by(Candidate.id)
+                .limit(batch_size)
+                .all()
+            )
+            if not rows:
+                break
+            chunks.append(rows)
+            cursor = rows[-1][0]
+        db.session.commit()
+        if not chunks:
+            break
+
+        futures = map_in_pool(
+            app, count_keywords,
+            [(words, [(candidate_id, cv_text) for candidate_id, _, cv_text in rows]) for rows in chunks]
+        )
+        for rows, future in zip(chunks, futures):
+            own_ids = [candidate_id for candidate_id, position_id, _ in rows if position_id == job.position_id]
+            save_backfill_chunk(job.position_id, keywords, future.result(), own_ids, keyword_ids is None)
+
+            progressed = BackfillJob.query.filter_by(id=job_id, status="running").update({
+                "last_candidate_id": rows[-1][0],
+                "processed": BackfillJob.processed + len(rows),
+                "updated_at": datetime.utcnow()
+            }, synchronize_session=False)
+            if not progressed:
+                # Zadanie anulowane albo stanowisko usunięte w trakcie
+                db.session.rollback()
+                return
+            db.session.commit()
+
+    BackfillJob.query.filter_by(id=job_id, status="running").update(
+        {"status": "done", "finished_at": datetime.utcnow(), "updated_at": datetime.utcnow()},
+        synchronize_session=False
+    )
+    db.session.commit()
+    # Inne procesy wykryją zmianę po stanie zadania w odcisku macierzy (whatif.position_fingerprint)
+    invalidate_position_matrix(job.position_id)
+
+
+def save_backfill_chunk(position_id, keywords, results, own_ids, all_keywords=True):
+    from app import db
+    from models import Candidate, CandidateScore, KeywordHit
+
+    # Paczka zapisuje tylko trafienia; punkty liczy SQL z bieżącymi wagami, tak jak rescore_position,
+    # więc zmiana samych wag w trakcie backfillu nie jest nadpisywana starymi wartościami
+    candidate_ids = [candidate_id for candidate_id, _ in results]
+    scored_ids = {
+        candidate_id for candidate_id, in db.session.query(CandidateScore.candidate_id).filter(
+            CandidateScore.candidate_id.in_(candidate_ids), CandidateScore.position_id == position_id
+        )
+    }
+    hit_rows = [
+        {"candidate_id": candidate_id, "keyword_id": keyword.id, "count": counts[keyword.word]}
+        for candidate_id, counts in results for keyword in keywords if counts[keyword.word]
+    ]
+
+    if keywords:
+        KeywordHit.query.filter(
+            KeywordHit.candidate_id.in_(candidate_ids),
+            KeywordHit.keyword_id.in_([keyword.id for keyword in keywords])
+        ).delete(synchronize_session=False)
+
+    if hit_rows:
+        db.session.execute(insert(KeywordHit), hit_rows)
+    # Kandydaci bez wyniku dla stanowiska (starsi niż ono) trafiają do jego rankingu;
+    # istniejące wiersze zachowują swoje in_ranking - wynik z przesłania nie dopisuje kandydata do rankingu
+    new_rows = [
+        {"candidate_id": candidate_id, "position_id": position_id, "points": 0, "in_ranking": True}
+        for candidate_id in candidate_ids if candidate_id not in scored_ids
+    ]
+    if new_rows:
+        db.session.execute(insert(CandidateScore), new_rows)
+    db.session.execute(
+        update(CandidateScore)
+        .where(CandidateScore.position_id == position_id, CandidateScore.candidate_id.in_(candidate_ids))
+        .values(points=points_subquery(CandidateScore.candidate_id, position_id))
+        .execution_options(synchronize_session=False)
+    )
+
+    # Kandydaci przypisani do tego stanowiska mają też punkty w samej tabeli candidate;
+    # hits_indexed tylko po przeliczeniu wszystkich słów stanowiska
+    if own_ids:
+        values = {"points": points_subquery(Candidate.id, position_id)}
+        if all_keywords:
+            values["hits_indexed"] = True
+        db.session.execute(
+            update(Candidate)
+            .where(Candidate.id.in_(own_ids))
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
+
+
+def backfill_status(job):
+    if job is None:
+        return None
+    return {
+        "job_id": job.id,
+        "position_id": job.position_id,
+        "status": job.status,
+        "processed": job.processed,
+        "total": job.total,
+        "percent": round(100 * job.processed / job.total, 1) if job.total else 100.0,
+        "error": job.error
+    }
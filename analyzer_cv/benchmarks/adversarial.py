@@ -0,0 +1,40 @@
+# Wejścia dobrane pod najgorszy przypadek wyrażeń regularnych i normalizacji.
+# Każdy generator zwraca tekst o długości około n znaków.
+
+CV_HEAD = "JAN KOWALSKI\nul. Długa 5, 00-001 Warszawa\njan.kowalski@example.pl\n+48 600 100 200\n"
+POLISH = "Doświadczenie: programista Python, Django, SQL; język angielski - zaawansowany. Zażółć gęślą jaźń. "
+ENGLISH = "Experience: software engineer, Python, Flask, PostgreSQL, Docker; team lead of 5 developers. "
+
+
+def repeat(unit, n):
+    return (unit * (n // len(unit) + 1))[:n]
+
+
+CORPUS = {
+    # Teksty zbliżone do prawdziwych CV
+    "cv_polish": lambda n: CV_HEAD + repeat(POLISH, n),
+    "cv_english": lambda n: CV_HEAD + repeat(ENGLISH, n),
+    "cv_many_blank_lines": lambda n: repeat("\n \n", n) + CV_HEAD,
+
+    # Telefon: długie ciągi cyfr i prawie-numery z separatorami
+    "digits": lambda n: repeat("1", n),
+    "digit_pairs_dashes": lambda n: repeat("12-", n),
+    "digit_triples_spaces": lambda n: repeat("123 ", n),
+    "parenthesised_digits": lambda n: repeat("(12)", n),
+    "plus_prefixes": lambda n: repeat("+1 ", n),
+    "near_miss_phone": lambda n: repeat("+48 (12) 345 67 ", n),
+
+    # E-mail: długi ciąg znaków adresu zakończony "@" bez domeny
+    "email_local_run": lambda n: repeat("a", n - 1) + "@",
+    "email_at_chain": lambda n: repeat("a@", n),
+    "email_dotted_domain": lambda n: "x@" + repeat("a.", n - 2),
+    "email_dots_no_tld": lambda n: repeat("a.b", n // 2) + "@" + repeat("c.1", n // 2),
+
+    # Imię i nazwisko: długie linie z wielkich liter
+    "name_upper_run": lambda n: repeat("AB ", n) + "1",
+    "name_upper_lines": lambda n: repeat("ABC DEF 1\n", n),
+
+    # Normalizacja: znaki łączące i rzadkie bloki Unicode
+    "combining_marks": lambda n: repeat("ȩ́", n),
+    "mixed_scripts": lambda n: repeat("Ążź ΑΒΓ абв 한국어 ﬁ ", n),
+}
@@ -0,0 +1,90 @@
+# Porównanie silników OCR: pytesseract (proces tesseract na każdą stronę) i tesserocr
+# (uchwyt API Tesseracta z modelami wczytanymi raz na proces).
+#
+# Dla każdego silnika mierzony jest czas pierwszej strony (z wczytaniem modeli) i mediana czasu
+# kolejnych stron na obrazach stron syntetycznych CV (corpus.py), podawanych z pamięci jak
+# w aplikacji. Na końcu oszczędność na stronę względem pytesseract. Silniki niedostępne
+# w systemie (brak binarki tesseract albo pakietu tesserocr) są pomijane.
+#
+# Uruchomienie z katalogu analyzer_cv:
+#     python benchmarks/bench_ocr_engines.py [--pages 5] [--lang pol+eng] [--dpi 150] [--output wynik.json]
+import argparse
+import json
+import os
+import shutil
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import ocr  # noqa: E402
+import ocr_engines  # noqa: E402
+from corpus import generate_cv, render_page_images  # noqa: E402
+
+
+def available_engines():
+    engines = []
+    if shutil.which("tesseract"):
+        engines.append("pytesseract")
+    if ocr_engines.tesserocr is not None:
+        engines.append("tesserocr")
+    return engines
+
+
+def bench_engine(name, images, profile):
+    engine = ocr_engines.get_ocr_engine(name)
+    timings = []
+    texts = []
+    for image in images:
+        start = time.perf_counter()
+        text, _ = engine.recognize(image, profile)
+        timings.append(time.perf_counter() - start)
+        texts.append(text)
+    return {
+        "first_page_ms": timings[0] * 1000,
+        "page_ms": statistics.median(timings[1:] or timings) * 1000,
+        "pages": len(images),
+    }, texts
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Porównanie silników OCR (czas na stronę)")
+    parser.add_argument("--pages", type=int, default=5, help="liczba stron do OCR na silnik")
+    parser.add_argument("--lang", default=ocr.DEFAULT_OCR_PROFILES[0]["lang"])
+    parser.add_argument("--dpi", type=int, default=ocr.DEFAULT_OCR_PROFILES[0]["dpi"])
+    parser.add_argument("--psm", type=int, default=ocr.DEFAULT_OCR_PROFILES[0]["psm"])
+    parser.add_argument("--output", help="zapisz wyniki do pliku JSON")
+    args = parser.parse_args()
+
+    engines = available_engines()
+    if not engines:
+        print("Brak silników OCR (binarka tesseract lub pakiet tesserocr) - benchmark pominięty.")
+        return
+
+    profile = {
+        **ocr.DEFAULT_OCR_PROFILES[0], "name": "bench", "lang": args.lang, "dpi": args.dpi, "psm": args.psm
+    }
+    pages = [page for lang in ("pl", "en") for page in generate_cv(lang, (args.pages + 1) // 2)]
+    images = render_page_images(pages[:args.pages], dpi=args.dpi)
+
+    results = {}
+    outputs = {}
+    print(f"{'silnik':<14}{'1. strona [ms]':>16}{'strona [ms]':>14}")
+    for name in engines:
+        results[name], outputs[name] = bench_engine(name, images, profile)
+        print(f"{name:<14}{results[name]['first_page_ms']:>16.0f}{results[name]['page_ms']:>14.0f}")
+
+    if len(results) == 2:
+        before, after = results["pytesseract"]["page_ms"], results["tesserocr"]["page_ms"]
+        print(f"\nOszczędność tesserocr: {before - after:.0f} ms na stronę ({(before - after) / before:.0%})")
+        if outputs["pytesseract"] != outputs["tesserocr"]:
+            print("Uwaga: teksty z obu silników się różnią (inne wersje Tesseracta lub danych językowych?)")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"profile": profile, "results": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,192 @@
+# Porównanie profili OCR: czas i dokładność na zestawie syntetycznych skanów CV.
+#
+# Skany generowane są z korpusu (corpus.py) w kilku wariantach jakości: czysty, mała czcionka,
+# rozmyty z szumem i wyblakły. Dla każdego trybu - dawne ustawienia (200 DPI w kolorze, domyślny
+# język i PSM), każdy profil osobno oraz cała drabina z eskalacją - mierzony jest czas na stronę,
+# odsetek odczytanych słów, odsetek odczytanych umiejętności (słów kluczowych) i liczba stron
+# przekazanych do kolejnego profilu. Wymaga silnika OCR (tesserocr albo tesseract, z danymi językowymi
+# profili) i rasteryzatora (pypdfium2 albo pdftoppm); tryb dawny tylko przy tesseract i pdftoppm.
+#
+# Uruchomienie z katalogu analyzer_cv:
+#     python benchmarks/bench_ocr_profiles.py [--pages 1,2] [--variants clean,noisy] [--output wynik.json]
+#     OCR_PROFILES='[{"name": "fast", "dpi": 120}, {"name": "accurate", "dpi": 300, "psm": 3}]' \
+#         python benchmarks/bench_ocr_profiles.py
+import argparse
+import json
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+from collections import Counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import ocr  # noqa: E402
+import ocr_engines  # noqa: E402
+import rasterizers  # noqa: E402
+from corpus import SKILLS, generate_cv, render_page_images, write_image_pdf  # noqa: E402
+from metrics import run_collecting  # noqa: E402
+from textnorm import normalize_text  # noqa: E402
+
+
+def small_font(images):
+    # Strona złożona drobniej: skan 150 DPI zmniejszony o 35%
+    return [image.resize((int(image.width * 0.65), int(image.height * 0.65))) for image in images]
+
+
+def noisy(images):
+    from PIL import Image, ImageFilter
+
+    result = []
+    for index, image in enumerate(images):
+        # Lekko rozmyty skan z szumem i krzywo położoną kartką
+        noise = Image.effect_noise(image.size, 60)
+        blurred = image.filter(ImageFilter.GaussianBlur(1.1))
+        angle = random.Random(index).uniform(-1.5, 1.5)
+        result.append(Image.blend(blurred, noise, 0.25).rotate(angle, fillcolor=255))
+    return result
+
+
+def faded(images):
+    from PIL import ImageEnhance
+
+    return [ImageEnhance.Contrast(image).enhance(0.3) for image in images]
+
+
+VARIANTS = {
+    "clean": lambda images: images,
+    "small": small_font,
+    "noisy": noisy,
+    "faded": faded,
+}
+
+
+def build_fixtures(directory, langs, page_counts, variants):
+    fixtures = []
+    for lang in langs:
+        for page_count in page_counts:
+            pages = generate_cv(lang, page_count, seed=1)
+            images = render_page_images(pages)
+            for variant in variants:
+                path = os.path.join(directory, f"{lang}-{page_count}p-{variant}.pdf")
+                write_image_pdf(path, VARIANTS[variant](images))
+                fixtures.append({
+                    "name": f"{lang}-{page_count}p-{variant}",
+                    "variant": variant,
+                    "path": path,
+                    "text": "\n".join(pages),
+                    "page_count": page_count,
+                })
+    return fixtures
+
+
+def words(text):
+    return Counter(normalize_text(text)[1].split())
+
+
+def recall(expected, found):
+    total = sum(expected.values())
+    return sum((expected & found).values()) / total if total else 1.0
+
+
+def legacy_ocr(path):
+    # Zachowanie sprzed profili: domyślne 200 DPI w kolorze i image_to_string bez opcji
+    from pdf2image import convert_from_path
+    from pytesseract import image_to_string
+
+    return " ".join(image_to_string(image) for image in convert_from_path(path)), []
+
+
+def ladder_ocr(profiles):
+    def run(path):
+        (text, _), observations = run_collecting(ocr.extract_cv_text, path, 1, 20, None, profiles)
+        return text, observations
+    return run
+
+
+def bench_mode(run, fixtures, skill_words):
+    elapsed = pages = escalated = 0
+    word_scores, skill_scores = [], []
+    for fixture in fixtures:
+        start = time.perf_counter()
+        text, observations = run(fixture["path"])
+        elapsed += time.perf_counter() - start
+
+        passes = [args for kind, args in observations if kind == "ocr_pass"]
+        expected, found = words(fixture["text"]), words(text)
+        pages += fixture["page_count"]
+        escalated += sum(count for _, count in passes[1:])
+        word_scores.append(recall(expected, found))
+        expected_skills = Counter({word: expected[word] for word in skill_words if word in expected})
+        skill_scores.append(recall(expected_skills, found))
+
+    return {
+        "ms_per_page": elapsed * 1000 / pages,
+        "word_recall": sum(word_scores) / len(word_scores),
+        "skill_recall": sum(skill_scores) / len(skill_scores),
+        "escalated_pages": escalated,
+        "pages": pages,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Porównanie profili OCR (czas i dokładność)")
+    parser.add_argument("--pages", default="1,2")
+    parser.add_argument("--langs", default="pl,en")
+    parser.add_argument("--variants", default=",".join(VARIANTS))
+    parser.add_argument("--output", help="zapisz wyniki do pliku JSON")
+    args = parser.parse_args()
+
+    has_tesseract = shutil.which("tesseract") is not None
+    has_pdftoppm = shutil.which("pdftoppm") is not None
+    if not (ocr_engines.tesserocr is not None or has_tesseract) or not (rasterizers.pdfium is not None or has_pdftoppm):
+        print("Brak silnika OCR lub rasteryzatora w systemie - benchmark pominięty.")
+        return
+
+    profiles = ocr.load_ocr_profiles(os.getenv("OCR_PROFILES"))
+    if ocr_engines.tesserocr is not None:
+        languages = set(ocr_engines.tesserocr.get_languages()[1])
+    else:
+        from pytesseract import get_languages
+
+        languages = set(get_languages())
+    required = {lang for profile in profiles for lang in profile["lang"].split("+")}
+    if not required <= languages:
+        print("Brak danych języków Tesseracta:", ", ".join(sorted(required - languages)))
+        sys.exit(1)
+
+    modes = {"legacy": legacy_ocr} if has_tesseract and has_pdftoppm else {}
+    for profile in profiles:
+        modes[profile["name"]] = ladder_ocr([profile])
+    modes["ladder"] = ladder_ocr(profiles)
+
+    skill_words = set(words(" ".join(SKILLS)))
+    work_dir = tempfile.mkdtemp(prefix="analyzer-ocr-bench-")
+    try:
+        fixtures = build_fixtures(
+            work_dir, args.langs.split(","), [int(pages) for pages in args.pages.split(",")],
+            args.variants.split(",")
+        )
+        results = {}
+        print(f"{'tryb':<12}{'wariant':<8}{'ms/strona':>11}{'słowa':>9}{'umiejętn.':>11}{'eskalacje':>11}")
+        for mode, run in modes.items():
+            for variant in args.variants.split(","):
+                subset = [fixture for fixture in fixtures if fixture["variant"] == variant]
+                result = bench_mode(run, subset, skill_words)
+                results.setdefault(mode, {})[variant] = result
+                print(
+                    f"{mode:<12}{variant:<8}{result['ms_per_page']:>11.0f}{result['word_recall']:>9.1%}"
+                    f"{result['skill_recall']:>11.1%}{result['escalated_pages']:>6}/{result['pages']:<4}"
+                )
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"profiles": profiles, "results": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
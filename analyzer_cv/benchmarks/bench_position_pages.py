@@ -0,0 +1,93 @@
+# Czas odpowiedzi stron zależnych od katalogu stanowisk: /upload, /ranking i /view_positions.
+#
+# Baza SQLite w katalogu tymczasowym z domyślnymi stanowiskami i stanowiskami użytkownika
+# (--positions po --keywords słów kluczowych). Tryby:
+#   reload  - katalog wczytywany z bazy przy każdym żądaniu (jak bez pamięci podręcznej),
+#   cached  - katalog z pamięci procesu, w bazie sprawdzana tylko wersja,
+#   304     - jak cached, ale przeglądarka wysyła If-None-Match i dostaje 304 bez renderowania.
+#
+# Uruchomienie z katalogu analyzer_cv:
+#     python benchmarks/bench_position_pages.py [--positions 30] [--keywords 80] [--requests 200]
+import argparse
+import json
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+PAGES = ["/upload", "/ranking", "/view_positions"]
+
+
+def prepare(app, positions, keywords):
+    from app import db
+    from models import User
+    from position_io import import_positions
+    from seed import seed_default_positions
+
+    with app.app_context():
+        seed_default_positions()
+        user = User(username="bench", email="bench@example.com")
+        user.set_password("bench")
+        db.session.add(user)
+        db.session.commit()
+        import_positions(user.id, {
+            f"Stanowisko {index}": {f"umiejętność {index}-{word}": word % 5 + 1 for word in range(keywords)}
+            for index in range(positions)
+        })
+
+
+def measure(client, page, mode, requests):
+    import catalog
+
+    headers = {}
+    if mode == "304":
+        headers["If-None-Match"] = client.get(page).headers["ETag"]
+    timings = []
+    for _ in range(requests):
+        if mode == "reload":
+            catalog.invalidate_position_catalog()
+        start = time.perf_counter()
+        response = client.get(page, headers=headers)
+        timings.append(time.perf_counter() - start)
+        assert response.status_code == (304 if mode == "304" else 200), response.status_code
+    return statistics.median(timings) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Czas odpowiedzi stron z listą stanowisk")
+    parser.add_argument("--positions", type=int, default=30)
+    parser.add_argument("--keywords", type=int, default=80)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--output", help="zapisz wyniki do pliku JSON")
+    args = parser.parse_args()
+
+    work_dir = tempfile.mkdtemp(prefix="analyzer-pages-bench-")
+    os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(work_dir, 'bench.db')}"
+    results = {}
+    try:
+        from app import create_app
+
+        app = create_app()
+        prepare(app, args.positions, args.keywords)
+        client = app.test_client()
+        client.post("/login", data={"username": "bench", "password": "bench"})
+
+        modes = ["reload", "cached", "304"]
+        print(f"{'strona':<16}" + "".join(f"{mode + ' [ms]':>14}" for mode in modes))
+        for page in PAGES:
+            results[page] = {mode: measure(client, page, mode, args.requests) for mode in modes}
+            print(f"{page:<16}" + "".join(f"{results[page][mode]:>14.2f}" for mode in modes))
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
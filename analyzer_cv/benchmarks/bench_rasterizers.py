@@ -0,0 +1,94 @@
+# Porównanie rasteryzatorów stron PDF: poppler (pdftoppm przez pdf2image, plik na stronę)
+# i pdfium (pypdfium2 w procesie aplikacji, prosto do obrazu w skali szarości).
+#
+# Mierzony jest czas od pliku PDF do obrazu gotowego dla OCR na stronę - dla poppler z odczytem
+# pliku strony, tak jak robi to silnik OCR - na PDF-ach z warstwą tekstową i ze skanami stron
+# (corpus.py), dla każdego DPI z listy. Rasteryzatory niedostępne w systemie są pomijane.
+#
+# Uruchomienie z katalogu analyzer_cv:
+#     python benchmarks/bench_rasterizers.py [--dpi 150,300] [--pages 3] [--repeat 3] [--output wynik.json]
+import argparse
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import ocr  # noqa: E402
+import rasterizers  # noqa: E402
+from corpus import build_corpus  # noqa: E402
+
+
+def available_rasterizers():
+    names = []
+    if shutil.which("pdftoppm"):
+        names.append("poppler")
+    if rasterizers.pdfium is not None:
+        names.append("pdfium")
+    return names
+
+
+def rasterize_document(rasterizer, path, page_count, profile, work_dir):
+    from PIL import Image
+
+    for number in range(1, page_count + 1):
+        page = rasterizer.render(path, number, profile, work_dir, f"bench-{number}")
+        if isinstance(page, str):
+            with Image.open(page) as image:
+                image.load()
+        rasterizer.release(page)
+
+
+def bench_rasterizer(rasterizer, path, page_count, profile, work_dir, repeat):
+    rasterize_document(rasterizer, path, page_count, profile, work_dir)
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        rasterize_document(rasterizer, path, page_count, profile, work_dir)
+        timings.append(time.perf_counter() - start)
+    return min(timings) * 1000 / page_count
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Porównanie rasteryzatorów stron PDF")
+    parser.add_argument("--dpi", default="150,300")
+    parser.add_argument("--pages", type=int, default=3)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", help="zapisz wyniki do pliku JSON")
+    args = parser.parse_args()
+
+    names = available_rasterizers()
+    if not names:
+        print("Brak rasteryzatorów (pdftoppm lub pypdfium2) - benchmark pominięty.")
+        return
+
+    results = {}
+    work_dir = tempfile.mkdtemp(prefix="analyzer-raster-bench-")
+    try:
+        corpus = build_corpus(os.path.join(work_dir, "corpus"), langs=["pl"], page_counts=[args.pages])
+        documents = {"text": corpus[0]["text_pdf"], "scan": corpus[0]["image_pdf"]}
+        print(f"{'dokument':<10}{'DPI':>5}" + "".join(f"{name + ' [ms/str.]':>20}" for name in names))
+        for kind, path in documents.items():
+            for dpi in (int(value) for value in args.dpi.split(",")):
+                profile = {**ocr.DEFAULT_OCR_PROFILES[0], "dpi": dpi}
+                row = {
+                    name: bench_rasterizer(
+                        rasterizers.get_rasterizer(name), path, args.pages, profile, work_dir, args.repeat
+                    )
+                    for name in names
+                }
+                results.setdefault(kind, {})[str(dpi)] = row
+                print(f"{kind:<10}{dpi:>5}" + "".join(f"{row[name]:>20.1f}" for name in names))
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
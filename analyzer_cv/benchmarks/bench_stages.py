@@ -0,0 +1,300 @@
+# Benchmark poszczególnych etapów analizy CV na syntetycznym korpusie (PL/EN, różne liczby stron).
+#
+# Etapy: warstwa tekstowa PDF, rasteryzacja, OCR, normalizacja, ekstrakcja imienia/e-maila/telefonu,
+# punktacja słów kluczowych, zapis kandydata w bazie i zapytanie rankingu. Działa offline -
+# rasteryzacja i OCR są pomijane, gdy w systemie nie ma poppler-utils lub tesseract.
+#
+# Uruchomienie z katalogu analyzer_cv:
+#     python benchmarks/bench_stages.py                       # pomiar i porównanie z baselines/default.json
+#     python benchmarks/bench_stages.py --save-baseline       # zapis bieżącego pomiaru jako baseline
+#     python benchmarks/bench_stages.py --pages 1,3 --repeat 3 --output wynik.json
+import argparse
+import json
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from corpus import build_corpus  # noqa: E402
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_BASELINE = os.path.join(BENCH_DIR, "baselines", "default.json")
+
+
+def best_time(fn, repeat):
+    # Minimum z powtórzeń po rozgrzewce - najmniej wrażliwe na szum innych procesów
+    fn()
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings) * 1000
+
+
+def calibration_workload():
+    # Stała porcja pracy w czystym Pythonie - bieżąca szybkość maszyny
+    words = [str(index * 7919 % 10007) for index in range(20000)]
+    sorted(words)
+    sum(len(word) for word in words)
+
+
+def measure(fn, repeat):
+    # Kalibracja tuż przed pomiarem: porównanie z baseline używa czasu względem kalibracji,
+    # więc chwilowe obciążenie współdzielonej maszyny nie wygląda jak regresja
+    return {"ms": best_time(fn, repeat), "calibration_ms": best_time(calibration_workload, 5)}
+
+
+def bench_app(db_path):
+    from flask import Flask
+
+    from app import db
+    from search import ensure_search_index
+    from seed import seed_default_positions
+
+    app = Flask("benchmark")
+    app.config["SQLALCHEMY_DATABASE_URI"] = f"sqlite:///{db_path}"
+    app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
+    db.init_app(app)
+
+    with app.app_context():
+        from models import User
+
+        db.create_all()
+        ensure_search_index(db.engine)
+        seed_default_positions()
+        user = User(username="benchmark", email="benchmark@example.com", password_hash="-")
+        db.session.add(user)
+        db.session.commit()
+        app.config["BENCH_USER_ID"] = user.id
+    return app
+
+
+def available_stages():
+    import rasterizers
+
+    return {
+        "text_layer": True,
+        "rasterize": rasterizers.pdfium is not None or shutil.which("pdftoppm") is not None,
+        "ocr": ocr_works(),
+    }
+
+
+def ocr_works():
+    # Próbny OCR pustej strony - sam import tesserocr nie znaczy, że Tesseract ma dane językowe
+    from PIL import Image
+
+    import ocr
+    from ocr_engines import get_ocr_engine
+
+    try:
+        get_ocr_engine("auto").recognize(Image.new("L", (64, 64), 255), ocr.DEFAULT_OCR_PROFILES[0])
+    except Exception:
+        return False
+    return True
+
+
+def bench_documents(corpus, repeat, results, work_dir):
+    import ocr
+    import textnorm
+    from ocr_engines import get_ocr_engine
+    from rasterizers import get_rasterizer
+
+    tools = available_stages()
+    for item in corpus:
+        name, text = item["name"], item["text"]
+        page_count = len(item["pages"])
+        profile = ocr.DEFAULT_OCR_PROFILES[0]
+        engine = get_ocr_engine("auto")
+        rasterizer = get_rasterizer("auto")
+
+        results.setdefault("text_layer", {})[name] = measure(lambda: ocr.read_text_layer(item["text_pdf"]), repeat)
+        if tools["rasterize"]:
+            def rasterize():
+                for number in range(1, page_count + 1):
+                    rasterizer.release(rasterizer.render(item["image_pdf"], number, profile, work_dir, "bench"))
+
+            results.setdefault("rasterize", {})[name] = measure(rasterize, max(1, repeat // 5))
+        if tools["ocr"]:
+            results.setdefault("ocr", {})[name] = measure(
+                lambda: [engine.recognize(image, profile) for image in item["images"]], max(1, repeat // 5)
+            )
+
+        def normalize():
+            textnorm.normalize_text.cache_clear()
+            textnorm.normalize_text(text)
+
+        results.setdefault("normalize", {})[name] = measure(normalize, repeat)
+        textnorm.normalize_text(text)
+        results.setdefault("extract_name", {})[name] = measure(
+            lambda: textnorm.extract_name_from_cv_text(text), repeat
+        )
+        results.setdefault("extract_email", {})[name] = measure(
+            lambda: textnorm.extract_email_from_cv_text(text), repeat
+        )
+        results.setdefault("extract_phone", {})[name] = measure(
+            lambda: textnorm.extract_phone_from_cv_text(text), repeat
+        )
+
+    return [stage for stage, present in tools.items() if not present]
+
+
+def bench_database(app, corpus, repeat, ranking_rows, results):
+    from sqlalchemy import insert, true
+
+    from app import db, build_candidate, ranking_candidates, score_cv_text_for_positions
+    from models import Candidate, CandidateScore, Position
+
+    with app.app_context():
+        user_id = app.config["BENCH_USER_ID"]
+        position_ids = sorted(position_id for position_id, in db.session.query(Position.id))
+        position_id = position_ids[0]
+
+        for item in corpus:
+            name, text = item["name"], item["text"]
+            score_cv_text_for_positions(position_ids, text)
+            results.setdefault("scoring", {})[name] = measure(
+                lambda: score_cv_text_for_positions(position_ids, text), repeat
+            )
+            scores = score_cv_text_for_positions(position_ids, text)
+
+            def insert_candidate():
+                build_candidate(name, position_id, user_id, None, text, scores)
+                db.session.commit()
+
+            results.setdefault("db_insert", {})[name] = measure(insert_candidate, repeat)
+
+        # Tło dla rankingu: wiele wierszy, jak w bazie po dłuższym używaniu
+        for start in range(0, ranking_rows, 5000):
+            count = min(5000, ranking_rows - start)
+            db.session.execute(insert(Candidate), [
+                {"name": f"tlo-{start + index}", "cv_text": "", "position_id": position_id,
+                 "points": (start + index) % 997, "user_id": user_id, "hits_indexed": True}
+                for index in range(count)
+            ])
+        db.session.execute(insert(CandidateScore).from_select(
+            ["candidate_id", "position_id", "points", "in_ranking"],
+            db.session.query(Candidate.id, Candidate.position_id, Candidate.points, true())
+            .filter(Candidate.name.like("tlo-%"))
+        ))
+        db.session.commit()
+
+        results.setdefault("ranking", {})[f"{ranking_rows}-rows"] = measure(
+            lambda: ranking_candidates(position_id, user_id, 50), repeat * 5
+        )
+
+
+def compare(current, baseline, threshold, min_delta_ms):
+    rows = []
+    regressions = []
+    for stage, cases in current["results"].items():
+        for case, entry in cases.items():
+            value = entry["ms"]
+            previous_entry = baseline["results"].get(stage, {}).get(case)
+            if previous_entry is None:
+                rows.append((stage, case, None, value, None, "nowy"))
+                continue
+            # Czas baseline przeliczony na bieżącą szybkość maszyny
+            previous = previous_entry["ms"] * entry["calibration_ms"] / previous_entry["calibration_ms"]
+            ratio = value / previous if previous else float("inf")
+            status = "ok"
+            if ratio > 1 + threshold and value - previous > min_delta_ms:
+                status = "REGRESJA"
+                regressions.append(f"{stage}/{case}")
+            elif ratio < 1 - threshold and previous - value > min_delta_ms:
+                status = "szybciej"
+            rows.append((stage, case, previous, value, ratio, status))
+    return rows, regressions
+
+
+def print_report(rows):
+    print(f"{'etap':<15}{'przypadek':<14}{'baseline [ms]':>15}{'teraz [ms]':>13}{'zmiana':>10}  status")
+    for stage, case, previous, value, ratio, status in rows:
+        previous_text = f"{previous:.3f}" if previous is not None else "-"
+        ratio_text = f"{(ratio - 1) * 100:+.1f}%" if ratio is not None else "-"
+        print(f"{stage:<15}{case:<14}{previous_text:>15}{value:>13.3f}{ratio_text:>10}  {status}")
+
+
+def single_report(results, status):
+    print_report([
+        (stage, case, None, entry["ms"], None, status)
+        for stage, cases in results.items() for case, entry in cases.items()
+    ])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark etapów analizy CV")
+    parser.add_argument("--pages", default="1,3,10", help="liczby stron generowanych CV")
+    parser.add_argument("--langs", default="pl,en")
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--ranking-rows", type=int, default=20000)
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--save-baseline", action="store_true", help="zapisz wynik jako baseline zamiast porównywać")
+    parser.add_argument("--output", help="zapisz wynik pomiaru do pliku JSON")
+    parser.add_argument("--threshold", type=float, default=0.3, help="dopuszczalny względny wzrost czasu")
+    parser.add_argument("--min-delta-ms", type=float, default=0.1, help="pomijalna bezwzględna różnica czasu")
+    args = parser.parse_args()
+
+    work_dir = tempfile.mkdtemp(prefix="analyzer-bench-")
+    try:
+        corpus = build_corpus(
+            work_dir, langs=args.langs.split(","), page_counts=[int(pages) for pages in args.pages.split(",")]
+        )
+        results = {}
+        skipped = bench_documents(corpus, args.repeat, results, work_dir)
+        app = bench_app(os.path.join(work_dir, "benchmark.db"))
+        bench_database(app, corpus, args.repeat, args.ranking_rows, results)
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    current = {
+        "created_at": datetime.utcnow().isoformat(timespec="seconds"),
+        "machine": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "processor": platform.processor() or platform.machine(),
+            "cpu_count": os.cpu_count(),
+        },
+        "skipped": skipped,
+        "results": results,
+    }
+    if skipped:
+        print("Pominięte etapy (brak narzędzi w systemie):", ", ".join(skipped))
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(current, f, indent=2)
+
+    if args.save_baseline:
+        os.makedirs(os.path.dirname(args.baseline), exist_ok=True)
+        with open(args.baseline, "w") as f:
+            json.dump(current, f, indent=2)
+        single_report(results, "zapisano")
+        print(f"\nBaseline zapisany: {args.baseline}")
+        return
+
+    if not os.path.exists(args.baseline):
+        single_report(results, "brak baseline")
+        print(f"\nBrak pliku {args.baseline} - uruchom z --save-baseline.")
+        return
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    rows, regressions = compare(current, baseline, args.threshold, args.min_delta_ms)
+    print_report(rows)
+    if baseline.get("machine") != current["machine"]:
+        print("\nUwaga: baseline zmierzony na innej maszynie lub wersji Pythona - porównanie orientacyjne.")
+    print("Czasy baseline przeliczone na bieżącą szybkość maszyny według pomiaru kalibracyjnego.")
+    if regressions:
+        print(f"\nRegresje powyżej {args.threshold:.0%}:", ", ".join(regressions))
+        sys.exit(1)
+    print("\nBrak regresji.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+# Mikrobenchmark normalizacji tekstu i ekstraktorów danych kontaktowych.
+#
+# Porównuje textnorm.py z poprzednią implementacją (kopia poniżej) na korpusie z adversarial.py:
+# sprawdza zgodność wyników, mierzy czasy dla rosnących rozmiarów wejścia i wylicza wykładnik
+# wzrostu czasu - dla nowej wersji musi pozostać liniowy.
+#
+# Uruchomienie z katalogu analyzer_cv:
+#     python benchmarks/bench_textnorm.py [--sizes 2000,4000,8000] [--max-exponent 1.3]
+import argparse
+import math
+import os
+import re
+import sys
+import time
+import unicodedata
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import textnorm  # noqa: E402
+from adversarial import CORPUS  # noqa: E402
+
+
+def legacy_remove_diacritics(text):
+    return ''.join(
+        c for c in unicodedata.normalize('NFD', text)
+        if unicodedata.category(c) != 'Mn'
+    )
+
+
+def legacy_extract_email(text):
+    email_pattern = r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
+    match = re.search(email_pattern, text)
+    return match.group(0) if match else None
+
+
+def legacy_extract_name(text, max_lines=60):
+    normalized_text = legacy_remove_diacritics(text)
+    lines = [line.strip() for line in normalized_text.strip().split("\n") if line.strip()]
+
+    for i, line in enumerate(lines[:max_lines]):
+        if any(keyword in line for keyword in textnorm.IGNORE_KEYWORDS):
+            continue
+
+        cleaned_line = re.sub(r"\d+|[^A-Z\s]", "", line).strip()
+
+        match = re.match(r"^([A-Z]{2,})\s+([A-Z]{2,})$", cleaned_line)
+        if match:
+            return f"{match.group(1)} {match.group(2)}"
+
+        if i + 1 < len(lines):
+            cleaned_next_line = re.sub(r"\d+|[^A-Z\s]", "", lines[i + 1]).strip()
+            if line.isupper() and cleaned_next_line.isupper():
+                return f"{line} {lines[i + 1]}"
+
+    return "Nierozpoznane"
+
+
+def legacy_extract_phone(text):
+    phone_pattern = r'(?:\+?\d{1,3}[ -]?)?(?:\(?\d{1,4}\)?[ -]?)?\d{3,4}[ -]?\d{3,4}[ -]?\d{3,4}'
+    match = re.search(phone_pattern, text)
+    return match.group(0) if match else None
+
+
+def legacy_pipeline(text):
+    # Dawniej: zwinięcie w ekstrakcji imienia, w punktacji i w indeksie wyszukiwania
+    return (
+        legacy_extract_name(text),
+        legacy_extract_email(text),
+        legacy_extract_phone(text),
+        legacy_remove_diacritics(text).lower(),
+        legacy_remove_diacritics(text).lower()
+    )
+
+
+def new_extract_name(text):
+    textnorm.normalize_text.cache_clear()
+    return textnorm.extract_name_from_cv_text(text)
+
+
+def new_pipeline(text):
+    textnorm.normalize_text.cache_clear()
+    return (
+        textnorm.extract_name_from_cv_text(text),
+        textnorm.extract_email_from_cv_text(text),
+        textnorm.extract_phone_from_cv_text(text),
+        textnorm.normalize_text(text)[1],
+        textnorm.normalize_text(text)[1]
+    )
+
+
+STAGES = {
+    "fold": (legacy_remove_diacritics, textnorm.remove_diacritics),
+    "email": (legacy_extract_email, textnorm.extract_email_from_cv_text),
+    "phone": (legacy_extract_phone, textnorm.extract_phone_from_cv_text),
+    "name": (legacy_extract_name, new_extract_name),
+    "pipeline": (legacy_pipeline, new_pipeline),
+}
+
+
+def best_time(fn, text, budget=0.2, repeat=3):
+    # Najlepszy z kilku pomiarów, liczba wywołań dobrana do budżetu czasu
+    start = time.perf_counter()
+    fn(text)
+    single = time.perf_counter() - start
+    number = max(1, min(1000, int(budget / max(single, 1e-7))))
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn(text)
+        timings.append((time.perf_counter() - start) / number)
+    return min(timings)
+
+
+def growth_exponent(sizes, timings):
+    pairs = [(n, t) for n, t in zip(sizes, timings) if t is not None]
+    if len(pairs) < 2:
+        return None
+    (n0, t0), (n1, t1) = pairs[0], pairs[-1]
+    return math.log(max(t1, 1e-9) / max(t0, 1e-9)) / math.log(n1 / n0)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mikrobenchmark normalizacji tekstu i ekstraktorów")
+    parser.add_argument("--sizes", default="2000,4000,8000,16000,32000")
+    parser.add_argument("--max-exponent", type=float, default=1.3)
+    parser.add_argument("--legacy-budget", type=float, default=2.0,
+                        help="pomiń starą wersję dla większych rozmiarów, gdy jedno wywołanie trwa dłużej (s)")
+    parser.add_argument("--cases", default=",".join(CORPUS))
+    parser.add_argument("--stages", default=",".join(STAGES))
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(",")]
+    failures = []
+
+    print(f"{'przypadek':<24}{'etap':<10}{'stara [ms]':>12}{'nowa [ms]':>12}{'x':>10}{'wykł. stara':>13}{'wykł. nowa':>12}")
+    for case in args.cases.split(","):
+        texts = [CORPUS[case](size) for size in sizes]
+        for stage in args.stages.split(","):
+            legacy, new = STAGES[stage]
+            legacy_timings, new_timings = [], []
+            legacy_too_slow = False
+
+            for text in texts:
+                new_timings.append(best_time(new, text))
+                if legacy_too_slow:
+                    legacy_timings.append(None)
+                    continue
+                if new(text) != legacy(text):
+                    failures.append(f"{case}/{stage}: wynik różni się od poprzedniej wersji (n={len(text)})")
+                timing = best_time(legacy, text, repeat=1)
+                legacy_timings.append(timing)
+                legacy_too_slow = timing > args.legacy_budget
+
+            legacy_exponent = growth_exponent(sizes, legacy_timings)
+            new_exponent = growth_exponent(sizes, new_timings)
+            # Przy pomiarach poniżej 50 µs wykładnik to głównie szum i narzut wywołania
+            if new_exponent is not None and new_exponent > args.max_exponent and new_timings[-1] > 5e-5:
+                failures.append(f"{case}/{stage}: wzrost nieliniowy, wykładnik {new_exponent:.2f}")
+
+            last_legacy = next((t for t in reversed(legacy_timings) if t is not None), None)
+            comparable = legacy_timings[-1] is not None
+            speedup = f"{legacy_timings[-1] / new_timings[-1]:.1f}" if comparable else ">"
+            print(
+                f"{case:<24}{stage:<10}"
+                f"{(last_legacy or 0) * 1000:>12.3f}{new_timings[-1] * 1000:>12.3f}{speedup:>10}"
+                f"{legacy_exponent if legacy_exponent is not None else float('nan'):>13.2f}"
+                f"{new_exponent if new_exponent is not None else float('nan'):>12.2f}"
+            )
+
+    if failures:
+        print("\nBłędy:")
+        for failure in failures:
+            print(" -", failure)
+        sys.exit(1)
+    print(f"\nOK: wyniki zgodne, wykładnik wzrostu nowej wersji <= {args.max_exponent}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+# Syntetyczny korpus CV (polski i angielski) do benchmarków: tekst, PDF z warstwą tekstową
+# i PDF z samymi obrazami stron (ścieżka OCR). Generowanie jest deterministyczne dla danego ziarna.
+import os
+import random
+
+LINES_PER_PAGE = 45
+
+FIRST_NAMES = {
+    "pl": ["Jan", "Anna", "Piotr", "Katarzyna", "Michał", "Agnieszka", "Łukasz", "Małgorzata", "Paweł", "Żaneta"],
+    "en": ["John", "Emily", "Michael", "Sarah", "David", "Laura", "James", "Olivia", "Robert", "Grace"],
+}
+LAST_NAMES = {
+    "pl": ["Kowalski", "Nowak", "Wiśniewski", "Wójcik", "Kamińska", "Lewandowski", "Zieliński", "Szymańska"],
+    "en": ["Smith", "Johnson", "Williams", "Brown", "Jones", "Miller", "Davis", "Wilson"],
+}
+SECTIONS = {
+    "pl": ["DOŚWIADCZENIE", "EDUKACJA", "UMIEJĘTNOŚCI", "JĘZYKI", "CERTYFIKATY", "O MNIE"],
+    "en": ["EXPERIENCE", "EDUCATION", "SKILLS", "LANGUAGES", "CERTIFICATES", "ABOUT ME"],
+}
+VOCABULARY = {
+    "pl": (
+        "odpowiedzialny za rozwój aplikacji zespół projekt wdrożenie klient współpraca analiza "
+        "wymagań utrzymanie systemów raportowanie sprzedaż obsługa zarządzanie budżetem "
+        "szkolenia dokumentacja jakość terminowość samodzielność komunikacja negocjacje"
+    ).split(),
+    "en": (
+        "responsible for development of applications team project deployment client collaboration "
+        "requirements analysis maintenance reporting sales support budget management training "
+        "documentation quality delivery ownership communication negotiation stakeholders"
+    ).split(),
+}
+SKILLS = (
+    "Python Java JavaScript SQL Docker Linux Git REST Django Flask React Kubernetes Terraform "
+    "Excel Power BI Tableau scrum agile AWS Azure PostgreSQL MongoDB Redis pytest CRM SAP"
+).split()
+
+
+def generate_cv(lang, pages, seed=0):
+    # Zwraca listę stron, każda strona to tekst z LINES_PER_PAGE liniami
+    rng = random.Random(f"{lang}-{pages}-{seed}")
+    first = rng.choice(FIRST_NAMES[lang])
+    last = rng.choice(LAST_NAMES[lang])
+    login = f"{first}.{last}".lower().translate(str.maketrans("ąćęłńóśźż", "acelnoszz"))
+
+    lines = [
+        f"{first.upper()} {last.upper()}",
+        f"{login}@example.{'pl' if lang == 'pl' else 'com'}",
+        f"+48 {rng.randint(500, 899)} {rng.randint(100, 999)} {rng.randint(100, 999)}",
+        "",
+    ]
+    while len(lines) < pages * LINES_PER_PAGE:
+        if len(lines) % 12 == 4:
+            lines.append(rng.choice(SECTIONS[lang]))
+            continue
+        words = rng.choices(VOCABULARY[lang], k=rng.randint(6, 10)) + rng.choices(SKILLS, k=rng.randint(1, 3))
+        rng.shuffle(words)
+        year = rng.randint(2005, 2024)
+        lines.append(f"{year}-{year + rng.randint(1, 4)} " + " ".join(words))
+
+    return [
+        "\n".join(lines[start:start + LINES_PER_PAGE])
+        for start in range(0, pages * LINES_PER_PAGE, LINES_PER_PAGE)
+    ]
+
+
+# Helvetica z kodowaniem rozszerzonym o polskie znaki (nazwy glifów z Adobe Glyph List)
+POLISH_GLYPHS = {
+    "ą": "aogonek", "ć": "cacute", "ę": "eogonek", "ł": "lslash", "ń": "nacute", "ó": "oacute",
+    "ś": "sacute", "ź": "zacute", "ż": "zdotaccent", "Ą": "Aogonek", "Ć": "Cacute", "Ę": "Eogonek",
+    "Ł": "Lslash", "Ń": "Nacute", "Ó": "Oacute", "Ś": "Sacute", "Ź": "Zacute", "Ż": "Zdotaccent",
+}
+POLISH_CODES = {char: 128 + index for index, char in enumerate(POLISH_GLYPHS)}
+
+
+def pdf_string(line):
+    encoded = bytearray()
+    for char in line:
+        if char in POLISH_CODES:
+            encoded.append(POLISH_CODES[char])
+        elif 32 <= ord(char) < 127:
+            if char in "()\\":
+                encoded.append(ord("\\"))
+            encoded.append(ord(char))
+        else:
+            encoded.append(ord("?"))
+    return b"(" + bytes(encoded) + b")"
+
+
+def write_text_pdf(path, pages):
+    differences = " ".join(f"/{name}" for name in POLISH_GLYPHS.values())
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        None,
+        (
+            "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding "
+            f"<< /Type /Encoding /BaseEncoding /WinAnsiEncoding /Differences [128 {differences}] >> >>"
+        ).encode(),
+    ]
+    page_ids = []
+    for page in pages:
+        content = b"BT /F1 10 Tf 13 TL 50 800 Td " + b" ".join(
+            pdf_string(line) + b" Tj T*" for line in page.split("\n")
+        ) + b" ET"
+        objects.append(b"<< /Length %d >>\nstream\n" % len(content) + content + b"\nendstream")
+        objects.append((
+            "<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] "
+            f"/Resources << /Font << /F1 3 0 R >> >> /Contents {len(objects)} 0 R >>"
+        ).encode())
+        page_ids.append(len(objects))
+    kids = " ".join(f"{page_id} 0 R" for page_id in page_ids)
+    objects[1] = f"<< /Type /Pages /Kids [{kids}] /Count {len(page_ids)} >>".encode()
+
+    output = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(output))
+        output += b"%d 0 obj\n" % number + body + b"\nendobj\n"
+    xref = len(output)
+    output += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    output += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    output += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+
+    with open(path, "wb") as f:
+        f.write(output)
+
+
+def load_font(size):
+    from PIL import ImageFont
+
+    for candidate in ("DejaVuSans.ttf", "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", "arial.ttf"):
+        try:
+            return ImageFont.truetype(candidate, size)
+        except OSError:
+            continue
+    return ImageFont.load_default()
+
+
+def render_page_images(pages, dpi=150):
+    from PIL import Image, ImageDraw
+
+    width, height = int(8.27 * dpi), int(11.69 * dpi)
+    font = load_font(int(dpi / 7.5))
+    line_height = int(dpi / 5.5)
+    images = []
+    for page in pages:
+        image = Image.new("L", (width, height), 255)
+        draw = ImageDraw.Draw(image)
+        for index, line in enumerate(page.split("\n")):
+            draw.text((int(dpi * 0.7), int(dpi * 0.7) + index * line_height), line, fill=0, font=font)
+        images.append(image)
+    return images
+
+
+def write_image_pdf(path, images, dpi=150):
+    images[0].save(path, save_all=True, append_images=images[1:], resolution=dpi)
+
+
+def build_corpus(directory, langs=("pl", "en"), page_counts=(1, 2, 5), seed=0):
+    os.makedirs(directory, exist_ok=True)
+    corpus = []
+    for lang in langs:
+        for pages_count in page_counts:
+            pages = generate_cv(lang, pages_count, seed)
+            name = f"{lang}-{pages_count}p"
+            text_pdf = os.path.join(directory, f"{name}-text.pdf")
+            image_pdf = os.path.join(directory, f"{name}-scan.pdf")
+            images = render_page_images(pages)
+            write_text_pdf(text_pdf, pages)
+            write_image_pdf(image_pdf, images)
+            corpus.append({
+                "name": name,
+                "text": " ".join(pages),
+                "pages": pages,
+                "images": images,
+                "text_pdf": text_pdf,
+                "image_pdf": image_pdf,
+            })
+    return corpus
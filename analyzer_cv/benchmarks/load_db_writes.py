@@ -0,0 +1,157 @@
+# Test obciążeniowy zapisów do bazy: N procesów (jak procesy gunicorna) jednocześnie zapisuje
+# kandydatów z wynikami, przeplatając zapisy zapytaniami rankingu.
+#
+# Każdy proces tworzy własną aplikację przez create_app() z tym samym DATABASE_URL, więc działają
+# te same ustawienia silnika co w produkcji (pragmy SQLite albo pula połączeń PostgreSQL).
+# Raport: zapisy na sekundę łącznie, opóźnienie zapisu (mediana i p95) oraz liczba błędów
+# "database is locked". Tryb "legacy" odtwarza dawne ustawienia SQLite (bez WAL, domyślny
+# timeout sterownika), "tuned" to bieżąca konfiguracja.
+#
+# Uruchomienie z katalogu analyzer_cv:
+#     python benchmarks/load_db_writes.py                          # SQLite w katalogu tymczasowym
+#     python benchmarks/load_db_writes.py --workers 1,4,8 --seconds 10
+#     DATABASE_URL=postgresql://... python benchmarks/load_db_writes.py --modes tuned
+import argparse
+import json
+import multiprocessing
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from corpus import generate_cv  # noqa: E402
+
+MODES = {
+    "legacy": {"SQLITE_WAL": "0", "SQLITE_BUSY_TIMEOUT_MS": "5000", "SQLITE_MMAP_SIZE": "0"},
+    "tuned": {},
+}
+
+
+def apply_mode(env, database_url):
+    for key in MODES["legacy"]:
+        os.environ.pop(key, None)
+    os.environ.update(env)
+    os.environ["DATABASE_URL"] = database_url
+
+
+def prepare(database_url):
+    from app import create_app, db
+    from models import Position, User
+    from seed import seed_default_positions
+
+    app = create_app()
+    with app.app_context():
+        seed_default_positions()
+        user = User.query.filter_by(username="load-test").first()
+        if user is None:
+            user = User(username="load-test", email="load-test@example.com", password_hash="-")
+            db.session.add(user)
+            db.session.commit()
+        return user.id, sorted(position_id for position_id, in db.session.query(Position.id))
+
+
+def worker(database_url, env, user_id, position_ids, seconds, read_ratio, seed, start, results):
+    apply_mode(env, database_url)
+    from sqlalchemy.exc import OperationalError
+
+    from app import build_candidate, create_app, db, ranking_candidates, score_cv_text_for_positions
+
+    app = create_app()
+    text = " ".join(generate_cv("pl", 1, seed))
+    latencies, errors, reads = [], 0, 0
+    with app.app_context():
+        # Pomiar rusza naraz we wszystkich procesach, po starcie aplikacji
+        start.wait()
+        deadline = time.time() + seconds
+        index = 0
+        while time.time() < deadline:
+            position_id = position_ids[index % len(position_ids)]
+            began = time.perf_counter()
+            try:
+                # Jak w analyze_cv: odczyt słów kluczowych i zapis kandydata w jednej transakcji
+                scores = score_cv_text_for_positions(position_ids, text)
+                build_candidate(f"load-{seed}-{index}", position_id, user_id, None, text, scores)
+                db.session.commit()
+                latencies.append(time.perf_counter() - began)
+            except OperationalError as e:
+                db.session.rollback()
+                if "locked" not in str(e):
+                    raise
+                errors += 1
+            for _ in range(read_ratio):
+                ranking_candidates(position_id, user_id, 50)
+                db.session.commit()
+                reads += 1
+            index += 1
+    results.put({"latencies": latencies, "errors": errors, "reads": reads})
+
+
+def run(database_url, env, workers, seconds, read_ratio, user_id, position_ids):
+    context = multiprocessing.get_context("spawn")
+    results = context.Queue()
+    start = context.Barrier(workers)
+    processes = [
+        context.Process(
+            target=worker, args=(database_url, env, user_id, position_ids, seconds, read_ratio, seed, start, results)
+        )
+        for seed in range(workers)
+    ]
+    for process in processes:
+        process.start()
+    collected = [results.get() for _ in processes]
+    for process in processes:
+        process.join()
+
+    latencies = sorted(latency for result in collected for latency in result["latencies"])
+    return {
+        "writes_per_second": len(latencies) / seconds,
+        "reads_per_second": sum(result["reads"] for result in collected) / seconds,
+        "write_median_ms": statistics.median(latencies) * 1000 if latencies else None,
+        "write_p95_ms": latencies[int(len(latencies) * 0.95)] * 1000 if latencies else None,
+        "locked_errors": sum(result["errors"] for result in collected),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Test obciążeniowy zapisów kandydatów do bazy")
+    parser.add_argument("--workers", default="1,2,4,8", help="liczby równoległych procesów")
+    parser.add_argument("--seconds", type=float, default=5)
+    parser.add_argument("--read-ratio", type=int, default=1, help="zapytania rankingu na jeden zapis")
+    parser.add_argument("--modes", default=",".join(MODES))
+    parser.add_argument("--output", help="zapisz wyniki do pliku JSON")
+    args = parser.parse_args()
+
+    external_url = os.getenv("DATABASE_URL")
+    work_dir = tempfile.mkdtemp(prefix="analyzer-load-")
+    results = {}
+    try:
+        print(
+            f"{'tryb':<8}{'procesy':>8}{'zapisy/s':>10}{'odczyty/s':>11}"
+            f"{'mediana [ms]':>14}{'p95 [ms]':>10}{'locked':>8}"
+        )
+        for mode in args.modes.split(","):
+            database_url = external_url or f"sqlite:///{os.path.join(work_dir, mode + '.db')}"
+            apply_mode(MODES[mode], database_url)
+            user_id, position_ids = prepare(database_url)
+            for workers in (int(value) for value in args.workers.split(",")):
+                result = run(database_url, MODES[mode], workers, args.seconds, args.read_ratio, user_id, position_ids)
+                results.setdefault(mode, {})[workers] = result
+                print(
+                    f"{mode:<8}{workers:>8}{result['writes_per_second']:>10.1f}{result['reads_per_second']:>11.1f}"
+                    f"{result['write_median_ms'] or 0:>14.1f}{result['write_p95_ms'] or 0:>10.1f}"
+                    f"{result['locked_errors']:>8}"
+                )
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
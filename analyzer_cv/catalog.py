@@ -0,0 +1,112 @@
+import time
+from collections import namedtuple
+from datetime import datetime
+from threading import Lock
+
+from sqlalchemy import insert, update
+
+CATALOG_NAME = "positions"
+
+CatalogKeyword = namedtuple("CatalogKeyword", "id word weight")
+CatalogPosition = namedtuple("CatalogPosition", "id title is_default user_id keywords")
+
+_catalog = None
+_catalog_lock = Lock()
+
+
+class PositionCatalog:
+    # Niezmienna migawka stanowisk ze słowami kluczowymi, współdzielona przez wątki procesu
+
+    def __init__(self, version, updated_at, positions):
+        self.version = version
+        self.updated_at = updated_at
+        self.positions = positions
+        self.by_id = {position.id: position for position in positions}
+        self.checked_at = time.monotonic()
+
+    def get(self, position_id):
+        return self.by_id.get(position_id)
+
+    def default_positions(self):
+        return [position for position in self.positions if position.is_default]
+
+    def user_positions(self, user_id):
+        return [position for position in self.positions if position.user_id == user_id]
+
+    def visible_positions(self, user_id):
+        return [position for position in self.positions if position.is_default or position.user_id == user_id]
+
+
+def catalog_version():
+    from app import db
+    from models import CatalogVersion
+
+    # Zapytanie, nie db.session.get - obiekt z mapy tożsamości sesji mógłby być nieaktualny
+    row = db.session.query(CatalogVersion.version, CatalogVersion.updated_at).filter(
+        CatalogVersion.name == CATALOG_NAME
+    ).first()
+    return tuple(row) if row else (0, None)
+
+
+def get_position_catalog(refresh_seconds):
+    # Wersja w bazie sprawdzana najwyżej raz na refresh_seconds; katalog wczytywany tylko po zmianie
+    global _catalog
+
+    with _catalog_lock:
+        cached = _catalog
+    if cached and time.monotonic() - cached.checked_at < refresh_seconds:
+        return cached
+
+    # Wersja odczytana przed danymi - zmiana w trakcie wczytywania wymusi kolejne odświeżenie
+    version, updated_at = catalog_version()
+    if cached and cached.version == version:
+        cached.checked_at = time.monotonic()
+        return cached
+
+    catalog = load_position_catalog(version, updated_at)
+    with _catalog_lock:
+        _catalog = catalog
+    return catalog
+
+
+def load_position_catalog(version, updated_at):
+    from app import db
+    from models import Keyword, Position
+
+    keywords = {}
+    rows = db.session.query(Keyword.id, Keyword.word, Keyword.weight, Keyword.position_id).order_by(Keyword.id)
+    for keyword_id, word, weight, position_id in rows:
+        keywords.setdefault(position_id, []).append(CatalogKeyword(keyword_id, word, weight))
+
+    positions = [
+        CatalogPosition(position_id, title, bool(is_default), user_id, tuple(keywords.get(position_id, ())))
+        for position_id, title, is_default, user_id in db.session.query(
+            Position.id, Position.title, Position.is_default, Position.user_id
+        ).order_by(Position.id)
+    ]
+    return PositionCatalog(version, updated_at, positions)
+
+
+def bump_catalog_version():
+    # W transakcji zmieniającej stanowiska lub słowa kluczowe - pozostałe procesy gunicorna
+    # zobaczą nową wersję razem z samą zmianą
+    from app import db
+    from models import CatalogVersion
+
+    now = datetime.utcnow().replace(microsecond=0)
+    result = db.session.execute(
+        update(CatalogVersion)
+        .where(CatalogVersion.name == CATALOG_NAME)
+        .values(version=CatalogVersion.version + 1, updated_at=now)
+        .execution_options(synchronize_session=False)
+    )
+    if not result.rowcount:
+        db.session.execute(insert(CatalogVersion).values(name=CATALOG_NAME, version=1, updated_at=now))
+
+
+def invalidate_position_catalog():
+    # Po zatwierdzeniu zmian - bieżący proces nie czeka na kolejne sprawdzenie wersji
+    global _catalog
+
+    with _catalog_lock:
+        _catalog = None
@@ -1,13 +1,24 @@
 from app import create_app, db
+from catalog import bump_catalog_version, invalidate_position_catalog
 from models import Position, Keyword
+from rescoring import delete_keyword_hits
 
 app = create_app()
 
 with app.app_context():
     global_position_ids = [pos.id for pos in Position.query.filter_by(is_default=True).all()]
 
-    Keyword.query.filter(~Keyword.position_id.in_(global_position_ids)).delete(synchronize_session=False)
+    keyword_ids = [
+        keyword_id for keyword_id, in
+        db.session.query(Keyword.id).filter(~Keyword.position_id.in_(global_position_ids))
+    ]
+    if keyword_ids:
+        delete_keyword_hits(keyword_ids=keyword_ids)
+        Keyword.query.filter(Keyword.id.in_(keyword_ids)).delete(synchronize_session=False)
+        # Jak w widokach: nowa wersja katalogu, żeby procesy aplikacji wczytały stanowiska od nowa
+        bump_catalog_version()
 
     db.session.commit()
+    invalidate_position_catalog()
 
     print("Nieaktualne słowa kluczowe zostały usunięte.")
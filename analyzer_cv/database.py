@@ -0,0 +1,52 @@
+from sqlalchemy import event, inspect
+from sqlalchemy.engine import make_url
+
+
+def database_url(value):
+    # DATABASE_URL z Heroku ma schemat postgres://, którego SQLAlchemy 2 już nie akceptuje
+    if not value:
+        return "sqlite:///database.db"
+    if value.startswith("postgres://"):
+        return "postgresql://" + value[len("postgres://"):]
+    return value
+
+
+def engine_options(url, pool_size, max_overflow, pool_timeout, pool_recycle):
+    if make_url(url).get_backend_name() == "sqlite":
+        return {}
+    # Pula połączeń na proces gunicorna; pre-ping odrzuca połączenia zerwane przez serwer lub proxy
+    return {
+        "pool_size": pool_size,
+        "max_overflow": max_overflow,
+        "pool_timeout": pool_timeout,
+        "pool_recycle": pool_recycle,
+        "pool_pre_ping": True,
+    }
+
+
+def configure_sqlite(engine, wal, busy_timeout_ms, mmap_size):
+    if engine.dialect.name != "sqlite":
+        return
+
+    @event.listens_for(engine, "connect")
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        # WAL: czytający nie blokują piszącego, a zapisy kilku procesów czekają na siebie
+        # do busy_timeout zamiast kończyć się błędem "database is locked"
+        cursor = dbapi_connection.cursor()
+        cursor.execute(f"PRAGMA busy_timeout = {int(busy_timeout_ms)}")
+        if wal:
+            cursor.execute("PRAGMA journal_mode = WAL")
+            cursor.execute("PRAGMA synchronous = NORMAL")
+        cursor.execute(f"PRAGMA mmap_size = {int(mmap_size)}")
+        cursor.close()
+
+
+def create_schema(db):
+    # Pusta baza: schemat z modeli oznaczony jako najnowsza migracja, żeby "flask db upgrade" w fazie
+    # release nie dodawał ponownie istniejących kolumn. Starszą bazę aktualizują migracje.
+    from flask_migrate import stamp
+
+    empty = not inspect(db.engine).get_table_names()
+    db.create_all()
+    if empty:
+        stamp()
@@ -0,0 +1,57 @@
+from concurrent.futures import ProcessPoolExecutor
+from threading import BoundedSemaphore, Lock
+
+_executor = None
+_slots = None
+_lock = Lock()
+
+
+class QueueFullError(Exception):
+    pass
+
+
+def _get_executor(app):
+    global _executor, _slots
+    with _lock:
+        if _executor is None:
+            workers = app.config["ANALYSIS_WORKERS"]
+            _executor = ProcessPoolExecutor(max_workers=workers)
+            _slots = BoundedSemaphore(workers + app.config["ANALYSIS_QUEUE_LIMIT"])
+        return _executor, _slots
+
+
+def submit_job(app, fn, args, on_done):
+    executor, slots = _get_executor(app)
+    if not slots.acquire(blocking=False):
+        raise QueueFullError()
+
+    def callback(future):
+        try:
+            with app.app_context():
+                on_done(future)
+        finally:
+            slots.release()
+
+    try:
+        future = executor.submit(fn, *args)
+    except Exception:
+        slots.release()
+        raise
+    future.add_done_callback(callback)
+    return future
+
+
+def map_in_pool(app, fn, args_list):
+    # Współbieżność ograniczona liczbą procesów puli; wyniki w kolejności zgłoszeń
+    executor, _ = _get_executor(app)
+    futures = [executor.submit(fn, *args) for args in args_list]
+    for future in futures:
+        yield future
+
+
+def shutdown_executor(wait=True):
+    global _executor
+    with _lock:
+        if _executor is not None:
+            _executor.shutdown(wait=wait)
+            _executor = None
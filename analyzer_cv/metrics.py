@@ -0,0 +1,119 @@
+import os
+import time
+from contextlib import contextmanager
+
+from flask import g, has_request_context
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Histogram,
+    generate_latest,
+    multiprocess
+)
+
+STAGE_SECONDS = Histogram(
+    "analyzer_stage_seconds", "Czas etapów analizy CV i zapytań", ["stage"],
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120)
+)
+DOCUMENT_PAGES = Histogram(
+    "analyzer_document_pages", "Liczba stron analizowanego dokumentu",
+    buckets=(1, 2, 3, 5, 10, 20, 50, 100)
+)
+DOCUMENTS = Counter(
+    "analyzer_documents_total", "Dokumenty według ścieżki odczytu tekstu (text, ocr, mixed, cache)", ["path"]
+)
+PAGES = Counter("analyzer_pages_total", "Strony według sposobu odczytu (text, ocr)", ["method"])
+OCR_PASSES = Counter(
+    "analyzer_ocr_pages_processed_total", "Strony przetworzone przez OCR według profilu jakości", ["profile"]
+)
+OCR_CONFIDENCE = Histogram(
+    "analyzer_ocr_confidence", "Średnia pewność słów na stronie po OCR (0-100)",
+    buckets=(20, 40, 50, 60, 70, 80, 85, 90, 95, 100)
+)
+UPLOAD_BYTES = Histogram(
+    "analyzer_upload_bytes", "Rozmiar przesłanych plików w bajtach",
+    buckets=(10_000, 50_000, 100_000, 250_000, 500_000, 1_000_000, 2_500_000, 5_000_000, 10_000_000, 20_000_000)
+)
+
+# W procesie puli obserwacje są zbierane i odtwarzane w procesie aplikacji (run_collecting/replay)
+_collected = None
+
+
+def record(kind, *args):
+    if _collected is not None:
+        _collected.append((kind, args))
+        return
+
+    if kind == "stage":
+        name, seconds = args
+        STAGE_SECONDS.labels(name).observe(seconds)
+        if has_request_context():
+            timings = g.setdefault("server_timing", {})
+            timings[name] = timings.get(name, 0.0) + seconds
+    elif kind == "document":
+        methods, = args
+        DOCUMENT_PAGES.observe(len(methods))
+        for method in set(methods):
+            PAGES.labels(method).inc(methods.count(method))
+        DOCUMENTS.labels(document_path(methods)).inc()
+    elif kind == "ocr_pass":
+        profile, pages = args
+        OCR_PASSES.labels(profile).inc(pages)
+    elif kind == "ocr_confidence":
+        confidence, = args
+        OCR_CONFIDENCE.observe(confidence)
+    elif kind == "cache_hit":
+        DOCUMENTS.labels("cache").inc()
+    elif kind == "upload":
+        size, = args
+        UPLOAD_BYTES.observe(size)
+
+
+@contextmanager
+def stage(name):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record("stage", name, time.perf_counter() - start)
+
+
+def document_path(methods):
+    kinds = set(methods)
+    if len(kinds) == 1:
+        return kinds.pop()
+    return "mixed" if kinds else "empty"
+
+
+def run_collecting(fn, *args):
+    global _collected
+    _collected = []
+    try:
+        return fn(*args), _collected
+    finally:
+        _collected = None
+
+
+def replay(observations):
+    for kind, args in observations:
+        record(kind, *args)
+
+
+def server_timing_header():
+    if not has_request_context() or "server_timing" not in g:
+        return None
+    return ", ".join(
+        f"{name};dur={seconds * 1000:.1f}" for name, seconds in g.server_timing.items()
+    )
+
+
+def render_metrics():
+    # Przy kilku procesach (gunicorn) zbiorcze dane z PROMETHEUS_MULTIPROCESS_DIR
+    if os.getenv("PROMETHEUS_MULTIPROCESS_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry), CONTENT_TYPE_LATEST
@@ -4,6 +4,9 @@ from logging.config import fileConfig
 from flask import current_app
 
 from alembic import context
+from alembic.operations import Operations, ops
+from alembic.operations.toimpl import create_index, create_table
+import sqlalchemy as sa
 
 config = context.config
 
@@ -28,10 +31,38 @@ def get_engine_url():
         return str(get_engine().url).replace('%', '%%')
 
 
+# db.create_all() przy starcie aplikacji tworzy brakujące tabele razem z indeksami, zanim
+# "flask db upgrade" dojdzie do migracji, która je dodaje - takie tabele i indeksy są pomijane
+@Operations.implementation_for(ops.CreateTableOp, replace=True)
+def create_table_if_missing(operations, operation):
+    inspector = sa.inspect(operations.get_bind())
+    if inspector.has_table(operation.table_name, schema=operation.schema):
+        return None
+    return create_table(operations, operation)
+
+
+@Operations.implementation_for(ops.CreateIndexOp, replace=True)
+def create_index_if_missing(operations, operation):
+    inspector = sa.inspect(operations.get_bind())
+    if inspector.has_table(operation.table_name, schema=operation.schema) and operation.index_name in {
+        index['name'] for index in inspector.get_indexes(operation.table_name, schema=operation.schema)
+    }:
+        return
+    create_index(operations, operation)
+
+
 config.set_main_option('sqlalchemy.url', get_engine_url())
 target_db = current_app.extensions['migrate'].db
 
 
+def include_object(object, name, type_, reflected, compare_to):
+    # Wirtualna tabela FTS5 candidate_fts i jej tabele pomocnicze (_data, _idx, _content, _docsize,
+    # _config) powstają w search.ensure_search_index, poza modelami - autogenerate ich nie usuwa
+    if type_ == "table" and name.startswith("candidate_fts"):
+        return False
+    return True
+
+
 def get_metadata():
     if hasattr(target_db, 'metadatas'):
         return target_db.metadatas[None]
@@ -42,7 +73,7 @@ def run_migrations_offline():
 
     url = config.get_main_option("sqlalchemy.url")
     context.configure(
-        url=url, target_metadata=get_metadata(), literal_binds=True
+        url=url, target_metadata=get_metadata(), literal_binds=True, include_object=include_object
     )
 
     with context.begin_transaction():
@@ -60,6 +91,7 @@ def run_migrations_online():
     conf_args = current_app.extensions['migrate'].configure_args
     if conf_args.get("process_revision_directives") is None:
         conf_args["process_revision_directives"] = process_revision_directives
+    conf_args.setdefault("include_object", include_object)
 
     connectable = get_engine()
 
@@ -0,0 +1,44 @@
+"""Dodanie kolumny in_ranking do tabeli candidate_score
+
+Revision ID: 5c1e8f2a9d36
+Revises: d8e3b6a17c40
+Create Date: 2026-10-18 14:05:37.214906
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5c1e8f2a9d36'
+down_revision = 'd8e3b6a17c40'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    inspector = sa.inspect(op.get_bind())
+    columns = {column['name'] for column in inspector.get_columns('candidate_score')}
+
+    if 'in_ranking' not in columns:
+        with op.batch_alter_table('candidate_score', schema=None) as batch_op:
+            batch_op.add_column(sa.Column('in_ranking', sa.Boolean(), nullable=False, server_default=sa.false()))
+
+    # W rankingu zostają kandydaci, którzy aplikowali na dane stanowisko
+    candidate = sa.table('candidate', sa.column('id'), sa.column('position_id'))
+    candidate_score = sa.table(
+        'candidate_score', sa.column('candidate_id'), sa.column('position_id'), sa.column('in_ranking')
+    )
+    op.execute(
+        candidate_score.update()
+        .where(sa.exists().where(
+            candidate.c.id == candidate_score.c.candidate_id,
+            candidate.c.position_id == candidate_score.c.position_id
+        ))
+        .values(in_ranking=sa.true())
+    )
+
+
+def downgrade():
+    with op.batch_alter_table('candidate_score', schema=None) as batch_op:
+        batch_op.drop_column('in_ranking')
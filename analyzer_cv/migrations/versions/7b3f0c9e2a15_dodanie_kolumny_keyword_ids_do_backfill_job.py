@@ -0,0 +1,31 @@
+"""Dodanie kolumny keyword_ids do tabeli backfill_job
+
+Revision ID: 7b3f0c9e2a15
+Revises: 9a2d4e6f1b83
+Create Date: 2026-10-18 16:42:09.581337
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '7b3f0c9e2a15'
+down_revision = '9a2d4e6f1b83'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    inspector = sa.inspect(op.get_bind())
+    columns = {column['name'] for column in inspector.get_columns('backfill_job')}
+
+    # NULL - zadanie przelicza wszystkie słowa stanowiska, jak dotychczasowe zadania
+    if 'keyword_ids' not in columns:
+        with op.batch_alter_table('backfill_job', schema=None) as batch_op:
+            batch_op.add_column(sa.Column('keyword_ids', sa.Text(), nullable=True))
+
+
+def downgrade():
+    with op.batch_alter_table('backfill_job', schema=None) as batch_op:
+        batch_op.drop_column('keyword_ids')
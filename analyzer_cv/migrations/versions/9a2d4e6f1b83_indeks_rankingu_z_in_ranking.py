@@ -0,0 +1,35 @@
+"""Indeks rankingu candidate_score z kolumną in_ranking
+
+Revision ID: 9a2d4e6f1b83
+Revises: 5c1e8f2a9d36
+Create Date: 2026-10-18 15:22:48.903117
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9a2d4e6f1b83'
+down_revision = '5c1e8f2a9d36'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Każde przesłanie zapisuje wyniki dla wszystkich domyślnych stanowisk - bez in_ranking w indeksie
+    # ranking przechodziłby przez wyniki całej puli kandydatów, żeby znaleźć kilku, którzy aplikowali
+    inspector = sa.inspect(op.get_bind())
+    indexes = {index['name']: index['column_names'] for index in inspector.get_indexes('candidate_score')}
+
+    if indexes.get('ix_candidate_score_ranking') != ['position_id', 'in_ranking', 'points']:
+        with op.batch_alter_table('candidate_score', schema=None) as batch_op:
+            if 'ix_candidate_score_ranking' in indexes:
+                batch_op.drop_index('ix_candidate_score_ranking')
+            batch_op.create_index('ix_candidate_score_ranking', ['position_id', 'in_ranking', 'points'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('candidate_score', schema=None) as batch_op:
+        batch_op.drop_index('ix_candidate_score_ranking')
+        batch_op.create_index('ix_candidate_score_ranking', ['position_id', 'points'], unique=False)
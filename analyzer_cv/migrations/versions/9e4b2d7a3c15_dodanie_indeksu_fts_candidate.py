@@ -0,0 +1,53 @@
+"""Dodanie indeksu pełnotekstowego candidate_fts
+
+Revision ID: 9e4b2d7a3c15
+Revises: 7c2e94d0f8a1
+Create Date: 2026-10-17 16:10:12.840377
+
+"""
+import unicodedata
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9e4b2d7a3c15'
+down_revision = '7c2e94d0f8a1'
+branch_labels = None
+depends_on = None
+
+
+def fold_text(text):
+    return ''.join(
+        c for c in unicodedata.normalize('NFD', text)
+        if unicodedata.category(c) != 'Mn'
+    ).lower()
+
+
+def upgrade():
+    connection = op.get_bind()
+    if connection.dialect.name != 'sqlite':
+        return
+
+    op.execute(
+        "CREATE VIRTUAL TABLE IF NOT EXISTS candidate_fts "
+        "USING fts5(body, tokenize='unicode61 remove_diacritics 0')"
+    )
+
+    # Zindeksowanie istniejących kandydatów tym samym zwijaniem znaków co remove_diacritics
+    rows = connection.execute(sa.text(
+        "SELECT id, cv_text FROM candidate WHERE id NOT IN (SELECT rowid FROM candidate_fts)"
+    )).all()
+    if rows:
+        connection.execute(
+            sa.text("INSERT INTO candidate_fts(rowid, body) VALUES (:id, :body)"),
+            [{"id": id, "body": fold_text(cv_text or "")} for id, cv_text in rows]
+        )
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+
+    op.execute("DROP TABLE IF EXISTS candidate_fts")
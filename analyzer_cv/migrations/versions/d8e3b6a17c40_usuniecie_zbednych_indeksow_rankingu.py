@@ -0,0 +1,40 @@
+"""Usunięcie zbędnych indeksów rankingu
+
+Revision ID: d8e3b6a17c40
+Revises: a4c7e2f9b318
+Create Date: 2026-10-18 10:12:05.617294
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd8e3b6a17c40'
+down_revision = 'a4c7e2f9b318'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Ranking czyta candidate_score (ix_candidate_score_ranking zaczyna się od position_id),
+    # więc te indeksy tylko spowalniają zapisy kandydatów i punktów
+    inspector = sa.inspect(op.get_bind())
+    candidate_indexes = {index['name'] for index in inspector.get_indexes('candidate')}
+    score_indexes = {index['name'] for index in inspector.get_indexes('candidate_score')}
+
+    if 'ix_candidate_ranking' in candidate_indexes:
+        with op.batch_alter_table('candidate', schema=None) as batch_op:
+            batch_op.drop_index('ix_candidate_ranking')
+
+    if 'ix_candidate_score_position_id' in score_indexes:
+        with op.batch_alter_table('candidate_score', schema=None) as batch_op:
+            batch_op.drop_index('ix_candidate_score_position_id')
+
+
+def downgrade():
+    with op.batch_alter_table('candidate_score', schema=None) as batch_op:
+        batch_op.create_index('ix_candidate_score_position_id', ['position_id'], unique=False)
+
+    with op.batch_alter_table('candidate', schema=None) as batch_op:
+        batch_op.create_index('ix_candidate_ranking', ['position_id', 'points', 'user_id'], unique=False)
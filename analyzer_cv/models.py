@@ -1,4 +1,7 @@
+from datetime import datetime
+
 from app import db
+from search import register_search_index
 from werkzeug.security import generate_password_hash, check_password_hash
 from sqlalchemy import Column, Integer, String, ForeignKey
 from sqlalchemy.orm import relationship
@@ -34,10 +37,82 @@ class Candidate(db.Model):
     phone_number = db.Column(db.String(20), nullable=True)
     user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
     path = db.Column(db.String(255))
+    hits_indexed = db.Column(db.Boolean, nullable=False, default=False)
 
     user = db.relationship("User", back_populates="candidates")
 
 
+class CandidateScore(db.Model):
+    candidate_id = db.Column(db.Integer, db.ForeignKey("candidate.id", ondelete="CASCADE"), primary_key=True)
+    position_id = db.Column(db.Integer, db.ForeignKey("position.id", ondelete="CASCADE"), primary_key=True)
+    points = db.Column(db.Integer, nullable=False, default=0)
+    # Widoczny w rankingu stanowiska: kandydat na nie aplikował albo dodał go backfill nowego stanowiska
+    in_ranking = db.Column(db.Boolean, nullable=False, default=False, server_default=db.false())
+
+    position = db.relationship("Position")
+
+    # Ranking stanowiska czyta punkty z tej tabeli, posortowane malejąco, tylko dla wierszy in_ranking
+    __table_args__ = (
+        db.Index("ix_candidate_score_ranking", "position_id", "in_ranking", "points"),
+    )
+
+
+class KeywordHit(db.Model):
+    candidate_id = db.Column(db.Integer, db.ForeignKey("candidate.id", ondelete="CASCADE"), primary_key=True)
+    keyword_id = db.Column(db.Integer, db.ForeignKey("keyword.id", ondelete="CASCADE"), primary_key=True, index=True)
+    count = db.Column(db.Integer, nullable=False)
+
+
+class AnalysisJob(db.Model):
+    id = db.Column(db.String(32), primary_key=True)
+    status = db.Column(db.String(20), nullable=False, default="pending")
+    name = db.Column(db.String(100), nullable=False)
+    position_id = db.Column(db.Integer, db.ForeignKey("position.id"), nullable=False)
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id'))
+    path = db.Column(db.String(255), nullable=False)
+    candidate_id = db.Column(db.Integer, db.ForeignKey("candidate.id", ondelete="SET NULL"))
+    error = db.Column(db.Text, nullable=True)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    finished_at = db.Column(db.DateTime, nullable=True)
+
+
+class BackfillJob(db.Model):
+    id = db.Column(db.String(32), primary_key=True)
+    position_id = db.Column(db.Integer, db.ForeignKey("position.id", ondelete="CASCADE"), nullable=False, index=True)
+    status = db.Column(db.String(20), nullable=False, default="pending")
+    total = db.Column(db.Integer, nullable=False, default=0)
+    processed = db.Column(db.Integer, nullable=False, default=0)
+    last_candidate_id = db.Column(db.Integer, nullable=False, default=0)
+    max_candidate_id = db.Column(db.Integer, nullable=False, default=0)
+    # Identyfikatory nowych lub zmienionych słów kluczowych ("3,7"); NULL - wszystkie słowa nowego stanowiska
+    keyword_ids = db.Column(db.Text, nullable=True)
+    error = db.Column(db.Text, nullable=True)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow)
+    finished_at = db.Column(db.DateTime, nullable=True)
+
+
+class TextCache(db.Model):
+    file_hash = db.Column(db.String(64), primary_key=True)
+    text = db.Column(db.Text, nullable=False)
+    page_methods = db.Column(db.Text, nullable=True)
+    size = db.Column(db.Integer, nullable=False)
+    last_used_at = db.Column(db.DateTime, default=datetime.utcnow, index=True)
+
+
+class SeedVersion(db.Model):
+    name = db.Column(db.String(50), primary_key=True)
+    content_hash = db.Column(db.String(64), nullable=False)
+    applied_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+
+class CatalogVersion(db.Model):
+    # Licznik zmian stanowisk i słów kluczowych - procesy porównują go ze swoją kopią katalogu
+    name = db.Column(db.String(50), primary_key=True)
+    version = db.Column(db.Integer, nullable=False, default=0)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+
 class User(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     username = db.Column(db.String(100), unique=True, nullable=False)
@@ -53,3 +128,5 @@ class User(db.Model):
     def check_password(self, password):
         return check_password_hash(self.password_hash, password)
 
+
+register_search_index(Candidate)
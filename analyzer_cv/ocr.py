@@ -0,0 +1,174 @@
+import json
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+from PIL import Image
+from pypdf import PdfReader
+
+from metrics import record, stage
+from ocr_engines import get_ocr_engine
+from rasterizers import get_rasterizer
+from thumbnails import save_thumbnail, thumbnail_path
+
+# Profile OCR od najtańszego: strona przechodzi do następnego profilu tylko wtedy,
+# gdy średnia pewność rozpoznanych słów jest niższa niż min_confidence
+DEFAULT_OCR_PROFILES = [
+    {"name": "fast", "dpi": 150, "grayscale": True, "lang": "pol+eng", "psm": 6, "min_confidence": 80},
+    {"name": "accurate", "dpi": 300, "grayscale": True, "lang": "pol+eng", "psm": 3, "min_confidence": 0},
+]
+
+
+def load_ocr_profiles(value):
+    # OCR_PROFILES: lista profili w JSON, brakujące pola uzupełniane z profilu "fast"
+    if not value:
+        return DEFAULT_OCR_PROFILES
+    profiles = []
+    for index, profile in enumerate(json.loads(value)):
+        profiles.append({**DEFAULT_OCR_PROFILES[0], "name": f"profile{index + 1}", **profile})
+    if not profiles:
+        raise ValueError("OCR_PROFILES musi zawierać co najmniej jeden profil")
+    return profiles
+
+
+def extract_cv_text(
+    file_path, page_workers=1, min_text_chars=20, thumbnails=None, profiles=None, max_pages=30, engine="auto",
+    rasterizer="auto"
+):
+    text, methods = read_cv_text(
+        file_path, page_workers, min_text_chars, thumbnails, profiles or DEFAULT_OCR_PROFILES, max_pages,
+        get_ocr_engine(engine), get_rasterizer(rasterizer)
+    )
+    record("document", methods)
+    return text, methods
+
+
+def read_cv_text(file_path, page_workers, min_text_chars, thumbnails, profiles, max_pages, engine, rasterizer):
+    with stage("text_layer"):
+        page_texts = read_text_layer(file_path)
+
+    if page_texts is None:
+        # Plik nieczytelny dla pypdf - wszystkie strony przez OCR
+        page_texts = [""] * rasterizer.page_count(file_path)
+        missing_pages = list(range(1, len(page_texts) + 1))
+    else:
+        missing_pages = [
+            number for number, text in enumerate(page_texts, start=1)
+            if not has_usable_text(text, min_text_chars)
+        ]
+
+    methods = ["text"] * len(page_texts)
+    # Strony ponad limit OCR zostają bez tekstu
+    for number in missing_pages[max_pages:]:
+        methods[number - 1] = "skipped"
+    missing_pages = missing_pages[:max_pages]
+
+    if missing_pages:
+        texts = ocr_pages(file_path, missing_pages, page_workers, profiles, thumbnails, engine, rasterizer)
+        for number, text in zip(missing_pages, texts):
+            page_texts[number - 1] = text
+            methods[number - 1] = "ocr"
+
+    # Strony z warstwą tekstową nie są rasteryzowane - ich miniatury powstają przy pierwszym podglądzie
+    return " ".join(page_texts), methods
+
+
+def ocr_pages(file_path, page_numbers, page_workers, profiles, thumbnails, engine, rasterizer):
+    # Strony rasteryzowane pojedynczo (do obrazu w pamięci albo pliku tymczasowego) i zwalniane
+    # zaraz po OCR, więc naraz istnieje najwyżej page_workers obrazów, niezależnie od liczby stron.
+    # pdftoppm i tesseract działają w osobnych procesach, a tesserocr zwalnia GIL podczas OCR,
+    # więc wątki wystarczą do równoległości.
+    with tempfile.TemporaryDirectory(prefix="analyzer-ocr-") as work_dir:
+        def run(number):
+            return ocr_page(file_path, number, profiles, work_dir, thumbnails, engine, rasterizer)
+
+        if page_workers > 1 and len(page_numbers) > 1:
+            with ThreadPoolExecutor(max_workers=min(page_workers, len(page_numbers))) as executor:
+                results = list(executor.map(run, page_numbers))
+        else:
+            results = [run(number) for number in page_numbers]
+
+    # Czasy etapów to suma po stronach (przy kilku wątkach może przekroczyć czas żądania)
+    passes = dict.fromkeys((profile["name"] for profile in profiles), 0)
+    totals = {}
+    for _, confidence, page_passes, timings in results:
+        record("ocr_confidence", confidence)
+        for name in page_passes:
+            passes[name] += 1
+        for name, seconds in timings.items():
+            totals[name] = totals.get(name, 0.0) + seconds
+    for name, count in passes.items():
+        if count:
+            record("ocr_pass", name, count)
+    for name, seconds in totals.items():
+        record("stage", name, seconds)
+    return [text for text, *_ in results]
+
+
+def ocr_page(file_path, number, profiles, work_dir, thumbnails, engine, rasterizer):
+    # Drabina profili dla jednej strony: kolejny profil tylko przy niskiej pewności,
+    # zostaje wynik z najwyższą pewnością
+    best_text, best_confidence = "", None
+    passes = []
+    timings = {}
+    for level, profile in enumerate(profiles):
+        with timed(timings, "rasterize"):
+            page = rasterizer.render(file_path, number, profile, work_dir, f"p{number}-{level}")
+        if page is None:
+            break
+        try:
+            with timed(timings, "ocr"):
+                text, confidence = engine.recognize(page, profile)
+            if level == 0 and thumbnails:
+                with timed(timings, "thumbnails"):
+                    save_page_thumbnail(page, file_path, number, thumbnails)
+        finally:
+            rasterizer.release(page)
+
+        passes.append(profile["name"])
+        if best_confidence is None or confidence >= best_confidence:
+            best_text, best_confidence = text, confidence
+        if confidence >= profile["min_confidence"]:
+            break
+    return best_text, best_confidence or 0.0, passes, timings
+
+
+@contextmanager
+def timed(timings, name):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings[name] = timings.get(name, 0.0) + time.perf_counter() - start
+
+
+def save_page_thumbnail(page, file_path, number, thumbnails):
+    # Ponowne użycie obrazu strony zrasteryzowanej do OCR (obraz PIL albo plik strony)
+    if not thumbnails or number > thumbnails["max_pages"]:
+        return
+    try:
+        image = Image.open(page) if isinstance(page, str) else page
+        try:
+            save_thumbnail(
+                image, thumbnail_path(file_path, number, thumbnails["format"]),
+                thumbnails["width"], thumbnails["format"]
+            )
+        finally:
+            if image is not page:
+                image.close()
+    except Exception:
+        # Brak miniatury nie może przerwać analizy - zostanie wygenerowana przy podglądzie
+        pass
+
+
+def read_text_layer(file_path):
+    try:
+        reader = PdfReader(file_path)
+        return [page.extract_text() or "" for page in reader.pages]
+    except Exception:
+        return None
+
+
+def has_usable_text(text, min_text_chars):
+    return sum(ch.isalnum() for ch in text) >= min_text_chars
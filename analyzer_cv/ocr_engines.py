@@ -0,0 +1,151 @@
+import os
+from threading import Lock
+
+from pytesseract import Output, get_languages, image_to_data
+
+try:
+    import tesserocr
+except ImportError:
+    tesserocr = None
+
+_engines = {}
+_lock = Lock()
+
+
+class PytesseractEngine:
+    # Osobny proces tesseract dla każdej strony: modele językowe wczytywane za każdym razem
+    name = "pytesseract"
+
+    def __init__(self):
+        self.languages = None
+
+    def lang(self, lang):
+        if self.languages is None:
+            try:
+                self.languages = set(get_languages(config=""))
+            except Exception:
+                self.languages = set()
+        return installed_lang(lang, self.languages)
+
+    def recognize(self, image, profile):
+        data = image_to_data(
+            image, lang=self.lang(profile["lang"]), config=f"--psm {profile['psm']} --dpi {profile['dpi']}",
+            output_type=Output.DICT
+        )
+        return read_ocr_data(data)
+
+
+class TesserocrEngine:
+    # Uchwyty API Tesseracta trzymane przez cały czas życia procesu, osobno dla każdego języka.
+    # Uchwyt nie może być używany przez dwa wątki naraz, więc wątek pobiera wolny z puli
+    # albo tworzy nowy - w puli zostaje ich najwyżej tyle, ile stron było OCR-owanych równolegle.
+    name = "tesserocr"
+
+    def __init__(self):
+        self.pid = os.getpid()
+        self.idle = {}
+        self.lock = Lock()
+        self.languages = set(tesserocr.get_languages()[1])
+        # Pierwszy uchwyt od razu: tesserocr importuje się także bez działającego Tesseracta
+        # (np. bez danych językowych), a wtedy PyTessBaseAPI zgłasza RuntimeError już tutaj
+        lang = installed_lang("eng", self.languages)
+        self.idle[lang] = [tesserocr.PyTessBaseAPI(lang=lang)]
+
+    def acquire(self, lang):
+        with self.lock:
+            handles = self.idle.setdefault(lang, [])
+            if handles:
+                return handles.pop()
+        return tesserocr.PyTessBaseAPI(lang=lang)
+
+    def release(self, lang, api):
+        with self.lock:
+            self.idle[lang].append(api)
+
+    def recognize(self, image, profile):
+        lang = installed_lang(profile["lang"], self.languages)
+        api = self.acquire(lang)
+        try:
+            api.SetPageSegMode(profile["psm"])
+            # Obraz z pamięci (PIL) albo plik strony - bez ponownego kodowania do pliku tymczasowego
+            if isinstance(image, str):
+                api.SetImageFile(image)
+            else:
+                api.SetImage(image)
+            api.SetSourceResolution(profile["dpi"])
+            api.Recognize()
+            data = parse_tsv(api.GetTSVText(0))
+        finally:
+            api.Clear()
+            self.release(lang, api)
+        return read_ocr_data(data)
+
+
+def get_ocr_engine(name):
+    # OCR_ENGINE: "tesserocr", "pytesseract" albo "auto" (tesserocr, jeśli jest zainstalowany i działa)
+    with _lock:
+        engine = _engines.get(name)
+        # Po fork() w puli procesów uchwyty rodzica nie są używane
+        if engine is None or getattr(engine, "pid", os.getpid()) != os.getpid():
+            engine = create_ocr_engine(name)
+            _engines[name] = engine
+        return engine
+
+
+def create_ocr_engine(name):
+    if name == "auto":
+        if tesserocr is None:
+            return PytesseractEngine()
+        try:
+            return TesserocrEngine()
+        except RuntimeError:
+            # API Tesseracta nie startuje w procesie - osobny proces tesseract przez pytesseract
+            return PytesseractEngine()
+    if name == "tesserocr":
+        if tesserocr is None:
+            raise RuntimeError("OCR_ENGINE=tesserocr wymaga pakietu tesserocr")
+        return TesserocrEngine()
+    if name == "pytesseract":
+        return PytesseractEngine()
+    raise ValueError(f"Nieznany silnik OCR: {name}")
+
+
+def installed_lang(lang, available):
+    # Tylko języki profilu z zainstalowanymi danymi (np. obraz bez tesseract-ocr-pol czyta "pol+eng"
+    # jako "eng"); gdy listy języków nie da się odczytać, profil zostaje bez zmian
+    if not available:
+        return lang
+    return "+".join(name for name in lang.split("+") if name in available) or "eng"
+
+
+def parse_tsv(tsv):
+    # Wynik GetTSVText w tym samym układzie co image_to_data(output_type=Output.DICT)
+    data = {"block_num": [], "par_num": [], "line_num": [], "text": [], "conf": []}
+    for row in tsv.splitlines():
+        cells = row.split("\t")
+        if len(cells) < 12:
+            continue
+        data["block_num"].append(int(cells[2]))
+        data["par_num"].append(int(cells[3]))
+        data["line_num"].append(int(cells[4]))
+        data["conf"].append(float(cells[10]))
+        data["text"].append(cells[11])
+    return data
+
+
+def read_ocr_data(data):
+    # Tekst składany z linii rozpoznanych przez Tesseracta, pewność strony to średnia
+    # pewności słów ważona ich długością (krótkie artefakty skanu mniej zaniżają wynik)
+    lines = {}
+    confidence_sum = weight = 0
+    for block, paragraph, line, word, confidence in zip(
+        data["block_num"], data["par_num"], data["line_num"], data["text"], data["conf"]
+    ):
+        word = word.strip()
+        if not word or confidence < 0:
+            continue
+        lines.setdefault((block, paragraph, line), []).append(word)
+        confidence_sum += confidence * len(word)
+        weight += len(word)
+    text = "\n".join(" ".join(words) for words in lines.values())
+    return text, confidence_sum / weight if weight else 0.0
@@ -0,0 +1,197 @@
+import csv
+import io
+
+from sqlalchemy import insert, update
+
+CSV_FIELDS = ["title", "word", "weight"]
+MAX_TITLE_LENGTH = 100
+MAX_WORD_LENGTH = 50
+# Zakres wag z formularza edycji stanowiska
+FORM_WEIGHTS = range(1, 6)
+
+
+def parse_keyword(value, default_weight=1, weight_suffix=False):
+    # {"word": "Python", "weight": 5} albo samo słowo; w formularzu także "Python:5".
+    # Przyrostek jest wagą tylko, gdy to liczba z zakresu formularza - "ISO:9001" zostaje słowem.
+    if isinstance(value, dict):
+        word, weight = value.get("word"), value.get("weight", default_weight)
+    else:
+        word, weight = str(value), default_weight
+        parts = word.rsplit(":", 1)
+        if weight_suffix and len(parts) == 2 and parts[1].strip().isdigit() and int(parts[1]) in FORM_WEIGHTS:
+            word, weight = parts
+    word = (word or "").strip()
+    if len(word) > MAX_WORD_LENGTH:
+        raise ValueError(f"Słowo kluczowe dłuższe niż {MAX_WORD_LENGTH} znaków: {word[:MAX_WORD_LENGTH]}…")
+    try:
+        weight = int(weight)
+    except (TypeError, ValueError):
+        raise ValueError(f"Waga słowa „{word}” musi być liczbą całkowitą.")
+    if weight < 0:
+        raise ValueError(f"Waga słowa „{word}” nie może być ujemna.")
+    return word, weight
+
+
+def parse_keywords(values, weight_suffix=False):
+    # Pierwsze wystąpienie słowa wygrywa, tak jak w danych startowych
+    words = {}
+    for value in values:
+        word, weight = parse_keyword(value, weight_suffix=weight_suffix)
+        if word:
+            words.setdefault(word, weight)
+    return words
+
+
+def parse_positions(data):
+    # {"positions": [{"title": ..., "keywords": [...]}, ...]} albo sama lista stanowisk
+    if isinstance(data, dict):
+        data = data.get("positions")
+    if not isinstance(data, list):
+        raise ValueError("Oczekiwano listy stanowisk.")
+
+    positions = {}
+    for item in data:
+        if not isinstance(item, dict) or not isinstance(item.get("keywords", []), list):
+            raise ValueError("Każde stanowisko musi mieć pola title i keywords (lista).")
+        title = str(item.get("title") or "").strip()
+        if not title:
+            raise ValueError("Stanowisko bez nazwy.")
+        if len(title) > MAX_TITLE_LENGTH:
+            raise ValueError(f"Nazwa stanowiska dłuższa niż {MAX_TITLE_LENGTH} znaków: {title[:MAX_TITLE_LENGTH]}…")
+        words = positions.setdefault(title, {})
+        for word, weight in parse_keywords(item.get("keywords", [])).items():
+            words.setdefault(word, weight)
+    return positions
+
+
+def parse_positions_csv(text):
+    # Jeden wiersz na słowo kluczowe: title,word,weight
+    reader = csv.DictReader(io.StringIO(text))
+    if not reader.fieldnames or not {"title", "word"} <= set(reader.fieldnames):
+        raise ValueError("Plik CSV musi mieć kolumny title, word i opcjonalnie weight.")
+    grouped = {}
+    for row in reader:
+        keywords = grouped.setdefault((row["title"] or "").strip(), [])
+        if (row["word"] or "").strip():
+            keywords.append({"word": row["word"], "weight": row.get("weight") or 1})
+    return parse_positions([{"title": title, "keywords": keywords} for title, keywords in grouped.items()])
+
+
+def export_positions(user_id, include_default=False):
+    from app import db
+    from models import Keyword, Position
+
+    query = db.session.query(Position.id, Position.title).filter(Position.user_id == user_id)
+    if include_default:
+        query = query.union(db.session.query(Position.id, Position.title).filter(Position.is_default.is_(True)))
+    positions = {position_id: {"title": title, "keywords": []} for position_id, title in query}
+
+    rows = (
+        db.session.query(Keyword.position_id, Keyword.word, Keyword.weight)
+        .filter(Keyword.position_id.in_(positions))
+        .order_by(Keyword.position_id, Keyword.id)
+    )
+    for position_id, word, weight in rows:
+        positions[position_id]["keywords"].append({"word": word, "weight": weight})
+    return [positions[position_id] for position_id in sorted(positions)]
+
+
+def positions_csv(positions):
+    output = io.StringIO()
+    writer = csv.writer(output)
+    writer.writerow(CSV_FIELDS)
+    for position in positions:
+        for keyword in position["keywords"]:
+            writer.writerow([position["title"], keyword["word"], keyword["weight"]])
+    return output.getvalue()
+
+
+def import_positions(user_id, positions, replace_keywords=True):
+    # Całość w jednej transakcji: stanowiska dopasowane po nazwie wśród stanowisk użytkownika,
+    # słowa kluczowe porównane z bazą i zapisane kilkoma zapytaniami zbiorczymi.
+    # Zwraca podsumowanie i {id stanowiska: id nowych słów} do przeliczenia po zatwierdzeniu;
+    # None dla nowego stanowiska - wszystkie jego słowa.
+    from app import db
+    from catalog import bump_catalog_version
+    from models import Keyword, Position
+
+    existing = {}
+    for position in Position.query.filter_by(user_id=user_id).order_by(Position.id):
+        existing.setdefault(position.title, position)
+    current = {}
+    for keyword in Keyword.query.filter(Keyword.position_id.in_([p.id for p in existing.values()])):
+        current.setdefault(keyword.position_id, {})[keyword.word] = keyword
+
+    summary = {"created": 0, "updated": 0, "unchanged": 0, "keywords_added": 0, "keywords_updated": 0,
+               "keywords_removed": 0}
+    new_positions = []
+    new_rows, updates, deleted_ids = [], [], []
+    touched = {}
+
+    for title, words in positions.items():
+        position = existing.get(title)
+        if position is None:
+            position = Position(title=title, user_id=user_id)
+            new_positions.append((position, words))
+            continue
+
+        keywords = dict(current.get(position.id, {}))
+        added, changed = [], 0
+        for word, weight in words.items():
+            keyword = keywords.pop(word, None)
+            if keyword is None:
+                new_rows.append({"word": word, "weight": weight, "position_id": position.id})
+                added.append(word)
+            elif keyword.weight != weight:
+                updates.append({"id": keyword.id, "weight": weight})
+                changed += 1
+        removed = list(keywords.values()) if replace_keywords else []
+        deleted_ids.extend(keyword.id for keyword in removed)
+
+        summary["keywords_added"] += len(added)
+        summary["keywords_updated"] += changed
+        summary["keywords_removed"] += len(removed)
+        if added or changed or removed:
+            summary["updated"] += 1
+            touched[position.id] = added
+        else:
+            summary["unchanged"] += 1
+
+    db.session.add_all(position for position, _ in new_positions)
+    db.session.flush()
+    for position, words in new_positions:
+        new_rows.extend({"word": word, "weight": weight, "position_id": position.id} for word, weight in words.items())
+        touched[position.id] = None
+        summary["created"] += 1
+        summary["keywords_added"] += len(words)
+
+    apply_keyword_changes(new_rows, updates, deleted_ids)
+    # Słowa zapisane zbiorczo, bez identyfikatorów - odczyt po stanowisku i słowie
+    for position_id, added in touched.items():
+        if added:
+            touched[position_id] = [
+                keyword_id for keyword_id, in db.session.query(Keyword.id).filter(
+                    Keyword.position_id == position_id, Keyword.word.in_(added)
+                )
+            ]
+    if touched:
+        bump_catalog_version()
+    db.session.commit()
+
+    return summary, touched
+
+
+def apply_keyword_changes(new_rows, updates, deleted_ids):
+    # Kilka zapytań zbiorczych zamiast jednego zapytania na słowo kluczowe
+    from app import db
+    from models import Keyword
+    from rescoring import delete_keyword_hits
+
+    if deleted_ids:
+        delete_keyword_hits(keyword_ids=deleted_ids)
+        Keyword.query.filter(Keyword.id.in_(deleted_ids)).delete(synchronize_session=False)
+    if updates:
+        db.session.execute(update(Keyword), updates)
+    if new_rows:
+        db.session.execute(insert(Keyword), new_rows)
+
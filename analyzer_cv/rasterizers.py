@@ -0,0 +1,83 @@
+import os
+from threading import Lock
+
+from pdf2image import convert_from_path, pdfinfo_from_path
+
+try:
+    import pypdfium2 as pdfium
+except ImportError:
+    pdfium = None
+
+_rasterizers = {}
+_lock = Lock()
+# PDFium nie jest bezpieczny wątkowo - renderowanie stron odbywa się pojedynczo
+_pdfium_lock = Lock()
+
+
+class PopplerRasterizer:
+    # pdftoppm w osobnym procesie, strona zapisywana do pliku w katalogu roboczym
+    name = "poppler"
+
+    def page_count(self, file_path):
+        return pdfinfo_from_path(file_path)["Pages"]
+
+    def render(self, file_path, number, profile, work_dir, name):
+        paths = convert_from_path(
+            file_path, dpi=profile["dpi"], grayscale=profile["grayscale"], first_page=number, last_page=number,
+            output_folder=work_dir, output_file=name, single_file=True, paths_only=True
+        )
+        return paths[0] if paths else None
+
+    def release(self, page):
+        os.remove(page)
+
+
+class PdfiumRasterizer:
+    # Renderowanie w procesie aplikacji prosto do obrazu PIL, bez pdftoppm i pliku pośredniego
+    name = "pdfium"
+
+    def page_count(self, file_path):
+        with _pdfium_lock:
+            document = pdfium.PdfDocument(file_path)
+            try:
+                return len(document)
+            finally:
+                document.close()
+
+    def render(self, file_path, number, profile, work_dir, name):
+        with _pdfium_lock:
+            document = pdfium.PdfDocument(file_path)
+            try:
+                if number > len(document):
+                    return None
+                page = document[number - 1]
+                bitmap = page.render(scale=profile["dpi"] / 72, grayscale=profile["grayscale"])
+                # Kopia, bo obraz z to_pil() współdzieli bufor zwalniany razem z bitmapą
+                image = bitmap.to_pil().copy()
+                bitmap.close()
+                page.close()
+            finally:
+                document.close()
+        return image
+
+    def release(self, page):
+        page.close()
+
+
+def get_rasterizer(name):
+    # OCR_RASTERIZER: "pdfium", "poppler" albo "auto" (pdfium, jeśli pypdfium2 jest zainstalowany)
+    if name == "auto":
+        name = "pdfium" if pdfium is not None else "poppler"
+    with _lock:
+        rasterizer = _rasterizers.get(name)
+        if rasterizer is None:
+            if name == "pdfium":
+                if pdfium is None:
+                    raise RuntimeError("OCR_RASTERIZER=pdfium wymaga pakietu pypdfium2")
+                rasterizer = PdfiumRasterizer()
+            elif name == "poppler":
+                rasterizer = PopplerRasterizer()
+            else:
+                raise ValueError(f"Nieznany sposób rasteryzacji: {name}")
+            _rasterizers[name] = rasterizer
+        return rasterizer
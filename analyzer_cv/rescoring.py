@@ -0,0 +1,98 @@
+from sqlalchemy import func, insert, select, update
+
+from scoring import KeywordMatcher
+
+BATCH_SIZE = 200
+
+
+def index_keyword_hits(candidate_ids, keywords):
+    from app import db, remove_diacritics, normalize_keyword
+    from models import Candidate, KeywordHit
+
+    if not candidate_ids or not keywords:
+        return
+
+    matcher = KeywordMatcher([keyword.word for keyword in keywords], normalize_keyword)
+
+    for start in range(0, len(candidate_ids), BATCH_SIZE):
+        batch = candidate_ids[start:start + BATCH_SIZE]
+        texts = db.session.query(Candidate.id, Candidate.cv_text).filter(Candidate.id.in_(batch))
+
+        rows = []
+        for candidate_id, cv_text in texts:
+            counts = matcher.count(remove_diacritics(cv_text).lower())
+            rows.extend(
+                {"candidate_id": candidate_id, "keyword_id": keyword.id, "count": counts[keyword.word]}
+                for keyword in keywords if counts[keyword.word]
+            )
+
+        KeywordHit.query.filter(
+            KeywordHit.candidate_id.in_(batch),
+            KeywordHit.keyword_id.in_([keyword.id for keyword in keywords])
+        ).delete(synchronize_session=False)
+        if rows:
+            db.session.execute(insert(KeywordHit), rows)
+
+
+def rescore_position(position_id, changed_keyword_ids=()):
+    from app import db
+    from models import Candidate, CandidateScore, Keyword
+
+    keywords = Keyword.query.filter_by(position_id=position_id).all()
+
+    # Kandydaci sprzed wprowadzenia tabeli keyword_hit - jednorazowe pełne skanowanie
+    unindexed_ids = [
+        candidate_id for candidate_id, in db.session.query(Candidate.id)
+        .filter(Candidate.position_id == position_id, Candidate.hits_indexed.is_(False))
+    ]
+    if unindexed_ids:
+        index_keyword_hits(unindexed_ids, keywords)
+        Candidate.query.filter(Candidate.id.in_(unindexed_ids)).update(
+            {"hits_indexed": True}, synchronize_session=False
+        )
+
+    # Skanowanie tekstu tylko dla nowych lub zmienionych słów kluczowych
+    changed_keyword_ids = set(changed_keyword_ids)
+    changed = [keyword for keyword in keywords if keyword.id in changed_keyword_ids]
+    if changed:
+        skipped = set(unindexed_ids)
+        scored_ids = db.session.query(Candidate.id).filter(Candidate.position_id == position_id).union(
+            db.session.query(CandidateScore.candidate_id).filter(CandidateScore.position_id == position_id)
+        )
+        indexed_ids = [candidate_id for candidate_id, in scored_ids if candidate_id not in skipped]
+        index_keyword_hits(indexed_ids, changed)
+
+    db.session.execute(
+        update(Candidate)
+        .where(Candidate.position_id == position_id)
+        .values(points=points_subquery(Candidate.id, position_id))
+        .execution_options(synchronize_session=False)
+    )
+    db.session.execute(
+        update(CandidateScore)
+        .where(CandidateScore.position_id == position_id)
+        .values(points=points_subquery(CandidateScore.candidate_id, position_id))
+        .execution_options(synchronize_session=False)
+    )
+    db.session.commit()
+
+
+def points_subquery(candidate_id_column, position_id):
+    from models import Keyword, KeywordHit
+
+    return (
+        select(func.coalesce(func.sum(KeywordHit.count * Keyword.weight), 0))
+        .select_from(KeywordHit)
+        .join(Keyword, Keyword.id == KeywordHit.keyword_id)
+        .where(KeywordHit.candidate_id == candidate_id_column, Keyword.position_id == position_id)
+        .scalar_subquery()
+    )
+
+
+def delete_keyword_hits(keyword_ids=(), candidate_ids=()):
+    from models import KeywordHit
+
+    if keyword_ids:
+        KeywordHit.query.filter(KeywordHit.keyword_id.in_(keyword_ids)).delete(synchronize_session=False)
+    if candidate_ids:
+        KeywordHit.query.filter(KeywordHit.candidate_id.in_(candidate_ids)).delete(synchronize_session=False)
@@ -0,0 +1,106 @@
+from collections import OrderedDict, deque
+from threading import Lock
+
+
+class KeywordMatcher:
+    # Automat Aho-Corasick: wszystkie słowa kluczowe w jednym przejściu po tekście.
+    # Liczenie zgodne z str.count - wystąpienia tego samego słowa nie nakładają się.
+
+    def __init__(self, words, normalize=None):
+        self.forms = {word: normalize(word) if normalize else word for word in words}
+        self.patterns = list(dict.fromkeys(self.forms.values()))
+        self._build()
+
+    def _build(self):
+        goto = [{}]
+        outputs = [[]]
+
+        for index, pattern in enumerate(self.patterns):
+            if not pattern:
+                continue
+            state = 0
+            for ch in pattern:
+                next_state = goto[state].get(ch)
+                if next_state is None:
+                    next_state = len(goto)
+                    goto[state][ch] = next_state
+                    goto.append({})
+                    outputs.append([])
+                state = next_state
+            outputs[state].append((index, len(pattern)))
+
+        # Pełna tablica przejść (DFA) - w pętli skanowania nie ma cofania po "fail".
+        fail = [0] * len(goto)
+        delta = [dict(goto[0])]
+        delta.extend({} for _ in range(len(goto) - 1))
+        queue = deque(goto[0].values())
+
+        while queue:
+            state = queue.popleft()
+            delta[state] = dict(delta[fail[state]])
+            for ch, next_state in goto[state].items():
+                fail[next_state] = delta[fail[state]].get(ch, 0)
+                delta[state][ch] = next_state
+                outputs[next_state] = outputs[next_state] + outputs[fail[next_state]]
+                queue.append(next_state)
+
+        self._delta = delta
+        self._outputs = [tuple(out) for out in outputs]
+
+    def count(self, text):
+        counts = [0] * len(self.patterns)
+        last_end = [-1] * len(self.patterns)
+        delta = self._delta
+        outputs = self._outputs
+        state = 0
+
+        for position, ch in enumerate(text):
+            state = delta[state].get(ch, 0)
+            if state:
+                for index, length in outputs[state]:
+                    if position - length >= last_end[index]:
+                        counts[index] += 1
+                        last_end[index] = position
+
+        for index, pattern in enumerate(self.patterns):
+            if not pattern:
+                counts[index] = len(text) + 1
+
+        by_pattern = dict(zip(self.patterns, counts))
+        return {word: by_pattern[form] for word, form in self.forms.items()}
+
+
+# Automat dla domyślnych stanowisk zajmuje kilka MB, a każdy użytkownik z własnymi stanowiskami
+# ma osobny zestaw - w procesie zostaje tylko MAX_MATCHERS ostatnio używanych (LRU)
+MAX_MATCHERS = 8
+
+_matchers = OrderedDict()
+_matchers_lock = Lock()
+
+
+def get_matcher(position_ids, words, normalize=None):
+    # Jeden automat może obejmować słowa kluczowe kilku stanowisk naraz
+    key = tuple(sorted(position_ids))
+    signature = tuple(sorted(set(words)))
+    with _matchers_lock:
+        cached = _matchers.get(key)
+        if cached and cached[0] == signature:
+            _matchers.move_to_end(key)
+            return cached[1]
+
+    matcher = KeywordMatcher(signature, normalize)
+    with _matchers_lock:
+        _matchers[key] = (signature, matcher)
+        _matchers.move_to_end(key)
+        while len(_matchers) > MAX_MATCHERS:
+            _matchers.popitem(last=False)
+    return matcher
+
+
+def invalidate_matcher(position_id=None):
+    with _matchers_lock:
+        if position_id is None:
+            _matchers.clear()
+        else:
+            for key in [key for key in _matchers if position_id in key]:
+                del _matchers[key]
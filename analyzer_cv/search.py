@@ -0,0 +1,141 @@
+import re
+
+from markupsafe import Markup, escape
+from sqlalchemy import event, func, text
+
+from textnorm import normalize_text, remove_diacritics
+
+FTS_TABLE = "candidate_fts"
+TERM_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+# Znaki łacińskie, które remove_diacritics zamienia na jedną literę - dla translate() w PostgreSQL
+FOLD_FROM, FOLD_TO = (
+    "".join(chars) for chars in zip(*(
+        (chr(code), remove_diacritics(chr(code)).lower()) for code in range(0xC0, 0x250)
+        if len(remove_diacritics(chr(code))) == 1 and remove_diacritics(chr(code)) != chr(code)
+    ))
+)
+
+
+def fold_text(value):
+    return normalize_text(value)[1]
+
+
+def is_sqlite(connection):
+    return connection.dialect.name == "sqlite"
+
+
+def ensure_search_index(engine):
+    with engine.begin() as connection:
+        if is_sqlite(connection):
+            connection.execute(text(
+                f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} "
+                "USING fts5(body, tokenize='unicode61 remove_diacritics 0')"
+            ))
+
+
+def register_search_index(candidate_model):
+    # Indeks FTS aktualizowany razem z wstawieniem/usunięciem kandydata, w tej samej transakcji
+    @event.listens_for(candidate_model, "after_insert")
+    def index_candidate(mapper, connection, target):
+        if is_sqlite(connection):
+            connection.execute(
+                text(f"INSERT INTO {FTS_TABLE}(rowid, body) VALUES (:id, :body)"),
+                {"id": target.id, "body": fold_text(target.cv_text)}
+            )
+
+    @event.listens_for(candidate_model, "after_delete")
+    def unindex_candidate(mapper, connection, target):
+        if is_sqlite(connection):
+            connection.execute(text(f"DELETE FROM {FTS_TABLE} WHERE rowid = :id"), {"id": target.id})
+
+
+def query_terms(query):
+    return TERM_PATTERN.findall(fold_text(query))
+
+
+def build_match_query(terms):
+    # Każde słowo w cudzysłowie - składnia FTS5 z zapytania użytkownika nie jest interpretowana
+    return " ".join(f'"{term}"' for term in terms)
+
+
+def search_candidates(query, user_id, limit):
+    from app import db
+    from models import Candidate
+
+    terms = query_terms(query)
+    if not terms:
+        return []
+
+    if not is_sqlite(db.session.connection()):
+        # PostgreSQL bez indeksu FTS: całe słowa w tekście zwiniętym jak remove_diacritics().lower()
+        folded = func.translate(func.lower(Candidate.cv_text), FOLD_FROM, FOLD_TO)
+        candidates = Candidate.query.filter(
+            (Candidate.user_id == user_id) | (Candidate.user_id.is_(None)),
+            *[folded.op("~")(f"\\m{term}\\M") for term in terms]
+        ).limit(limit).all()
+        return [(candidate, None, snippet(candidate.cv_text, terms)) for candidate in candidates]
+
+    rows = db.session.execute(
+        text(
+            f"SELECT {FTS_TABLE}.rowid, bm25({FTS_TABLE}) AS rank "
+            f"FROM {FTS_TABLE} JOIN candidate ON candidate.id = {FTS_TABLE}.rowid "
+            f"WHERE {FTS_TABLE} MATCH :match "
+            "AND (candidate.user_id = :user_id OR candidate.user_id IS NULL) "
+            "ORDER BY rank LIMIT :limit"
+        ),
+        {"match": build_match_query(terms), "user_id": user_id, "limit": limit}
+    ).all()
+
+    candidates = {
+        candidate.id: candidate for candidate in Candidate.query.filter(Candidate.id.in_([row[0] for row in rows]))
+    }
+    return [
+        (candidates[candidate_id], -rank, snippet(candidates[candidate_id].cv_text, terms))
+        for candidate_id, rank in rows if candidate_id in candidates
+    ]
+
+
+def fold_with_offsets(value):
+    # Tekst zwinięty znak po znaku z pozycją każdego znaku w oryginale - fragment wyniku
+    # wycinany jest z oryginalnego tekstu CV, a dopasowania szukane w zwiniętym
+    folded = []
+    offsets = []
+    for index, char in enumerate(value):
+        for folded_char in remove_diacritics(char).lower():
+            folded.append(folded_char)
+            offsets.append(index)
+    return "".join(folded), offsets
+
+
+def snippet(cv_text, terms, context=60, length=200):
+    cv_text = cv_text or ""
+    folded, offsets = fold_with_offsets(cv_text)
+    pattern = re.compile(r"\b(?:" + "|".join(re.escape(term) for term in terms) + r")\b")
+    matches = [
+        (offsets[match.start()], offsets[match.end() - 1] + 1)
+        for match in pattern.finditer(folded)
+    ]
+    if not matches:
+        return None
+
+    # Okno wokół pierwszego dopasowania, rozszerzone do granic słów
+    start = max(0, matches[0][0] - context)
+    end = min(len(cv_text), start + length)
+    while start > 0 and not cv_text[start - 1].isspace():
+        start -= 1
+    while end < len(cv_text) and not cv_text[end].isspace():
+        end += 1
+
+    parts = ["… "] if start > 0 else []
+    position = start
+    for match_start, match_end in matches:
+        if match_start < position or match_end > end:
+            continue
+        parts.append(escape(cv_text[position:match_start]))
+        parts.append(Markup("<mark>") + escape(cv_text[match_start:match_end]) + Markup("</mark>"))
+        position = match_end
+    parts.append(escape(cv_text[position:end]))
+    if end < len(cv_text):
+        parts.append(" …")
+    return Markup(" ".join("".join(str(part) for part in parts).split()))
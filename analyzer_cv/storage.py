@@ -0,0 +1,128 @@
+import hashlib
+import mimetypes
+import os
+import tempfile
+import zipfile
+from urllib.parse import quote
+
+from flask import current_app, make_response, send_file
+
+CHUNK_SIZE = 64 * 1024
+ALLOWED_EXTENSIONS = {".pdf", ".docx"}
+
+
+class UploadTooLargeError(Exception):
+    pass
+
+
+def store_upload(stream, filename, upload_folder, max_bytes):
+    # Zapis strumieniowy do pliku tymczasowego, skrót SHA-256 liczony w trakcie odbierania
+    tmp_folder = os.path.join(upload_folder, "tmp")
+    os.makedirs(tmp_folder, exist_ok=True)
+    digest = hashlib.sha256()
+    size = 0
+
+    fd, tmp_path = tempfile.mkstemp(dir=tmp_folder)
+    try:
+        with os.fdopen(fd, "wb") as out:
+            for chunk in iter(lambda: stream.read(CHUNK_SIZE), b""):
+                size += len(chunk)
+                if size > max_bytes:
+                    raise UploadTooLargeError(
+                        f"Plik {filename} przekracza limit {max_bytes // (1024 * 1024)} MB"
+                    )
+                digest.update(chunk)
+                out.write(chunk)
+
+        file_hash = digest.hexdigest()
+        blob_path = blob_path_for(upload_folder, file_hash, filename)
+        if os.path.exists(blob_path):
+            os.remove(tmp_path)
+        else:
+            os.makedirs(os.path.dirname(blob_path), exist_ok=True)
+            os.replace(tmp_path, blob_path)
+        return file_hash, blob_path
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def blob_path_for(upload_folder, file_hash, filename):
+    # Katalogi dzielone po prefiksie skrótu, np. blobs/ab/cd/abcd....pdf
+    extension = os.path.splitext(filename)[1].lower()
+    return os.path.join(
+        upload_folder, "blobs", file_hash[:2], file_hash[2:4], file_hash + extension
+    )
+
+
+def blob_hash(path):
+    # Skrót zawartości z nazwy pliku w blobs/; None dla plików zapisanych przed wprowadzeniem blobów
+    file_hash = os.path.splitext(os.path.basename(path or ""))[0]
+    if len(file_hash) == 64 and os.path.basename(os.path.dirname(path)) == file_hash[2:4]:
+        return file_hash
+    return None
+
+
+def serve_blob(path, as_attachment=False, download_name=None):
+    file_hash = blob_hash(path)
+    is_blob = file_hash is not None
+
+    accel_prefix = current_app.config.get("X_ACCEL_REDIRECT_PREFIX")
+    if accel_prefix:
+        # Przesłanie pliku przez nginx (X-Accel-Redirect), aplikacja zwraca tylko nagłówki
+        relative_path = os.path.relpath(path, current_app.config["UPLOAD_FOLDER"])
+        response = make_response("")
+        response.headers["X-Accel-Redirect"] = accel_prefix.rstrip("/") + "/" + relative_path.replace(os.sep, "/")
+        response.headers["Content-Type"] = mimetypes.guess_type(path)[0] or "application/octet-stream"
+        if is_blob:
+            response.headers["ETag"] = f'"{file_hash}"'
+        if as_attachment:
+            response.headers["Content-Disposition"] = f"attachment; filename*=UTF-8''{quote(download_name or '')}"
+        return response
+
+    # conditional=True obsługuje If-None-Match/If-Modified-Since oraz nagłówek Range
+    response = send_file(
+        path,
+        as_attachment=as_attachment,
+        download_name=download_name,
+        conditional=True,
+        etag=file_hash if is_blob else True,
+        max_age=current_app.config["UPLOAD_CACHE_MAX_AGE"]
+    )
+    response.headers["Accept-Ranges"] = "bytes"
+    # CV zawierają dane osobowe - tylko pamięć podręczna przeglądarki, nie współdzielone proxy
+    response.cache_control.public = False
+    response.cache_control.private = True
+    return response
+
+
+def is_allowed_file(filename):
+    return os.path.splitext(filename)[1].lower() in ALLOWED_EXTENSIONS
+
+
+def iter_bulk_entries(files):
+    # Zwraca (nazwa, strumień, błąd); archiwa ZIP są czytane wpis po wpisie, bez ładowania do pamięci
+    for file in files:
+        filename = os.path.basename(file.filename or "")
+        if not filename:
+            continue
+
+        if filename.lower().endswith(".zip"):
+            try:
+                with zipfile.ZipFile(file.stream) as archive:
+                    for info in archive.infolist():
+                        name = os.path.basename(info.filename)
+                        if info.is_dir() or not name:
+                            continue
+                        if not is_allowed_file(name):
+                            yield name, None, "Nieobsługiwany typ pliku"
+                            continue
+                        with archive.open(info) as entry:
+                            yield name, entry, None
+            except zipfile.BadZipFile:
+                yield filename, None, "Uszkodzone archiwum ZIP"
+        elif is_allowed_file(filename):
+            yield filename, file.stream, None
+        else:
+            yield filename, None, "Nieobsługiwany typ pliku"
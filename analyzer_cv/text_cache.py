@@ -0,0 +1,72 @@
+import hashlib
+import json
+from datetime import datetime
+
+from sqlalchemy import func
+from sqlalchemy.exc import IntegrityError
+
+# Ustawienia, od których zależy wyodrębniony tekst (profile OCR zawierają też język)
+KEY_SETTINGS = ("OCR_MIN_TEXT_CHARS", "OCR_PROFILES", "OCR_MAX_PAGES", "OCR_ENGINE", "OCR_RASTERIZER")
+
+
+def text_cache_key(file_hash, config):
+    # Skrót pliku razem z ustawieniami - po zmianie profili, języka czy rasteryzatora tekst liczony od nowa,
+    # a stare wpisy wypadają z pamięci podręcznej jako najdawniej używane
+    settings = json.dumps({name: config[name] for name in KEY_SETTINGS}, sort_keys=True)
+    return hashlib.sha256(f"{file_hash}:{settings}".encode("utf-8")).hexdigest()
+
+
+def get_cached_text(cache_key):
+    from app import db
+    from models import TextCache
+
+    entry = db.session.get(TextCache, cache_key)
+    if entry is None:
+        return None
+
+    entry.last_used_at = datetime.utcnow()
+    db.session.commit()
+    return entry.text, entry.page_methods.split(",") if entry.page_methods else []
+
+
+def store_cached_text(cache_key, text, page_methods, max_bytes):
+    from app import db
+    from models import TextCache
+
+    entry = TextCache(
+        file_hash=cache_key,
+        text=text,
+        page_methods=",".join(page_methods),
+        size=len(text.encode("utf-8")),
+        last_used_at=datetime.utcnow()
+    )
+    db.session.add(entry)
+    try:
+        db.session.commit()
+    except IntegrityError:
+        # Ten sam plik przetworzony równolegle przez inny proces
+        db.session.rollback()
+        return
+
+    evict_cached_text(max_bytes)
+
+
+def evict_cached_text(max_bytes):
+    from app import db
+    from models import TextCache
+
+    total = db.session.query(func.coalesce(func.sum(TextCache.size), 0)).scalar()
+    if total <= max_bytes:
+        return
+
+    # Usuwanie najdawniej używanych wpisów (LRU), aż rozmiar zmieści się w limicie
+    evicted = []
+    query = db.session.query(TextCache.file_hash, TextCache.size).order_by(TextCache.last_used_at)
+    for file_hash, size in query:
+        evicted.append(file_hash)
+        total -= size
+        if total <= max_bytes:
+            break
+
+    TextCache.query.filter(TextCache.file_hash.in_(evicted)).delete(synchronize_session=False)
+    db.session.commit()
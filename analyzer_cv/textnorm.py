@@ -0,0 +1,88 @@
+import re
+import unicodedata
+from functools import lru_cache
+from itertools import islice
+
+IGNORE_KEYWORDS = (
+    "LANGUAGES", "SKILLS", "EDUCATION", "REFERENCES", "CONTACT", "PROFILE",
+    "O MNIE", "ABOUT ME", "KONTAKT", "ADRES", "CERTYFIKATY", "CERTIFICATES",
+    "JĘZYKI", "JEZYKI", "EDUKACJA", "DOŚWIADCZENIE", "EXPERIENCE",
+    "UMIEJĘTNOŚCI", "UMIEJETNOSCI", "UNIVERSITY", "COLLEGE", "INSTITUTE", "SZKOLA", "UNIWERSYTET", "LICEUM", "TECHNIKUM"
+)
+
+NON_NAME_CHARS = re.compile(r"[^A-Z\s]+")
+NAME_LINE = re.compile(r"([A-Z]{2,})\s+([A-Z]{2,})$")
+
+# Lookbehind: dopasowanie zaczyna się tylko na początku ciągu znaków adresu,
+# więc każdy ciąg jest przeglądany raz, a nie od każdej pozycji w nim
+EMAIL = re.compile(r"(?<![a-zA-Z0-9._%+-])[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}")
+
+# Telefon szukany tylko w ciągach cyfr i separatorów, od razu odrzucając krótsze niż 9 znaków
+PHONE = re.compile(r"(?:\+?\d{1,3}[ -]?)?(?:\(?\d{1,4}\)?[ -]?)?\d{3,4}[ -]?\d{3,4}[ -]?\d{3,4}")
+PHONE_RUN = re.compile(r"[\d+(][\d +()-]{8,}")
+
+
+class FoldTable(dict):
+    # Tabela dla str.translate uzupełniana leniwie: znak -> znak bez diakrytyków (NFD bez Mn)
+
+    def __missing__(self, code):
+        folded = ''.join(
+            c for c in unicodedata.normalize('NFD', chr(code))
+            if unicodedata.category(c) != 'Mn'
+        )
+        self[code] = folded
+        return folded
+
+
+FOLD_TABLE = FoldTable()
+
+
+def remove_diacritics(text):
+    if text.isascii():
+        return text
+    return text.translate(FOLD_TABLE)
+
+
+@lru_cache(maxsize=32)
+def normalize_text(text):
+    # Jedno zwinięcie na tekst CV - korzystają z niego ekstraktory, punktacja i indeks wyszukiwania
+    folded = remove_diacritics(text)
+    return folded, folded.lower()
+
+
+def extract_email_from_cv_text(text):
+    if "@" not in text:
+        return None
+    match = EMAIL.search(text)
+    return match.group(0) if match else None
+
+
+def extract_phone_from_cv_text(text):
+    for run in PHONE_RUN.finditer(text):
+        match = PHONE.search(run.group(0))
+        if match:
+            return match.group(0)
+    return None
+
+
+def extract_name_from_cv_text(text, max_lines=60):
+    folded, _ = normalize_text(text)
+    stripped = (line.strip() for line in folded.split("\n"))
+    lines = list(islice((line for line in stripped if line), max_lines + 1))
+
+    for i, line in enumerate(lines[:max_lines]):
+        if any(keyword in line for keyword in IGNORE_KEYWORDS):
+            continue
+
+        cleaned_line = NON_NAME_CHARS.sub("", line).strip()
+
+        match = NAME_LINE.match(cleaned_line)
+        if match:
+            return f"{match.group(1)} {match.group(2)}"
+
+        if i + 1 < len(lines) and line.isupper():
+            cleaned_next_line = NON_NAME_CHARS.sub("", lines[i + 1]).strip()
+            if cleaned_next_line.isupper():
+                return f"{line} {lines[i + 1]}"
+
+    return "Nierozpoznane"
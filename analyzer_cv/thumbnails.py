@@ -0,0 +1,51 @@
+import os
+import tempfile
+
+from PIL import Image
+
+from rasterizers import get_rasterizer
+
+
+def thumbnail_path(file_path, page_number, fmt):
+    # Miniatury zapisywane obok przesłanego pliku, np. <skrót>.p1.webp
+    base = os.path.splitext(file_path)[0]
+    return f"{base}.p{page_number}.{fmt.lower()}"
+
+
+def save_thumbnail(image, path, width, fmt):
+    thumbnail = image.convert("RGB")
+    thumbnail.thumbnail((width, width * 2))
+    tmp_path = path + ".tmp"
+    thumbnail.save(tmp_path, format=fmt, quality=70)
+    os.replace(tmp_path, path)
+
+
+def render_thumbnails(file_path, page_numbers, options):
+    # Strony z warstwą tekstową nie są rasteryzowane do OCR - renderowanie w niskiej rozdzielczości
+    # tym samym rasteryzatorem co OCR (OCR_RASTERIZER), więc działa też bez pdftoppm
+    page_numbers = [
+        number for number in page_numbers
+        if number <= options["max_pages"]
+        and not os.path.exists(thumbnail_path(file_path, number, options["format"]))
+    ]
+    if not page_numbers:
+        return
+    rasterizer = get_rasterizer(options.get("rasterizer", "auto"))
+    profile = {"dpi": options["dpi"], "grayscale": False}
+    with tempfile.TemporaryDirectory(prefix="analyzer-thumb-") as work_dir:
+        for number in page_numbers:
+            page = rasterizer.render(file_path, number, profile, work_dir, f"thumb-{number}")
+            if page is None:
+                continue
+            try:
+                image = Image.open(page) if isinstance(page, str) else page
+                try:
+                    save_thumbnail(
+                        image, thumbnail_path(file_path, number, options["format"]),
+                        options["width"], options["format"]
+                    )
+                finally:
+                    if image is not page:
+                        image.close()
+            finally:
+                rasterizer.release(page)
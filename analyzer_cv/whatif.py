@@ -0,0 +1,153 @@
+import time
+from threading import Lock
+
+import numpy as np
+from scipy.sparse import csr_matrix
+from sqlalchemy import func, select
+
+_matrices = {}
+_matrices_lock = Lock()
+
+
+class PositionMatrix:
+    # Macierz rzadka kandydat x słowo kluczowe z liczbą wystąpień, jedna na stanowisko
+
+    def __init__(self, fingerprint, keywords, candidates, hits):
+        self.fingerprint = fingerprint
+        self.checked_at = time.monotonic()
+        self.keyword_ids = [keyword_id for keyword_id, _, _ in keywords]
+        self.keyword_words = {keyword_id: word for keyword_id, word, _ in keywords}
+        self.default_weights = np.array([weight for _, _, weight in keywords], dtype=np.float64)
+        self.candidate_ids = np.array([row[0] for row in candidates], dtype=np.int64)
+        self.user_ids = np.array([-1 if row[1] is None else row[1] for row in candidates], dtype=np.int64)
+        self.names = [row[2] for row in candidates]
+        self.first_words = [row[3] for row in candidates]
+
+        # Identyfikatory są posortowane, więc indeksy wierszy i kolumn wyznacza searchsorted
+        hits = np.fromiter(
+            (value for row in hits for value in row), dtype=np.int64, count=3 * len(hits)
+        ).reshape(-1, 3)
+        keyword_ids = np.array(self.keyword_ids, dtype=np.int64)
+        rows = np.searchsorted(self.candidate_ids, hits[:, 0])
+        cols = np.searchsorted(keyword_ids, hits[:, 1])
+        valid = (
+            (rows < len(self.candidate_ids)) & (cols < len(keyword_ids))
+        )
+        valid[valid] &= (self.candidate_ids[rows[valid]] == hits[valid, 0]) & (keyword_ids[cols[valid]] == hits[valid, 1])
+
+        self.matrix = csr_matrix(
+            (hits[valid, 2].astype(np.float64), (rows[valid], cols[valid])),
+            shape=(len(self.candidate_ids), len(keyword_ids))
+        )
+
+    def weight_vector(self, weights):
+        vector = self.default_weights.copy()
+        positions = {keyword_id: index for index, keyword_id in enumerate(self.keyword_ids)}
+        words = {word.lower(): keyword_id for keyword_id, word in self.keyword_words.items()}
+        for key, weight in weights.items():
+            keyword_id = int(key) if str(key).isdigit() else words.get(str(key).lower())
+            if keyword_id in positions:
+                vector[positions[keyword_id]] = float(weight)
+        return vector
+
+    def top_k(self, weights, user_id, limit):
+        scores = self.matrix @ self.weight_vector(weights)
+        visible = np.flatnonzero((self.user_ids == user_id) | (self.user_ids == -1))
+        if not len(visible):
+            return []
+
+        visible_scores = scores[visible]
+        limit = min(limit, len(visible))
+        top = np.argpartition(-visible_scores, limit - 1)[:limit]
+        top = top[np.argsort(-visible_scores[top], kind="stable")]
+        return [
+            {
+                "candidate_id": int(self.candidate_ids[visible[index]]),
+                "name": self.names[visible[index]],
+                "first_words": self.first_words[visible[index]],
+                "points": float(visible_scores[index])
+            }
+            for index in top
+        ]
+
+
+def position_fingerprint(position_id):
+    from app import db
+    from models import BackfillJob, Candidate, CandidateScore, Keyword
+
+    # Z wagami - zmiana wag w innym procesie gunicorna też unieważnia macierz
+    keywords = tuple(
+        db.session.query(Keyword.id, Keyword.word, Keyword.weight)
+        .filter(Keyword.position_id == position_id)
+        .order_by(Keyword.id)
+    )
+    candidates = db.session.query(Candidate.id).filter(Candidate.position_id == position_id).union(
+        db.session.query(CandidateScore.candidate_id).filter(CandidateScore.position_id == position_id)
+    ).subquery()
+    count, max_id = db.session.query(func.count(), func.max(candidates.c[0])).one()
+    # Backfill przepisuje trafienia bez zmiany słów i kandydatów - jego postęp wersjonuje punkty
+    backfill = db.session.query(BackfillJob.id, BackfillJob.status, BackfillJob.processed).filter(
+        BackfillJob.position_id == position_id
+    ).order_by(BackfillJob.created_at.desc()).first()
+    return keywords, count, max_id, tuple(backfill or ())
+
+
+def get_position_matrix(position_id, refresh_seconds):
+    # Aktualność macierzy sprawdzana w bazie najwyżej raz na refresh_seconds
+    with _matrices_lock:
+        cached = _matrices.get(position_id)
+    if cached and time.monotonic() - cached.checked_at < refresh_seconds:
+        return cached
+
+    fingerprint = position_fingerprint(position_id)
+    if cached and cached.fingerprint == fingerprint:
+        cached.checked_at = time.monotonic()
+        return cached
+
+    matrix = build_position_matrix(position_id, fingerprint)
+    with _matrices_lock:
+        _matrices[position_id] = matrix
+    return matrix
+
+
+def build_position_matrix(position_id, fingerprint):
+    from app import db
+    from models import Candidate, CandidateScore, Keyword, KeywordHit
+    from rescoring import index_keyword_hits
+
+    keywords = db.session.query(Keyword.id, Keyword.word, Keyword.weight).filter(
+        Keyword.position_id == position_id
+    ).order_by(Keyword.id).all()
+
+    scored_ids = db.session.query(CandidateScore.candidate_id).filter(CandidateScore.position_id == position_id)
+    candidates = db.session.query(
+        Candidate.id, Candidate.user_id, Candidate.name, Candidate.first_words, Candidate.hits_indexed,
+        Candidate.position_id
+    ).filter((Candidate.position_id == position_id) | Candidate.id.in_(scored_ids)).order_by(Candidate.id).all()
+
+    # Kandydaci bez zapisanych trafień - jednorazowe skanowanie cv_text. hits_indexed dotyczy stanowiska,
+    # na które kandydat aplikował (jak w save_backfill_chunk), więc tylko jego kandydaci
+    unindexed_ids = [row[0] for row in candidates if not row[4] and row[5] == position_id]
+    if unindexed_ids:
+        index_keyword_hits(unindexed_ids, Keyword.query.filter_by(position_id=position_id).all())
+        Candidate.query.filter(Candidate.id.in_(unindexed_ids)).update(
+            {"hits_indexed": True}, synchronize_session=False
+        )
+        db.session.commit()
+
+    # Trafień bywa kilkaset tysięcy - surowe krotki z kursora, bez warstwy ORM
+    hits = db.session.execute(
+        select(KeywordHit.candidate_id, KeywordHit.keyword_id, KeywordHit.count)
+        .join(Keyword, Keyword.id == KeywordHit.keyword_id)
+        .where(Keyword.position_id == position_id)
+    ).tuples().all()
+
+    return PositionMatrix(fingerprint, keywords, candidates, hits)
+
+
+def invalidate_position_matrix(position_id=None):
+    with _matrices_lock:
+        if position_id is None:
+            _matrices.clear()
+        else:
+            _matrices.pop(position_id, None)